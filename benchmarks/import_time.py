@@ -0,0 +1,67 @@
+"""Measures how long ``import seqrecord_expanded`` takes in a fresh interpreter.
+
+Biopython, degenerate_dna and NumPy should only be imported when they are
+first needed, so they are reported if importing the package loads them.
+From the root of the repository::
+
+    python benchmarks/import_time.py --max-seconds 0.1
+
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+
+HEAVY_MODULES = ('Bio', 'degenerate_dna', 'numpy', 'sqlite3')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds,
+                  'loaded': [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def measure_import(module='seqrecord_expanded', repeat=5):
+    """Imports ``module`` in ``repeat`` new interpreters.
+
+    Returns:
+        (dict): ``{'seconds': 0.02, 'loaded': []}`` with the fastest import and
+        the heavy modules it loaded.
+
+    """
+    script = _SCRIPT.format(root=ROOT, module=module, heavy=HEAVY_MODULES)
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', script])
+        runs.append(json.loads(output.decode('utf-8')))
+    return {'seconds': min(run['seconds'] for run in runs), 'loaded': runs[0]['loaded']}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--module', default='seqrecord_expanded')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-seconds', type=float,
+                        help='Fail if the import is slower or loads heavy modules.')
+    args = parser.parse_args(argv)
+
+    result = measure_import(args.module, args.repeat)
+    print('import {0}: {1:.4f} s, loaded: {2}'.format(
+        args.module, result['seconds'], ', '.join(result['loaded']) or 'none'))
+    if args.max_seconds is not None and (result['seconds'] > args.max_seconds or result['loaded']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
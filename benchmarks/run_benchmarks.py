@@ -0,0 +1,226 @@
+"""Benchmarks for the hot paths of SeqRecordExpanded.
+
+Times importing the package, record construction, codon positions,
+degeneration and translation on synthetic alignments and reports throughput
+and peak memory. Results are saved as JSON so that releases can be
+compared. Needs Python 3.4 or later. From the root of the repository::
+
+    PYTHONPATH=. python benchmarks/run_benchmarks.py --preset quick --output 0.3.0.json
+    PYTHONPATH=. python benchmarks/run_benchmarks.py --compare 0.2.10.json 0.3.0.json
+
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+
+import seqrecord_expanded
+from seqrecord_expanded import SeqRecordExpanded
+
+from benchmarks.import_time import measure_import
+
+
+PRESETS = {
+    'quick': {'gene_lengths': [1000], 'taxa': [100, 1000]},
+    'full': {'gene_lengths': [1000, 5000, 20000], 'taxa': [100, 1000, 10000, 100000]},
+}
+
+# Cells above this size are skipped unless --max-bases is raised.
+DEFAULT_MAX_BASES = 2 * 10 ** 8
+
+OPERATIONS = [
+    ('construction', None),
+    ('first_codon_position', lambda record: record.first_codon_position()),
+    ('second_codon_position', lambda record: record.second_codon_position()),
+    ('third_codon_position', lambda record: record.third_codon_position()),
+    ('first_and_second_codon_positions', lambda record: record.first_and_second_codon_positions()),
+    ('degenerate_normal', lambda record: record.degenerate()),
+    ('degenerate_S', lambda record: record.degenerate(method='S')),
+    ('degenerate_Z', lambda record: record.degenerate(method='Z')),
+    ('degenerate_SZ', lambda record: record.degenerate(method='SZ')),
+    ('translate_table_1', lambda record: record.translate(table=1)),
+    ('translate_table_2', lambda record: record.translate(table=2)),
+    ('translate_table_5', lambda record: record.translate(table=5)),
+]
+
+
+def synthetic_alignment(gene_length, taxa, seed=420):
+    """Random sequences with about 1% missing data, gaps and ambiguities.
+
+    Returns:
+        (list): ``taxa`` strings of ``gene_length`` bases.
+
+    """
+    rng = np.random.RandomState(seed)
+    alphabet = np.frombuffer(b'ACGT' * 24 + b'?-RN', dtype=np.uint8)
+    out = []
+    for _ in range(taxa):
+        row = alphabet[rng.randint(0, len(alphabet), gene_length)]
+        out.append(row.tobytes().decode('ascii'))
+    return out
+
+
+def _records(seqs):
+    # reading frame 2 so the in-frame trimming is part of what gets timed
+    return [SeqRecordExpanded(seq, voucher_code='CP{0}'.format(index), gene_code='COI',
+                              reading_frame=2, table=1,
+                              taxonomy={'genus': 'Melitaea', 'species': 'phoebe'})
+            for index, seq in enumerate(seqs)]
+
+
+def _measure(setup, function):
+    """Times ``function`` and then measures its peak memory in a second run,
+    as tracing allocations slows everything down.
+
+    """
+    argument = setup()
+    start = time.perf_counter()
+    function(argument)
+    seconds = time.perf_counter() - start
+
+    argument = setup()
+    tracemalloc.start()
+    function(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def run_cell(gene_length, taxa, operations=None):
+    """Runs the benchmarks for one alignment size.
+
+    Returns:
+        (list): one dictionary per operation.
+
+    """
+    seqs = synthetic_alignment(gene_length, taxa)
+    results = []
+    for name, operation in OPERATIONS:
+        if operations and name not in operations:
+            continue
+        if operation is None:
+            seconds, peak = _measure(lambda: seqs, _records)
+        else:
+            # fresh records, so per-record caches do not hide the work
+            seconds, peak = _measure(lambda: _records(seqs),
+                                     lambda records: [operation(record) for record in records])
+        results.append({
+            'operation': name,
+            'gene_length': gene_length,
+            'taxa': taxa,
+            'seconds': seconds,
+            'records_per_second': taxa / seconds if seconds else None,
+            'bases_per_second': taxa * gene_length / seconds if seconds else None,
+            'peak_memory_bytes': peak,
+        })
+    return results
+
+
+def run(gene_lengths, taxa, max_bases=DEFAULT_MAX_BASES, operations=None, verbose=True):
+    """Runs every operation for every combination of gene length and taxa.
+
+    Returns:
+        (dict): ready to be saved as JSON.
+
+    """
+    results = []
+    if not operations or 'import' in operations:
+        imported = measure_import()
+        if verbose:
+            print('{0:34} {1:>41.4f} s'.format('import', imported['seconds']), file=sys.stderr)
+        results.append({'operation': 'import', 'gene_length': 0, 'taxa': 0,
+                        'seconds': imported['seconds'], 'loaded': imported['loaded']})
+    for gene_length in gene_lengths:
+        for count in taxa:
+            if gene_length * count > max_bases:
+                if verbose:
+                    print('skipping {0} bp x {1} taxa'.format(gene_length, count), file=sys.stderr)
+                continue
+            with warnings.catch_warnings():
+                # partial and ambiguous codons warn on every record
+                warnings.simplefilter('ignore')
+                cell = run_cell(gene_length, count, operations)
+            for result in cell:
+                if verbose:
+                    print('{operation:34} {gene_length:>6} bp {taxa:>7} taxa {seconds:9.4f} s '
+                          '{bases_per_second:14.0f} bp/s {peak_memory_bytes:>12} B'.format(**result),
+                          file=sys.stderr)
+                results.append(result)
+    return {
+        'version': seqrecord_expanded.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def compare(old, new, threshold=0.1):
+    """Compares two saved runs.
+
+    Returns:
+        (list): ``(operation, gene_length, taxa, old_seconds, new_seconds, ratio)``
+        for operations present in both runs that got slower by more than
+        ``threshold``.
+
+    """
+    def key(result):
+        return result['operation'], result['gene_length'], result['taxa']
+
+    previous = dict((key(result), result) for result in old['results'])
+    regressions = []
+    for result in new['results']:
+        before = previous.get(key(result))
+        if before is None or not before['seconds']:
+            continue
+        ratio = result['seconds'] / before['seconds']
+        if ratio > 1 + threshold:
+            regressions.append(key(result) + (before['seconds'], result['seconds'], ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--preset', choices=sorted(PRESETS), default='quick')
+    parser.add_argument('--gene-lengths', type=int, nargs='+')
+    parser.add_argument('--taxa', type=int, nargs='+')
+    parser.add_argument('--max-bases', type=int, default=DEFAULT_MAX_BASES)
+    parser.add_argument('--operations', nargs='+',
+                        choices=['import'] + [name for name, _ in OPERATIONS])
+    parser.add_argument('--output', help='JSON file to save the results to.')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+                        help='Report operations of NEW that are slower than in OLD.')
+    parser.add_argument('--threshold', type=float, default=0.1)
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0]) as handle:
+            old = json.load(handle)
+        with open(args.compare[1]) as handle:
+            new = json.load(handle)
+        regressions = compare(old, new, args.threshold)
+        for operation, gene_length, taxa, before, after, ratio in regressions:
+            print('{0} {1} bp x {2} taxa: {3:.4f} s -> {4:.4f} s ({5:.2f}x)'.format(
+                operation, gene_length, taxa, before, after, ratio))
+        return 1 if regressions else 0
+
+    preset = PRESETS[args.preset]
+    report = run(args.gene_lengths or preset['gene_lengths'], args.taxa or preset['taxa'],
+                 max_bases=args.max_bases, operations=args.operations)
+    if args.output:
+        with open(args.output, 'w') as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
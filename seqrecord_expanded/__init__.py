@@ -3,7 +3,7 @@
 seqrecord-expanded - Biopython's SeqRecord class, but expanded with additional methods:
 degenerate seqs, codon positions based on reading frames, etc.
 """
-from .seqrecord import SeqRecordExpanded
+from .seqrecord import SeqRecordExpanded, CompactSeqRecordExpanded
 
 
 __version__ = '0.2.10'
@@ -0,0 +1,147 @@
+import asyncio
+
+from Bio.Data.CodonTable import TranslationError
+
+from .degeneration import degenerate
+from .exceptions import TranslationErrorMixedGappedSeq
+from .translation import translate
+
+
+# Bases handed to the executor at a time. A multiple of three so that every
+# chunk but the last one holds whole codons.
+CHUNK_SIZE = 3 * (1 << 16)
+
+# Records processed at the same time by ``gather_records``.
+DEFAULT_LIMIT = 8
+
+
+async def _run_chunked(function, seq, args, executor, chunk_size):
+    """Runs ``function(chunk, *args)`` in ``executor`` for each chunk of
+    ``seq`` and joins the results, giving other tasks a turn in between.
+
+    """
+    if chunk_size < 3 or chunk_size % 3:
+        raise ValueError('chunk_size should be a positive multiple of 3.')
+    loop = asyncio.get_running_loop()
+    out = []
+    for start in range(0, max(len(seq), 1), chunk_size):
+        out.append(await loop.run_in_executor(executor, function,
+                                              seq[start:start + chunk_size], *args))
+        await asyncio.sleep(0)
+    return ''.join(out)
+
+
+async def _persisted(seq_record, operation, function, seq, args, executor, chunk_size):
+    """Same as ``seq_record._persisted``, running ``function`` with
+    ``_run_chunked`` when the result is not in the cache set with
+    ``use_result_cache``.
+
+    """
+    result_cache, key = seq_record._result_cache_key(operation)
+    if result_cache is not None:
+        result = result_cache.get(key)
+        if result is not None:
+            return result
+    result = await _run_chunked(function, seq, args, executor, chunk_size)
+    if result_cache is not None:
+        result_cache[key] = result
+    return result
+
+
+async def degenerate_async(seq_record, method=None, executor=None, chunk_size=CHUNK_SIZE):
+    """Same as ``seq_record.degenerate()`` without blocking the event loop.
+
+    Codons are degenerated independently, so the sequence is sent to the
+    executor in chunks of whole codons and one long sequence does not hold
+    the executor while other requests wait. The result is kept in the
+    record and in the cache set with ``use_result_cache``, as
+    ``degenerate()`` does.
+
+    Parameters:
+        seq_record:         SeqRecordExpanded or CompactSeqRecordExpanded.
+        method (str):       S, Z, SZ, normal
+        executor:           Optional. ``concurrent.futures`` executor. Defaults
+                            to the default executor of the event loop.
+        chunk_size (int):   Bases per chunk, a multiple of 3.
+
+    Returns:
+        (str): Degenerated sequence.
+
+    """
+    seq = seq_record._translation_sequence()
+    table, method = seq_record._degeneration_parameters(method)
+    key = ('degenerate', table, method)
+    if seq_record._cache is None or key not in seq_record._cache:
+        result = await _persisted(seq_record, key, degenerate, seq, (table, method),
+                                  executor, chunk_size)
+        seq_record._cached(key, lambda: result)
+    return seq_record._cache[key]
+
+
+async def translate_async(seq_record, table=None, executor=None, chunk_size=CHUNK_SIZE):
+    """Same as ``seq_record.translate()`` without blocking the event loop.
+    The result is looked up and stored in the cache set with
+    ``use_result_cache``, as ``translate()`` does.
+
+    Parameters:
+        seq_record:         SeqRecordExpanded or CompactSeqRecordExpanded.
+        table (int):        Optional. Defaults to the table of the record.
+        executor:           Optional. ``concurrent.futures`` executor. Defaults
+                            to the default executor of the event loop.
+        chunk_size (int):   Bases per chunk, a multiple of 3.
+
+    Returns:
+        (str): Aminoacid sequence.
+
+    """
+    if not table:
+        table = seq_record.table
+
+    seq_record._check_reading_frame()
+    seq_record._check_translation_table(table)
+    seq = seq_record._translation_sequence()
+
+    try:
+        return await _persisted(seq_record, ('translate', table), translate, seq, (table,),
+                                executor, chunk_size)
+    except TranslationError as e:
+        raise TranslationErrorMixedGappedSeq(seq_record.voucher_code, seq_record.gene_code, e)
+
+
+OPERATIONS = {
+    'degenerate': degenerate_async,
+    'translate': translate_async,
+}
+
+
+async def gather_records(seq_records, operation='translate', limit=DEFAULT_LIMIT,
+                         executor=None, return_exceptions=False, **kwargs):
+    """Degenerates or translates many records, at most ``limit`` at a time.
+
+    Parameters:
+        seq_records (iterable):   SeqRecordExpanded or CompactSeqRecordExpanded instances.
+        operation (str):          degenerate or translate.
+        limit (int):              Records processed at the same time.
+        executor:                 Optional. ``concurrent.futures`` executor.
+        return_exceptions (bool): Return exceptions such as
+                                  ``TranslationErrorMixedGappedSeq`` in place of
+                                  the result of a record instead of raising
+                                  the first one, as ``asyncio.gather`` does.
+        kwargs:                   ``method``, ``table`` or ``chunk_size``, passed
+                                  to ``degenerate_async`` or ``translate_async``.
+
+    Returns:
+        (list): results in the same order as ``seq_records``.
+
+    """
+    if operation not in OPERATIONS:
+        raise ValueError('operation should be one of {0}.'.format(', '.join(sorted(OPERATIONS))))
+    function = OPERATIONS[operation]
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(seq_record):
+        async with semaphore:
+            return await function(seq_record, executor=executor, **kwargs)
+
+    return await asyncio.gather(*[run(seq_record) for seq_record in seq_records],
+                                return_exceptions=return_exceptions)
@@ -0,0 +1,395 @@
+import warnings
+
+import numpy as np
+
+from Bio.Data.CodonTable import TranslationError
+
+from .codons import codon_columns, codon_position_offset, TRANSLATION_OFFSETS
+from .degeneration import degenerate
+from .exceptions import MissingParameterError, TranslationErrorMixedGappedSeq
+from .stats import count_symbols, reading_frame_shift, SequenceStats
+from .translation import get_codon_table
+from ._warnings import SeqRecordExpandedWarning
+
+
+# Maximum number of cells gathered at once when building matrices, so the
+# temporary index arrays stay small regardless of the size of the batch.
+_GATHER_CHUNK = 1 << 22
+
+# Byte lookup table that turns gaps into missing data, as SeqRecordExpanded does.
+_GAPS_AS_MISSING = np.arange(256, dtype=np.uint8)
+_GAPS_AS_MISSING[ord('-')] = ord('?')
+
+
+class SeqRecordBatch(object):
+    """Holds many SeqRecordExpanded records in one NumPy byte array.
+
+    All sequences are concatenated into a single ``numpy.uint8`` buffer so
+    that codon positions can be extracted for every record in one pass.
+
+    Parameters:
+        records (iterable):  SeqRecordExpanded or CompactSeqRecordExpanded instances.
+
+    Attributes:
+        buffer:           ``numpy.uint8`` array with all sequences, see ``from_buffer``.
+        offsets:          ``numpy.int64`` array, start of each sequence in ``buffer``.
+        lengths:          ``numpy.int64`` array, length of each sequence.
+        voucher_codes:    List.
+        gene_codes:       List.
+        reading_frames:   List of 1, 2, 3 or None.
+        tables:           List of NCBI codes for translation tables.
+        taxonomies:       List of taxonomy dictionaries.
+        lineages:         List.
+        accession_numbers: List.
+
+    """
+    def __init__(self, records=None):
+        records = list(records or [])
+        sequences = [record._sequence_string().encode('ascii') for record in records]
+        lengths = np.array([len(i) for i in sequences], dtype=np.int64)
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64) \
+            if len(records) else np.zeros(0, dtype=np.int64)
+
+        self._set_columns(
+            np.frombuffer(b''.join(sequences), dtype=np.uint8), offsets, lengths,
+            voucher_codes=[record.voucher_code for record in records],
+            gene_codes=[record.gene_code for record in records],
+            reading_frames=[record.reading_frame for record in records],
+            tables=[record.table for record in records],
+            taxonomies=[record.taxonomy for record in records],
+            lineages=[record.lineage for record in records],
+            accession_numbers=[record.accession_number for record in records],
+        )
+
+    @classmethod
+    def from_buffer(cls, buffer, offsets, lengths, voucher_codes=None, gene_codes=None,
+                    reading_frames=None, tables=None, taxonomies=None, lineages=None,
+                    accession_numbers=None):
+        """Creates a batch whose records are views into an existing buffer.
+
+        The buffer is not copied, so it can be a ``mmap.mmap`` of a large
+        alignment file. Gaps ``-`` in the buffer are read as ``?``.
+
+        Parameters:
+            buffer:                 bytes, bytearray, mmap or any object
+                                    supporting the buffer protocol.
+            offsets (list):         start of each sequence in ``buffer``.
+            lengths (list):         length of each sequence.
+            voucher_codes (list):   Optional.
+            gene_codes (list):      Optional.
+            reading_frames (list):  Optional.
+            tables (list):          Optional.
+            taxonomies (list):      Optional.
+            lineages (list):        Optional.
+            accession_numbers (list):  Optional.
+
+        Returns:
+            (SeqRecordBatch)
+
+        """
+        batch = cls.__new__(cls)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        count = len(offsets)
+        batch._set_columns(
+            np.frombuffer(buffer, dtype=np.uint8), offsets, np.asarray(lengths, dtype=np.int64),
+            voucher_codes=list(voucher_codes) if voucher_codes is not None else [None] * count,
+            gene_codes=list(gene_codes) if gene_codes is not None else [None] * count,
+            reading_frames=list(reading_frames) if reading_frames is not None else [None] * count,
+            tables=list(tables) if tables is not None else [None] * count,
+            taxonomies=list(taxonomies) if taxonomies is not None else [dict() for _ in offsets],
+            lineages=list(lineages) if lineages is not None else [None] * count,
+            accession_numbers=list(accession_numbers) if accession_numbers is not None
+            else [None] * count,
+        )
+        batch._source = buffer
+        return batch
+
+    def _set_columns(self, buffer, offsets, lengths, voucher_codes, gene_codes,
+                     reading_frames, tables, taxonomies, lineages, accession_numbers):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.lengths = lengths
+        self.voucher_codes = voucher_codes
+        self.gene_codes = gene_codes
+        self.reading_frames = reading_frames
+        self.tables = tables
+        self.taxonomies = taxonomies
+        self.lineages = lineages
+        self.accession_numbers = accession_numbers
+        self._stats = None
+        self._source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def close(self):
+        """Releases the buffer given to ``from_buffer``, unmapping it if it is
+        a ``mmap.mmap``. The batch is empty afterwards.
+
+        Raises:
+            BufferError:  if arrays taken from the buffer, such as windows,
+                          are still in use.
+
+        """
+        source = self._source
+        self._set_columns(np.zeros(0, dtype=np.uint8), np.zeros(0, dtype=np.int64),
+                          np.zeros(0, dtype=np.int64), [], [], [], [], [], [], [])
+        if hasattr(source, 'close'):
+            source.close()
+
+    def sequence(self, index):
+        """
+        :return: string with the sequence of the record at ``index``.
+
+        """
+        start = self.offsets[index]
+        return _decode(self.buffer[start:start + self.lengths[index]])
+
+    def _in_frame_bounds(self):
+        """Start and length of the in-frame part of each sequence.
+
+        Raises:
+            ValueError:             if any reading frame is not 1, 2, 3 or None.
+            MissingParameterError:  if any reading frame is None.
+
+        """
+        shifts = np.array([codon_position_offset(reading_frame, gene_code)
+                           for reading_frame, gene_code in zip(self.reading_frames, self.gene_codes)],
+                          dtype=np.int64)
+        starts = self.offsets + shifts
+        lengths = np.maximum(self.lengths - shifts, 0)
+        return starts, lengths
+
+    def codon_positions_matrix(self, positions='123', fill='?'):
+        """Extracts a codon position subset for all records in one pass.
+
+        Parameters:
+            positions (str):  any combination of "1", "2" and "3".
+            fill (str):       character used to pad records shorter than the
+                              longest one.
+
+        Returns:
+            (numpy.ndarray): ``uint8`` matrix with one row per record.
+
+        """
+        columns = np.array(codon_columns(positions), dtype=np.int64)
+        starts, lengths = self._in_frame_bounds()
+        width = int(lengths.max()) if len(self) else 0
+        index = np.flatnonzero(np.isin(np.arange(width) % 3, columns))
+
+        out = np.full((len(self), len(index)), ord(fill), dtype=np.uint8)
+        step = max(1, _GATHER_CHUNK // max(1, len(index)))
+        for first in range(0, len(self), step):
+            rows = slice(first, first + step)
+            valid = index[None, :] < lengths[rows, None]
+            cells = starts[rows, None] + index[None, :]
+            out[rows][valid] = self.buffer[cells[valid]]
+        return _GAPS_AS_MISSING[out]
+
+    def codon_positions(self, positions='123'):
+        """
+        Parameters:
+            positions (str):  any combination of "1", "2" and "3".
+
+        Returns:
+            (list): one string per record with the requested codon positions.
+
+        """
+        columns = np.array(codon_columns(positions), dtype=np.int64)
+        matrix = self.codon_positions_matrix(positions)
+        _, lengths = self._in_frame_bounds()
+        full_codons, remainder = np.divmod(lengths, 3)
+        counts = full_codons * len(columns) + (remainder[:, None] > columns[None, :]).sum(axis=1)
+        return [row[:count].tobytes().decode('ascii') for row, count in zip(matrix, counts)]
+
+    def windows(self, size, step=None, positions='123'):
+        """Windows over a codon position subset of each record, as views
+        into ``buffer``. Gaps are left as they are in the buffer.
+
+        Parameters:
+            size (int):       number of sites of each window.
+            step (int):       sites between the starts of two windows. Defaults
+                              to ``size``.
+            positions (str):  "1", "2", "3", "12", "13", "23" or "123".
+
+        Yields:
+            numpy.ndarray: read-only ``uint8`` view with one window per row for
+            each record, see ``windows.sliding_windows``.
+
+        """
+        from .windows import codon_position_view, sliding_windows
+
+        starts, lengths = self._in_frame_bounds()
+        for start, length in zip(starts.tolist(), lengths.tolist()):
+            view = codon_position_view(self.buffer[start:start + length], positions)
+            yield sliding_windows(view, size, step)
+
+    def first_codon_position(self):
+        """
+        :return: list of strings containing the first positions of each codon.
+
+        """
+        return self.codon_positions('1')
+
+    def second_codon_position(self):
+        """
+        :return: list of strings containing the second positions of each codon.
+
+        """
+        return self.codon_positions('2')
+
+    def third_codon_position(self):
+        """
+        :return: list of strings containing the third positions of each codon.
+
+        """
+        return self.codon_positions('3')
+
+    def first_and_second_codon_positions(self):
+        """
+        :return: list of strings containing both positions of each codon.
+
+        """
+        return self.codon_positions('12')
+
+    def stats(self):
+        """Counts the symbols of all records in one pass.
+
+        Returns:
+            (SequenceStats): with NumPy arrays of one value per record. Kept
+                             until ``reading_frames`` change.
+
+        """
+        key = tuple(self.reading_frames)
+        if self._stats is None or self._stats[0] != key:
+            shifts = [reading_frame_shift(reading_frame) for reading_frame in key]
+            counts = count_symbols(self.buffer, self.offsets, self.lengths, shifts)
+            self._stats = (key, SequenceStats(counts))
+        return self._stats[1]
+
+    def _translation_sequence(self, index):
+        """In-frame sequence of a record, as used by ``translate()`` and
+        ``degenerate()``. Only this record is decoded from the buffer.
+
+        """
+        reading_frame = self.reading_frames[index]
+        if reading_frame not in [1, 2, 3, None]:
+            raise ValueError("The reading_frame attribute should be either 1, 2, 3 or None.")
+        if reading_frame is None:
+            warnings.warn('reading_frame attribute should be either 1, 2 or 3.',
+                          SeqRecordExpandedWarning)
+            return '?'
+        start = self.offsets[index] + TRANSLATION_OFFSETS[reading_frame]
+        end = self.offsets[index] + self.lengths[index]
+        return _decode(self.buffer[start:max(start, end)])
+
+    def translate(self, table=None):
+        """
+        Parameters:
+            table (int): Optional. Overrides the translation table of each record.
+
+        Returns:
+            (list): Aminoacid sequence of each record.
+
+        """
+        out = []
+        for index in range(len(self)):
+            record_table = table or self.tables[index]
+            if record_table is None:
+                raise MissingParameterError('It is necessary to specify the translation'
+                                            ' table to use: batch.translate(table=1)')
+            seq = self._translation_sequence(index)
+            try:
+                out.append(get_codon_table(record_table).translate(seq))
+            except TranslationError as e:
+                raise TranslationErrorMixedGappedSeq(self.voucher_codes[index],
+                                                     self.gene_codes[index], e)
+        return out
+
+    def degenerate(self, method=None):
+        """
+        Parameters:
+            method (str):   S, Z, SZ, normal. If not given, the translation
+                            table of each record is used.
+
+        Returns:
+            (list): Degenerated sequence of each record.
+
+        """
+        out = []
+        for index in range(len(self)):
+            seq = self._translation_sequence(index)
+            if not method:
+                out.append(degenerate(seq, self.tables[index], 'normal'))
+            else:
+                out.append(degenerate(seq, 1, method))
+        return out
+
+    def codon_alignment(self, aligned_proteins):
+        """Threads every sequence onto its aligned protein in one pass.
+
+        Parameters:
+            aligned_proteins (list):  one aligned protein per record, with gaps ``-`` or ``.``.
+
+        Returns:
+            (list): codon-aligned DNA of each record, see ``codon_alignment.thread_batch``.
+
+        """
+        from .codon_alignment import thread_batch
+        return thread_batch(self, aligned_proteins)
+
+    def codon_usage(self, skip_ambiguous=True):
+        """Counts the codons of all records in one pass, per gene and table.
+
+        Parameters:
+            skip_ambiguous (bool):  Leave out codons with ambiguities or ``?``.
+
+        Returns:
+            (CodonUsage): see ``codon_usage.count_codons``.
+
+        """
+        from .codon_usage import count_codons
+        return count_codons(self, skip_ambiguous)
+
+    def validate(self, table=None):
+        """Finds internal stop codons, codons mixing missing data and bases,
+        invalid codons and partial codons of all records, without raising.
+
+        Parameters:
+            table (int): Optional. Overrides the translation table of each record.
+
+        Returns:
+            (list): FrameReport instances, one per record, see ``validate_batch``.
+
+        """
+        from .validation import validate_batch
+        return validate_batch(self, table)
+
+    def infer_reading_frames(self, table=None, update=False):
+        """Picks the reading frame with fewest stop codons for each record.
+
+        Parameters:
+            table (int):    Optional. Overrides the translation table of each record.
+            update (bool):  Set the inferred frame of records without ``reading_frame``.
+
+        Returns:
+            (list): 1, 2, 3 or None for each record, see ``frames.infer_reading_frames``.
+
+        """
+        from .frames import infer_reading_frames
+        frames = infer_reading_frames(self, table)
+        if update:
+            for index, frame in enumerate(frames):
+                if frame is not None and self.reading_frames[index] is None:
+                    self.reading_frames[index] = frame
+        return frames
+
+
+def _decode(array):
+    return _GAPS_AS_MISSING[array].tobytes().decode('ascii')
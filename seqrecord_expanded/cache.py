@@ -0,0 +1,150 @@
+import hashlib
+import threading
+
+
+DEFAULT_MAX_ENTRIES = 1000000
+
+# Fraction of ``max_entries`` kept when the cache is full, so that eviction
+# does not run on every insert.
+_KEEP_AFTER_EVICTION = 0.9
+
+_result_cache = None
+
+
+def sequence_digest(seq):
+    """
+    :return: SHA-1 hex digest of a sequence string.
+
+    """
+    return hashlib.sha1(seq.encode('utf-8')).hexdigest()
+
+
+class ResultCache(object):
+    """Results of ``degenerate()`` and ``translate()`` kept in a SQLite file
+    between runs.
+
+    Entries are keyed by a hash of the sequence, the reading frame, the
+    operation with its parameters (method, table) and the library version,
+    so new releases never reuse old results. Once the file holds more than
+    ``max_entries`` results, the least recently used ones are removed.
+
+    Results are only computed, and warnings only issued, the first time.
+
+    Parameters:
+        path (str):          SQLite file, created if needed. ``:memory:`` for
+                             a cache that only lasts as long as the instance.
+        max_entries (int):   maximum number of results kept.
+        version (str):       Optional. Defaults to the version of seqrecord-expanded.
+
+    """
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, version=None):
+        import sqlite3
+
+        if version is None:
+            from . import __version__ as version
+        self.path = path
+        self.max_entries = max_entries
+        self.version = version
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._connection.execute('CREATE TABLE IF NOT EXISTS results ('
+                                 'key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS results_used ON results (used)')
+        self._count, self._clock = self._connection.execute(
+            'SELECT COUNT(*), COALESCE(MAX(used), 0) FROM results').fetchone()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._count
+
+    def key(self, digest, reading_frame, operation):
+        """
+        Parameters:
+            digest (str):        ``sequence_digest`` of the sequence.
+            reading_frame (int): 1, 2, 3 or None.
+            operation (tuple):   such as ``('degenerate', 1, 'S')``.
+
+        Returns:
+            (str): hex digest used as key of the entry.
+
+        """
+        parts = [digest, repr(reading_frame), repr(tuple(operation)), self.version]
+        return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key, default=None):
+        with self._lock:
+            row = self._connection.execute('SELECT value FROM results WHERE key = ?',
+                                           (key,)).fetchone()
+            if row is None:
+                return default
+            self._clock += 1
+            self._connection.execute('UPDATE results SET used = ? WHERE key = ?',
+                                     (self._clock, key))
+            return row[0]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._clock += 1
+            cursor = self._connection.execute(
+                'INSERT OR IGNORE INTO results (key, value, used) VALUES (?, ?, ?)',
+                (key, value, self._clock))
+            if cursor.rowcount:
+                self._count += 1
+            else:
+                self._connection.execute('UPDATE results SET value = ?, used = ? WHERE key = ?',
+                                         (value, self._clock, key))
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self):
+        keep = int(self.max_entries * _KEEP_AFTER_EVICTION)
+        self._connection.execute(
+            'DELETE FROM results WHERE key IN '
+            '(SELECT key FROM results ORDER BY used LIMIT ?)', (self._count - keep,))
+        self._count = keep
+
+    def fetch(self, key, function, *args):
+        """Returns the stored result for ``key``, or calls ``function(*args)``
+        and stores its result.
+
+        """
+        value = self.get(key)
+        if value is None:
+            value = function(*args)
+            self[key] = value
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute('DELETE FROM results')
+            self._count = 0
+
+    def close(self):
+        self._connection.close()
+
+
+def use_result_cache(result_cache):
+    """Makes all records look up and store their results in ``result_cache``.
+
+    Parameters:
+        result_cache (ResultCache):  or None to stop using a cache.
+
+    Returns:
+        (ResultCache): the cache used until now, or None.
+
+    """
+    global _result_cache
+    previous = _result_cache
+    _result_cache = result_cache
+    return previous
+
+
+def get_result_cache():
+    return _result_cache
@@ -0,0 +1,114 @@
+import numpy as np
+
+from .batch import _GAPS_AS_MISSING
+from .codons import codon_position_offset, TRANSLATION_OFFSETS
+
+
+# Symbols read as gaps in aligned proteins. Every gap becomes a codon ``???``.
+PROTEIN_GAPS = '-.'
+
+_IS_GAP = np.zeros(256, dtype=bool)
+for _symbol in PROTEIN_GAPS:
+    _IS_GAP[ord(_symbol)] = True
+
+_MISSING_CODON = ord('?')
+
+
+def _protein_array(aligned_protein):
+    if not isinstance(aligned_protein, bytes):
+        aligned_protein = str(aligned_protein).encode('ascii')
+    return np.frombuffer(aligned_protein, dtype=np.uint8)
+
+
+def _residue_error(voucher_code, gene_code, residues, codons):
+    return ValueError('Gene {0!r}, sequence {1!r}: the aligned protein has {2} residues '
+                      'but the sequence has {3} codons.'.format(gene_code, voucher_code,
+                                                                residues, codons))
+
+
+def thread_codons(seq, aligned_protein, voucher_code=None, gene_code=None):
+    """Threads the codons of a DNA sequence onto its aligned protein.
+
+    Parameters:
+        seq (str):              DNA sequence in the frame used by ``translate()``.
+                                Bases after the last full codon are ignored.
+        aligned_protein (str):  translation of ``seq`` with gaps ``-`` or ``.``.
+        voucher_code (str):     only used in error messages.
+        gene_code (str):        only used in error messages.
+
+    Returns:
+        (str): codon-aligned DNA sequence, with ``???`` for each gap.
+
+    Raises:
+        ValueError:  if the number of residues is not the number of codons.
+
+    """
+    if not isinstance(seq, bytes):
+        seq = seq.encode('ascii')
+    protein = _protein_array(aligned_protein)
+    residues = ~_IS_GAP[protein]
+    codons = len(seq) // 3
+    if int(residues.sum()) != codons:
+        raise _residue_error(voucher_code, gene_code, int(residues.sum()), codons)
+
+    out = np.full((len(protein), 3), _MISSING_CODON, dtype=np.uint8)
+    out[residues] = np.frombuffer(seq, dtype=np.uint8, count=codons * 3).reshape(-1, 3)
+    return _GAPS_AS_MISSING[out].tobytes().decode('ascii')
+
+
+def thread_batch(batch, aligned_proteins):
+    """Threads the codons of every record of a batch onto its aligned
+    protein, in one pass for the whole batch.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        aligned_proteins (list):  one aligned protein per record, see ``thread_codons``.
+
+    Returns:
+        (list): codon-aligned DNA sequence of each record.
+
+    Raises:
+        ValueError:             if a reading frame is not 1, 2, 3 or None, the
+                                number of proteins is not the number of records or
+                                the residues of a protein are not the codons of
+                                its record.
+        MissingParameterError:  if any reading frame is None.
+
+    """
+    aligned_proteins = list(aligned_proteins)
+    if len(aligned_proteins) != len(batch):
+        raise ValueError('Expected {0} aligned proteins, got {1}.'.format(
+            len(batch), len(aligned_proteins)))
+    shifts = np.zeros(len(batch), dtype=np.int64)
+    for index, (reading_frame, gene_code) in enumerate(zip(batch.reading_frames,
+                                                           batch.gene_codes)):
+        codon_position_offset(reading_frame, gene_code)
+        shifts[index] = TRANSLATION_OFFSETS[reading_frame]
+
+    proteins = [aligned_protein if isinstance(aligned_protein, bytes)
+                else str(aligned_protein).encode('ascii') for aligned_protein in aligned_proteins]
+    widths = np.array([len(protein) for protein in proteins], dtype=np.int64)
+    protein = np.frombuffer(b''.join(proteins), dtype=np.uint8)
+    records = np.repeat(np.arange(len(batch)), widths)
+    residues = ~_IS_GAP[protein]
+
+    codons = np.maximum(batch.lengths - shifts, 0) // 3
+    counts = np.bincount(records[residues], minlength=len(batch))
+    wrong = np.flatnonzero(counts != codons)
+    if len(wrong):
+        index = int(wrong[0])
+        raise _residue_error(batch.voucher_codes[index], batch.gene_codes[index],
+                             int(counts[index]), int(codons[index]))
+
+    # rank of each residue within its record gives the codon it is threaded to
+    rank = np.cumsum(residues) - 1
+    first_rank = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64) \
+        if len(batch) else np.zeros(0, dtype=np.int64)
+    starts = batch.offsets + shifts
+    cells = starts[records[residues]] + (rank[residues] - first_rank[records[residues]]) * 3
+
+    out = np.full((len(protein), 3), _MISSING_CODON, dtype=np.uint8)
+    out[residues] = batch.buffer[cells[:, None] + np.arange(3)]
+    text = _GAPS_AS_MISSING[out].tobytes().decode('ascii')
+    bounds = np.concatenate(([0], np.cumsum(widths * 3))).tolist()
+    return [text[bounds[index]:bounds[index + 1]] for index in range(len(batch))]
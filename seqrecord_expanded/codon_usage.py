@@ -0,0 +1,175 @@
+import itertools
+
+import numpy as np
+
+from .codons import codon_position_offset, TRANSLATION_OFFSETS
+from .exceptions import MissingParameterError
+from .translation import get_codon_table
+from .validation import _codon_chunks, _CLASSES, _SYMBOLS
+
+#: The 64 codons, in the order of the columns of ``CodonUsage.counts``.
+CODONS = tuple(''.join(codon) for codon in itertools.product('ACGT', repeat=3))
+
+# Bases each symbol of ``validation._SYMBOLS`` can be.
+_IUPAC = {
+    'A': 'A', 'C': 'C', 'G': 'G', 'T': 'T', 'U': 'T', 'R': 'AG', 'Y': 'CT', 'S': 'CG',
+    'W': 'AT', 'K': 'GT', 'M': 'AC', 'B': 'CGT', 'D': 'AGT', 'H': 'ACT', 'V': 'ACG',
+    'N': 'ACGT', '?': 'ACGT',
+}
+
+# Matrices turning counts of codon codes into counts of the 64 codons,
+# keyed by ``skip_ambiguous``.
+_weights = dict()
+
+# Synonymous codon group of each of the 64 codons, keyed by translation table.
+_groups = dict()
+
+
+def _codon_weights(skip_ambiguous):
+    if skip_ambiguous in _weights:
+        return _weights[skip_ambiguous]
+    weights = np.zeros((_CLASSES ** 3, len(CODONS)), dtype=np.float64)
+    for codon in itertools.product(range(len(_SYMBOLS)), repeat=3):
+        code = (codon[0] * _CLASSES + codon[1]) * _CLASSES + codon[2]
+        bases = [_IUPAC[_SYMBOLS[i]] for i in codon]
+        if skip_ambiguous and any(len(i) > 1 for i in bases):
+            continue
+        possible = [CODONS.index(''.join(i)) for i in itertools.product(*bases)]
+        weights[code, possible] = 1.0 / len(possible)
+    _weights[skip_ambiguous] = weights
+    return weights
+
+
+def _synonymous_groups(table):
+    if table not in _groups:
+        lookup = get_codon_table(table).lookup
+        amino_acids = [lookup[codon] for codon in CODONS]
+        distinct = sorted(set(amino_acids))
+        _groups[table] = np.array([distinct.index(i) for i in amino_acids], dtype=np.int64)
+    return _groups[table]
+
+
+class CodonUsage(object):
+    """Codon counts per gene and translation table.
+
+    Results of different batches, such as those of several workers, are
+    combined with ``merge`` or ``+``.
+
+    Parameters:
+        keys (list):              ``(gene_code, table)`` of each row.
+        counts (numpy.ndarray):   ``float64`` array of shape ``(len(keys), 64)``,
+                                  columns in the order of ``CODONS``.
+        skipped (numpy.ndarray):  codons left out of each row, because of
+                                  ambiguity or invalid symbols.
+
+    """
+    def __init__(self, keys=None, counts=None, skipped=None):
+        self.keys = list(keys or [])
+        self.counts = np.zeros((0, len(CODONS))) if counts is None else \
+            np.asarray(counts, dtype=np.float64)
+        self.skipped = np.zeros(len(self.keys)) if skipped is None else \
+            np.asarray(skipped, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __getitem__(self, key):
+        """
+        :return: counts of the 64 codons for ``(gene_code, table)``.
+
+        """
+        return self.counts[self.keys.index(key)]
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def merge(self, *others):
+        """
+        Returns:
+            (CodonUsage): new instance with the counts of all instances added by key.
+
+        """
+        keys = list(self.keys)
+        for usage in others:
+            keys.extend(key for key in usage.keys if key not in keys)
+        counts = np.zeros((len(keys), len(CODONS)), dtype=np.float64)
+        skipped = np.zeros(len(keys), dtype=np.float64)
+        for usage in (self,) + others:
+            rows = [keys.index(key) for key in usage.keys]
+            np.add.at(counts, rows, usage.counts)
+            np.add.at(skipped, rows, usage.skipped)
+        return CodonUsage(keys, counts, skipped)
+
+    def rscu(self, table=None):
+        """Relative synonymous codon usage: the count of each codon divided by
+        the mean count of the codons for the same aminoacid. Stop codons are
+        one more group.
+
+        Parameters:
+            table (int): Optional. Overrides the translation table of each row.
+
+        Returns:
+            (numpy.ndarray): ``float64`` array shaped as ``counts``, NaN for
+            aminoacids without counted codons.
+
+        Raises:
+            MissingParameterError:  if a row has no translation table.
+
+        """
+        out = np.full(self.counts.shape, np.nan)
+        for row, (gene_code, row_table) in enumerate(self.keys):
+            row_table = table or row_table
+            if row_table is None:
+                raise MissingParameterError('It is necessary to specify the translation'
+                                            ' table to use: usage.rscu(table=1)')
+            groups = _synonymous_groups(row_table)
+            totals = np.bincount(groups, weights=self.counts[row])
+            expected = totals[groups] / np.bincount(groups)[groups]
+            used = expected > 0
+            out[row, used] = self.counts[row, used] / expected[used]
+        return out
+
+
+def count_codons(batch, skip_ambiguous=True):
+    """Counts the codons of all records of a batch in one vectorized pass,
+    adding records of the same gene and translation table.
+
+    Codons are read in the frame used by ``translate()`` and bases after
+    the last full codon are left out.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        skip_ambiguous (bool):  Leave out codons with IUPAC ambiguities or ``?``.
+                                Otherwise they are split evenly among the codons
+                                they could be.
+
+    Returns:
+        (CodonUsage)
+
+    Raises:
+        ValueError:             if a reading frame is not 1, 2, 3 or None.
+        MissingParameterError:  if any reading frame is None.
+
+    """
+    keys = []
+    key_indexes = np.zeros(len(batch), dtype=np.int64)
+    shifts = np.zeros(len(batch), dtype=np.int64)
+    for index, (reading_frame, gene_code, table) in enumerate(zip(
+            batch.reading_frames, batch.gene_codes, batch.tables)):
+        codon_position_offset(reading_frame, gene_code)
+        shifts[index] = TRANSLATION_OFFSETS[reading_frame]
+        if (gene_code, table) not in keys:
+            keys.append((gene_code, table))
+        key_indexes[index] = keys.index((gene_code, table))
+    codons = np.maximum(batch.lengths - shifts, 0) // 3
+
+    size = _CLASSES ** 3
+    code_counts = np.zeros(len(keys) * size, dtype=np.int64)
+    for records, _, _, code in _codon_chunks(batch, shifts, codons):
+        code_counts += np.bincount(key_indexes[records] * size + code, minlength=len(code_counts))
+    code_counts = code_counts.reshape(len(keys), size)
+
+    weights = _codon_weights(skip_ambiguous)
+    counted = weights.sum(axis=1) > 0
+    return CodonUsage(keys, code_counts.astype(np.float64).dot(weights),
+                      code_counts[:, ~counted].sum(axis=1))
@@ -0,0 +1,104 @@
+import itertools
+
+from .exceptions import MissingParameterError
+
+
+# Leading bases to skip so that a sequence starts at a first codon position.
+CODON_POSITION_OFFSETS = {1: 0, 2: 2, 3: 1}
+
+# Leading bases trimmed by ``translate()`` and ``degenerate()``, which count
+# reading frames from the first base of the sequence instead.
+TRANSLATION_OFFSETS = {1: 0, 2: 1, 3: 2}
+
+CODON_POSITIONS = ('1', '2', '3', '12', '13', '23', '123')
+
+
+def codon_position_offset(reading_frame, gene_code=None):
+    """Number of leading bases to skip so that the sequence starts at a
+    first codon position.
+
+    Raises:
+        ValueError:             if ``reading_frame`` is not 1, 2, 3 or None.
+        MissingParameterError:  if ``reading_frame`` is None.
+
+    """
+    if reading_frame not in [1, 2, 3, None]:
+        raise ValueError("The reading_frame attribute should be either 1, 2, 3 or None.")
+    if reading_frame is None:
+        raise MissingParameterError('reading_frame attribute for gene {0} '
+                                    'should be either 1, 2 or 3.'.format(gene_code))
+    return CODON_POSITION_OFFSETS[reading_frame]
+
+
+# Sorted columns within a codon of each codon position subset, in any order
+# of the digits: ``"21"`` is ``(0, 1)``.
+_COLUMNS = dict(
+    (''.join(permutation), tuple(sorted(int(i) - 1 for i in permutation)))
+    for positions in CODON_POSITIONS for permutation in itertools.permutations(positions)
+)
+
+_SINGLE_COLUMNS = {'1': 0, '2': 1, '3': 2}
+
+
+def codon_columns(positions):
+    """Converts a codon position subset such as ``"12"`` into the sorted
+    columns within a codon: ``(0, 1)``.
+
+    """
+    try:
+        return _COLUMNS[positions]
+    except (KeyError, TypeError):
+        if str(positions) in _COLUMNS:
+            return _COLUMNS[str(positions)]
+    raise ValueError('Codon positions should be a combination of "1", "2" '
+                     'and "3", such as "1", "12" or "123". Got {0!r}.'.format(positions))
+
+
+def select_codon_positions(seq, positions='123'):
+    """Extracts any subset of codon positions from a sequence that already
+    starts at a first codon position.
+
+    Each requested position is taken with one strided slice and the slices
+    are interleaved with extended slice assignment into a ``bytearray``, so
+    there is no per-character work done in Python.
+
+    Parameters:
+        seq (str):         DNA sequence, in frame.
+        positions (str):   "1", "2", "3", "12", "13", "23" or "123".
+
+    Returns:
+        (str): the requested codon positions, in sequence order.
+
+    """
+    column = _SINGLE_COLUMNS.get(positions)
+    if column is not None:
+        return seq[column::3]
+
+    columns = codon_columns(positions)
+    if len(columns) == 3:
+        return seq
+    if len(columns) == 1:
+        return seq[columns[0]::3]
+
+    strands = [seq[column::3].encode('ascii') for column in columns]
+    out = bytearray(sum(len(strand) for strand in strands))
+    for index, strand in enumerate(strands):
+        out[index::len(strands)] = strand
+    return out.decode('ascii')
+
+
+def split_codon_positions(seq, reading_frame, positions='123', gene_code=None):
+    """Extracts any subset of codon positions from a sequence.
+
+    Parameters:
+        seq (str):            DNA sequence.
+        reading_frame (int):  1, 2 or 3.
+        positions (str):      "1", "2", "3", "12", "13", "23" or "123".
+        gene_code (str):      only used in error messages.
+
+    Returns:
+        (str): the requested codon positions, in sequence order.
+
+    """
+    offset = codon_position_offset(reading_frame, gene_code)
+    return select_codon_positions(str(seq)[offset:], positions)
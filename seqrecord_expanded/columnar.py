@@ -0,0 +1,159 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .batch import SeqRecordBatch, _GAPS_AS_MISSING
+
+
+# Metadata columns and the SeqRecordBatch attribute holding each of them.
+COLUMNS = (
+    ('voucher_code', 'voucher_codes'),
+    ('gene_code', 'gene_codes'),
+    ('taxonomy', 'taxonomies'),
+    ('lineage', 'lineages'),
+    ('reading_frame', 'reading_frames'),
+    ('table', 'tables'),
+    ('accession_number', 'accession_numbers'),
+)
+
+#: Strings of a column stored as in Arrow: all bytes in one ``numpy.uint8``
+#: array ``data`` and ``len + 1`` ``int64`` ``offsets``, so that string ``i``
+#: is ``data[offsets[i]:offsets[i + 1]]``.
+PackedStrings = namedtuple('PackedStrings', ['data', 'offsets'])
+
+
+def pack_strings(strings):
+    """
+    :return: PackedStrings with the given strings.
+
+    """
+    encoded = [i if isinstance(i, bytes) else i.encode('ascii') for i in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(i) for i in encoded], out=offsets[1:])
+    return PackedStrings(np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets)
+
+
+def unpack_strings(packed):
+    """
+    :return: list with the strings of a PackedStrings.
+
+    """
+    first, last = int(packed.offsets[0]), int(packed.offsets[-1])
+    text = packed.data[first:last].tobytes().decode('ascii')
+    bounds = (packed.offsets - first).tolist()
+    return [text[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _sequence_column(batch):
+    lengths = batch.lengths
+    if len(batch) and np.array_equal(batch.offsets[1:], batch.offsets[:-1] + lengths[:-1]):
+        # records are already back to back in the buffer
+        first = int(batch.offsets[0])
+        data = batch.buffer[first:first + int(lengths.sum())]
+    else:
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+        data = batch.buffer[np.repeat(batch.offsets - starts, lengths) +
+                            np.arange(int(lengths.sum()), dtype=np.int64)]
+    if (data == ord('-')).any():
+        data = _GAPS_AS_MISSING[data]
+    offsets = np.zeros(len(batch) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return PackedStrings(data, offsets)
+
+
+def to_columns(batch, translate=False, degenerate=False, table=None, method=None):
+    """Exports a batch as a dictionary of columns, without creating records.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        translate (bool):   Also add a ``translated`` column.
+        degenerate (bool):  Also add a ``degenerated`` column.
+        table (int):        Optional. Passed to ``SeqRecordBatch.translate``.
+        method (str):       Optional. Passed to ``SeqRecordBatch.degenerate``.
+
+    Returns:
+        (dict): a list for each metadata column in ``COLUMNS`` and PackedStrings
+        for ``sequence`` and the derived columns. The ``sequence`` column is
+        a view of the batch buffer when its records are stored back to back.
+
+    """
+    columns = dict((name, list(getattr(batch, attribute))) for name, attribute in COLUMNS)
+    columns['sequence'] = _sequence_column(batch)
+    if translate:
+        columns['translated'] = pack_strings(batch.translate(table))
+    if degenerate:
+        columns['degenerated'] = pack_strings(batch.degenerate(method))
+    return columns
+
+
+def from_columns(columns):
+    """Creates a batch from a dictionary of columns, such as those returned
+    by ``to_columns``. The sequences are not copied.
+
+    Parameters:
+        columns (dict):  ``sequence`` as PackedStrings or list of strings, and
+                         any metadata column in ``COLUMNS``.
+
+    Returns:
+        (SeqRecordBatch)
+
+    """
+    sequences = columns['sequence']
+    if not isinstance(sequences, PackedStrings):
+        sequences = pack_strings(sequences)
+    metadata = dict((attribute, columns.get(name)) for name, attribute in COLUMNS)
+    offsets = np.asarray(sequences.offsets, dtype=np.int64)
+    return SeqRecordBatch.from_buffer(sequences.data, offsets[:-1], np.diff(offsets), **metadata)
+
+
+def to_arrow(columns):
+    """Converts columns from ``to_columns`` into a ``pyarrow.Table``. Packed
+    strings become ``large_string`` columns sharing their buffers and
+    ``taxonomy`` a map of strings. Needs pyarrow.
+
+    """
+    import pyarrow as pa
+
+    names = []
+    arrays = []
+    for name, values in columns.items():
+        if isinstance(values, PackedStrings):
+            array = pa.LargeStringArray.from_buffers(
+                len(values.offsets) - 1,
+                pa.py_buffer(np.ascontiguousarray(values.offsets, dtype=np.int64)),
+                pa.py_buffer(np.ascontiguousarray(values.data, dtype=np.uint8)))
+        elif name == 'taxonomy':
+            array = pa.array([sorted((taxonomy or dict()).items()) for taxonomy in values],
+                             type=pa.map_(pa.string(), pa.string()))
+        else:
+            array = pa.array(values)
+        names.append(name)
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def from_arrow(table):
+    """Converts a ``pyarrow.Table``, such as one read from Parquet, into
+    columns for ``from_columns``. String columns other than the metadata
+    columns are read as PackedStrings over the Arrow buffers. Needs pyarrow.
+
+    """
+    import pyarrow as pa
+
+    metadata = set(name for name, _ in COLUMNS)
+    columns = dict()
+    for name in table.column_names:
+        column = table.column(name)
+        if name == 'taxonomy':
+            columns[name] = [dict(taxonomy or []) for taxonomy in column.to_pylist()]
+        elif name not in metadata and (pa.types.is_string(column.type) or
+                                       pa.types.is_large_string(column.type)):
+            array = column.cast(pa.large_string()).combine_chunks()
+            _, offsets, data = array.buffers()
+            offsets = np.frombuffer(offsets, dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+            data = np.frombuffer(data, dtype=np.uint8) if data is not None else \
+                np.zeros(0, dtype=np.uint8)
+            columns[name] = PackedStrings(data, offsets)
+        else:
+            columns[name] = column.to_pylist()
+    return columns
@@ -0,0 +1,67 @@
+import warnings
+
+from degenerate_dna import Degenera
+from degenerate_dna._warnings import DegenerateWarning
+
+from .instrumentation import instrumented, sequence_size
+from .utils import LRUCache
+
+
+PARTIAL_CODON_WARNING = ("Partial codon, len(sequence) not a multiple of three. "
+                         "Explicitly trim the sequence or add trailing N before "
+                         "translation. This may become an error in future.")
+
+#: Degenerated codons shared by all records, keyed by ``(table, method, codon)``.
+#: Values are ``(degenerated_codon, warning_messages)``.
+codon_cache = LRUCache(maxsize=65536)
+
+
+def _degenerate_codon(codon, table, method):
+    key = (table, method, codon)
+    entry = codon_cache.get(key)
+    if entry is None:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            res = Degenera(dna=codon, table=table, method=method)
+            res.degenerate()
+        entry = (res.degenerated, tuple(str(warning.message) for warning in caught))
+        codon_cache[key] = entry
+    return entry
+
+
+@instrumented('degeneration.degenerate', size=sequence_size)
+def degenerate(seq, table, method):
+    """Degenerates a DNA sequence that is already in frame, using Zwick et al
+    methods.
+
+    Gives the same output as ``degenerate_dna.Degenera``, but each distinct
+    codon is only degenerated once and the result is kept in ``codon_cache``.
+
+    Parameters:
+        seq (str):     DNA sequence.
+        table (int):   NCBI code for translation table.
+        method (str):  S, Z, SZ, normal
+
+    Returns:
+        (str): Degenerated sequence.
+
+    """
+    # Let degenerate_dna validate the arguments and raise its own errors.
+    Degenera(dna='', table=table, method=method).degenerate()
+
+    seq = str(seq)
+    n = len(seq)
+    remainder = n % 3
+    if remainder != 0:
+        warnings.warn(PARTIAL_CODON_WARNING, DegenerateWarning)
+
+    codons = [seq[i:i + 3] for i in range(0, n - remainder, 3)]
+    degenerated = dict()
+    for codon in set(codons):
+        degenerated[codon], messages = _degenerate_codon(codon, table, method)
+        for message in messages:
+            warnings.warn(message, DegenerateWarning)
+
+    out = list(map(degenerated.__getitem__, codons))
+    out.append(seq[n - remainder:])
+    return ''.join(out)
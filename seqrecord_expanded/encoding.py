@@ -0,0 +1,200 @@
+import warnings
+
+import numpy as np
+import six
+
+from .codons import codon_columns, codon_position_offset, TRANSLATION_OFFSETS
+
+
+#: The 16 symbols that can be encoded, in code order. Lower case letters are
+#: encoded as upper case and gaps as ``?``.
+SYMBOLS = 'ACGTRYSWKMBDHVN?'
+
+_INVALID = 255
+
+_ENCODE = np.full(256, _INVALID, dtype=np.uint8)
+for _code, _symbol in enumerate(SYMBOLS):
+    _ENCODE[ord(_symbol)] = _code
+    _ENCODE[ord(_symbol.lower())] = _code
+_ENCODE[ord('-')] = SYMBOLS.index('?')
+
+_DECODE = np.frombuffer(SYMBOLS.encode('ascii'), dtype=np.uint8)
+
+# Translation and degeneration lookup tables, indexed by codon code
+# ``first * 256 + second * 16 + third``.
+_translation_tables = dict()
+_degeneration_tables = dict()
+
+_CODONS = [a + b + c for a in SYMBOLS for b in SYMBOLS for c in SYMBOLS]
+
+
+class EncodedSequence(object):
+    """DNA sequence packed as two 4-bit codes per byte.
+
+    Takes half the memory of a string. Codon positions, translation and
+    degeneration work on the codes and only the output is decoded.
+
+    Parameters:
+        seq (str):  DNA sequence with IUPAC ambiguous letters, ``?`` and ``-``,
+                    as str or bytes.
+
+    Attributes:
+        packed:   ``numpy.uint8`` array with two codes per byte, first code in
+                  the high bits.
+        length:   Number of bases.
+
+    Raises:
+        ValueError:  if the sequence has other symbols.
+
+    """
+    __slots__ = ('packed', 'length')
+
+    def __init__(self, seq=''):
+        if isinstance(seq, six.text_type):
+            seq = seq.encode('ascii')
+        codes = _ENCODE[np.frombuffer(seq, dtype=np.uint8)]
+        if (codes == _INVALID).any():
+            index = int(np.flatnonzero(codes == _INVALID)[0])
+            raise ValueError('Symbol {0!r} cannot be encoded.'.format(
+                seq[index:index + 1].decode('ascii', 'replace')))
+        self._pack(codes)
+
+    @classmethod
+    def from_codes(cls, codes):
+        """
+        :return: EncodedSequence from an array of codes 0 to 15.
+
+        """
+        encoded = cls.__new__(cls)
+        encoded._pack(np.asarray(codes, dtype=np.uint8))
+        return encoded
+
+    def _pack(self, codes):
+        self.length = len(codes)
+        if self.length % 2:
+            codes = np.append(codes, np.uint8(0))
+        self.packed = (codes[0::2] << 4) | codes[1::2]
+
+    def codes(self):
+        """
+        :return: ``numpy.uint8`` array with one code per base.
+
+        """
+        out = np.empty(len(self.packed) * 2, dtype=np.uint8)
+        out[0::2] = self.packed >> 4
+        out[1::2] = self.packed & 15
+        return out[:self.length]
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        return self.decode()
+
+    def __eq__(self, other):
+        return isinstance(other, EncodedSequence) and self.length == other.length and \
+            np.array_equal(self.packed, other.packed)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def decode(self):
+        """
+        :return: the sequence as string.
+
+        """
+        return _DECODE[self.codes()].tobytes().decode('ascii')
+
+    def codon_positions(self, reading_frame, positions='123', gene_code=None):
+        """Same as ``SeqRecordExpanded.codon_positions``, without decoding.
+
+        Returns:
+            (EncodedSequence)
+
+        """
+        offset = codon_position_offset(reading_frame, gene_code)
+        columns = codon_columns(positions)
+        codes = self.codes()[offset:]
+        index = np.arange(len(codes))
+        return EncodedSequence.from_codes(codes[np.isin(index % 3, columns)])
+
+    def _codons(self, reading_frame):
+        codon_position_offset(reading_frame)
+        codes = self.codes()[TRANSLATION_OFFSETS[reading_frame]:]
+        remainder = len(codes) % 3
+        full = codes[:len(codes) - remainder].astype(np.int64).reshape(-1, 3)
+        return full[:, 0] * 256 + full[:, 1] * 16 + full[:, 2], codes[len(codes) - remainder:]
+
+    def translate(self, table, reading_frame=1):
+        """Same as ``SeqRecordExpanded.translate``, looking up every codon code
+        in a table of 4096 aminoacids.
+
+        Parameters:
+            table (int):          NCBI code for translation table.
+            reading_frame (int):  1, 2 or 3, counted as ``translate()`` does.
+
+        Returns:
+            (str): Aminoacid sequence.
+
+        """
+        from Bio import BiopythonWarning
+        from Bio.Data.CodonTable import TranslationError
+        from .translation import get_codon_table, PARTIAL_CODON_WARNING
+
+        compiled = get_codon_table(table)
+        if table not in _translation_tables:
+            lookup = np.full(16 ** 3, _INVALID, dtype=np.uint8)
+            for code, codon in enumerate(_CODONS):
+                if codon in compiled.lookup:
+                    lookup[code] = ord(compiled.lookup[codon])
+            _translation_tables[table] = lookup
+        lookup = _translation_tables[table]
+
+        for message in compiled.warnings:
+            warnings.warn(message, BiopythonWarning)
+        codons, remainder = self._codons(reading_frame)
+        if len(remainder):
+            warnings.warn(PARTIAL_CODON_WARNING, BiopythonWarning)
+
+        amino_acids = lookup[codons]
+        invalid = np.flatnonzero(amino_acids == _INVALID)
+        if len(invalid):
+            codon = _CODONS[codons[invalid[0]]].replace('?', 'N')
+            raise TranslationError("Codon '{0}' is invalid".format(codon))
+        return amino_acids.tobytes().decode('ascii')
+
+    def degenerate(self, table, method, reading_frame=1):
+        """Same as ``SeqRecordExpanded.degenerate``. Each distinct codon code
+        is degenerated once per table and method and kept in a lookup table.
+
+        Parameters:
+            table (int):          NCBI code for translation table.
+            method (str):         S, Z, SZ, normal
+            reading_frame (int):  1, 2 or 3, counted as ``degenerate()`` does.
+
+        Returns:
+            (str): Degenerated sequence.
+
+        """
+        from degenerate_dna import Degenera
+        from degenerate_dna._warnings import DegenerateWarning
+        from .degeneration import _degenerate_codon, PARTIAL_CODON_WARNING
+
+        Degenera(dna='', table=table, method=method).degenerate()
+        if (table, method) not in _degeneration_tables:
+            _degeneration_tables[table, method] = (np.zeros((16 ** 3, 3), dtype=np.uint8), dict())
+        lookup, messages = _degeneration_tables[table, method]
+
+        codons, remainder = self._codons(reading_frame)
+        if len(remainder):
+            warnings.warn(PARTIAL_CODON_WARNING, DegenerateWarning)
+
+        for code in np.unique(codons).tolist():
+            if code not in messages:
+                degenerated, messages[code] = _degenerate_codon(_CODONS[code], table, method)
+                lookup[code] = np.frombuffer(degenerated.encode('ascii'), dtype=np.uint8)
+            for message in messages[code]:
+                warnings.warn(message, DegenerateWarning)
+
+        out = lookup[codons].tobytes() + _DECODE[remainder].tobytes()
+        return out.decode('ascii')
@@ -0,0 +1,87 @@
+import numpy as np
+
+from .batch import SeqRecordBatch
+from .validation import _codon_chunks, _codon_status, _CLASSES, _STOP
+
+
+def count_stop_codons(batch, table=None):
+    """Counts the stop codons of every record of a batch when translated in
+    each of the three reading frames. A stop in the last codon is not counted.
+
+    Frames are numbered as ``translate()`` reads them: frame 2 skips the
+    first base of the sequence and frame 3 the first two. The compiled
+    codon table of each translation table is built once for the whole batch.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        table (int):  Optional. Overrides the translation table of each record.
+
+    Returns:
+        (numpy.ndarray): ``int64`` array of shape ``(len(batch), 3)``, with ``-1``
+        for records without translation table.
+
+    """
+    tables = [table or record_table for record_table in batch.tables]
+    known = np.array([record_table is not None for record_table in tables], dtype=bool)
+    distinct = []
+    for record_table in tables:
+        if record_table is not None and record_table not in distinct:
+            distinct.append(record_table)
+    table_indexes = np.array([distinct.index(record_table) if record_table is not None else 0
+                              for record_table in tables], dtype=np.int64)
+    statuses = np.zeros((len(distinct), _CLASSES ** 3), dtype=np.int8)
+    for index, record_table in enumerate(distinct):
+        statuses[index] = _codon_status(record_table)
+
+    counts = np.zeros((len(batch), 3), dtype=np.int64)
+    for column in range(3):
+        shifts = np.full(len(batch), column, dtype=np.int64)
+        codons = np.where(known, np.maximum(batch.lengths - column, 0) // 3, 0)
+        for records, within, _, code in _codon_chunks(batch, shifts, codons):
+            stops = (statuses[table_indexes[records], code] == _STOP) & \
+                (within < codons[records] - 1)
+            counts[:, column] += np.bincount(records[stops], minlength=len(batch))
+    counts[~known] = -1
+    return counts
+
+
+def infer_reading_frames(batch, table=None):
+    """Picks for each record of a batch the reading frame with fewest stop
+    codons, see ``count_stop_codons``.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        table (int):  Optional. Overrides the translation table of each record.
+
+    Returns:
+        (list): 1, 2 or 3 for each record, or None if the record has no
+        translation table or several frames have the fewest stop codons.
+
+    """
+    counts = count_stop_codons(batch, table)
+    fewest = counts.min(axis=1)
+    ties = (counts == fewest[:, None]).sum(axis=1)
+    frames = counts.argmin(axis=1) + 1
+    return [int(frame) if minimum >= 0 and tied == 1 else None
+            for frame, minimum, tied in zip(frames, fewest, ties)]
+
+
+def set_reading_frames(seq_records, table=None, overwrite=False):
+    """Infers the reading frame of many records at once and sets it.
+
+    Parameters:
+        seq_records (list):  SeqRecordExpanded or CompactSeqRecordExpanded instances.
+        table (int):         Optional. Overrides the translation table of each record.
+        overwrite (bool):    Also replace reading frames that are already set.
+
+    Returns:
+        (list): the inferred reading frames, see ``infer_reading_frames``.
+        Records whose frame could not be inferred are left unchanged.
+
+    """
+    seq_records = list(seq_records)
+    frames = infer_reading_frames(SeqRecordBatch(seq_records), table)
+    for seq_record, frame in zip(seq_records, frames):
+        if frame is not None and (overwrite or seq_record.reading_frame is None):
+            seq_record.reading_frame = frame
+    return frames
@@ -0,0 +1,172 @@
+"""Opt-in counters for the hot paths of seqrecord-expanded.
+
+Turn them on with ``enable()`` and read them with ``report()``::
+
+    from seqrecord_expanded import instrumentation
+
+    instrumentation.enable()
+    ...
+    instrumentation.report()
+    {'degeneration.degenerate': {'calls': 1000, 'seconds': 0.84, 'bytes': 1500000}, ...}
+
+Times are cumulative and include nested operations, so ``record.degenerate``
+contains the time spent in ``degeneration.degenerate``.
+
+Record and codon table methods are only replaced by counting wrappers while
+enabled, so calling them costs nothing extra when disabled. The few module
+functions that are instrumented, all of them coarse operations, check a
+module flag on every call.
+
+"""
+import functools
+import threading
+import time
+
+
+_timer = getattr(time, 'perf_counter', time.time)
+
+_enabled = False
+_callbacks = []
+_registry = dict()
+_lock = threading.Lock()
+
+# Instrumented methods: (class, attribute, method, counting wrapper).
+_methods = []
+
+
+class OperationStats(object):
+    """Counters of one operation.
+
+    Attributes:
+        calls:    number of calls.
+        seconds:  cumulative time.
+        bytes:    cumulative size of the sequences processed.
+
+    """
+    __slots__ = ('calls', 'seconds', 'bytes')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.bytes = 0
+
+    def as_dict(self):
+        return {'calls': self.calls, 'seconds': self.seconds, 'bytes': self.bytes}
+
+
+def enable(callback=None):
+    """Starts counting.
+
+    Parameters:
+        callback (callable):  Optional. Called as ``callback(name, seconds, size)``
+                              after every instrumented call.
+
+    """
+    global _enabled
+    if callback is not None:
+        _callbacks.append(callback)
+    _enabled = True
+    for owner, attribute, _, wrapper in _methods:
+        setattr(owner, attribute, wrapper)
+
+
+def disable():
+    """Stops counting and removes the callbacks. Counters are kept."""
+    global _enabled
+    _enabled = False
+    del _callbacks[:]
+    for owner, attribute, method, _ in _methods:
+        setattr(owner, attribute, method)
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    with _lock:
+        _registry.clear()
+
+
+def report():
+    """
+    :return: dictionary ``{name: {'calls': 1, 'seconds': 0.1, 'bytes': 100}}``.
+
+    """
+    with _lock:
+        return dict((name, stats.as_dict()) for name, stats in _registry.items())
+
+
+def _record(name, seconds, size):
+    with _lock:
+        stats = _registry.get(name)
+        if stats is None:
+            stats = _registry[name] = OperationStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.bytes += size
+    for callback in _callbacks:
+        callback(name, seconds, size)
+
+
+def _counting(function, name, size):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = _timer()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _record(name, _timer() - start, size(*args, **kwargs) if size else 0)
+    return wrapper
+
+
+def instrumented(name, size=None):
+    """Decorator counting the calls of a function under ``name``.
+
+    Methods of classes decorated with ``instrument_methods`` are only marked,
+    so that ``enable()`` can swap them. Other functions are wrapped and check
+    whether counting is enabled on every call, so only use it for coarse
+    operations.
+
+    Parameters:
+        name (str):          operation name used in ``report()``.
+        size (callable):     Optional. Takes the arguments of the function and
+                             returns the number of bytes it processes.
+
+    """
+    def decorator(function):
+        counting = _counting(function, name, size)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            return counting(*args, **kwargs)
+        wrapper._instrumented = (function, counting)
+        return wrapper
+    return decorator
+
+
+def instrument_methods(cls):
+    """Class decorator replacing the ``instrumented`` methods of ``cls`` by
+    the undecorated methods, and registering their counting wrappers for
+    ``enable()``.
+
+    """
+    for attribute, value in list(vars(cls).items()):
+        marked = getattr(value, '_instrumented', None)
+        if marked is not None:
+            method, counting = marked
+            _methods.append((cls, attribute, method, counting))
+            setattr(cls, attribute, counting if _enabled else method)
+    return cls
+
+
+def sequence_size(seq, *args, **kwargs):
+    """``size`` of functions taking the sequence as first argument."""
+    return len(seq) if seq is not None else 0
+
+
+def record_size(seq_record, *args, **kwargs):
+    """``size`` of record methods."""
+    return seq_record._sequence_length()
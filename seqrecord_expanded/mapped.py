@@ -0,0 +1,118 @@
+import io
+import mmap
+import os
+
+from .batch import SeqRecordBatch
+from .readers import _settings_for
+
+
+FORMATS = ('fasta', 'phylip')
+
+
+def map_alignment(path, format='fasta', gene_code=None, reading_frame=None, table=None,
+                  settings=None):
+    """Memory-maps an alignment file and returns its records as views.
+
+    Only the position and length of each sequence are read when the file is
+    opened. Sequences stay in the file and the operating system pages them
+    in when codon positions, translations or degenerations are requested,
+    so alignments larger than the available memory can be used.
+
+    Sequences have to be on a single line: FASTA files without line
+    wrapping or relaxed sequential PHYLIP files.
+
+    Parameters:
+        path (str):           path to the alignment file.
+        format (str):         fasta or phylip.
+        gene_code (str):      gene code for all records of the file.
+        reading_frame (int):  1, 2 or 3, for all records of the file.
+        table (int):          NCBI code for translation table, for all records
+                              of the file.
+        settings:             Optional. Dictionary ``{voucher_code: {'reading_frame': 2}}``
+                              or function taking the voucher code and returning
+                              such a dictionary, to override the arguments above
+                              for some records.
+
+    Returns:
+        (SeqRecordBatch): backed by the memory-mapped file, which is unmapped
+                          by ``close()`` or at the end of a ``with`` block.
+
+    """
+    if format not in FORMATS:
+        raise ValueError('format should be one of {0}.'.format(', '.join(FORMATS)))
+
+    with io.open(path, 'rb') as handle:
+        if not os.fstat(handle.fileno()).st_size:
+            return SeqRecordBatch.from_buffer(b'', [], [])
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if format == 'fasta':
+        index = _index_fasta(mapped)
+    else:
+        index = _index_phylip(mapped)
+
+    defaults = {'gene_code': gene_code, 'reading_frame': reading_frame, 'table': table}
+    columns = {'voucher_codes': [], 'gene_codes': [], 'reading_frames': [], 'tables': []}
+    offsets = []
+    lengths = []
+    for voucher_code, offset, length in index:
+        kwargs = _settings_for(voucher_code, defaults, settings)
+        offsets.append(offset)
+        lengths.append(length)
+        columns['voucher_codes'].append(voucher_code)
+        columns['gene_codes'].append(kwargs['gene_code'])
+        columns['reading_frames'].append(kwargs['reading_frame'])
+        columns['tables'].append(kwargs['table'])
+    return SeqRecordBatch.from_buffer(mapped, offsets, lengths, **columns)
+
+
+def _line_end(mapped, start):
+    """Position of the end of the line starting at ``start``, without the
+    line terminator and trailing spaces, and position of the next line.
+
+    """
+    end = mapped.find(b'\n', start)
+    if end == -1:
+        end = len(mapped)
+    next_line = end + 1
+    while end > start and mapped[end - 1:end] in (b'\r', b' ', b'\t'):
+        end -= 1
+    return end, next_line
+
+
+def _index_fasta(mapped):
+    position = 0
+    size = len(mapped)
+    while position < size:
+        end, next_line = _line_end(mapped, position)
+        if end == position:  # blank line
+            position = next_line
+            continue
+        if mapped[position:position + 1] != b'>':
+            raise ValueError('Sequences of memory-mapped FASTA files should be on a single line.')
+        header = mapped[position + 1:end].decode('ascii').strip()
+        voucher_code = header.split(None, 1)[0] if header else ''
+
+        start = next_line
+        end, next_line = _line_end(mapped, start) if start < size else (size, size)
+        yield voucher_code, start, end - start
+        position = next_line
+
+
+def _index_phylip(mapped):
+    end, position = _line_end(mapped, 0)
+    nchar = int(mapped[0:end].split()[1])
+    size = len(mapped)
+    while position < size:
+        end, next_line = _line_end(mapped, position)
+        if end > position:
+            if end - position <= nchar:
+                raise ValueError('Sequences of memory-mapped PHYLIP files should be on a single line.')
+            start = end - nchar
+            if mapped[start - 1:start] not in (b' ', b'\t') or \
+                    mapped.find(b' ', start, end) != -1 or mapped.find(b'\t', start, end) != -1:
+                raise ValueError('Sequences of memory-mapped PHYLIP files should have {0} '
+                                 'characters without spaces after the name.'.format(nchar))
+            voucher_code = mapped[position:start].decode('ascii').strip()
+            yield voucher_code, start, nchar
+        position = next_line
@@ -0,0 +1,126 @@
+import multiprocessing
+import warnings
+
+from .seqrecord import CompactSeqRecordExpanded, _SeqRecordMethods
+
+
+class RecordResult(object):
+    """Outcome of processing one record with ``process_records``.
+
+    Attributes:
+        voucher_code:     Code of voucher that the sequence belongs to.
+        gene_code:        Gene code.
+        codon_positions:  String, or None if not requested or failed.
+        degenerated:      String, or None if not requested or failed.
+        translated:       String, or None if not requested or failed.
+        warnings:         List of warning messages issued for this record.
+        errors:           List of exceptions raised for this record, such as
+                          ``TranslationErrorMixedGappedSeq``.
+
+    """
+    def __init__(self, voucher_code=None, gene_code=None):
+        self.voucher_code = voucher_code
+        self.gene_code = gene_code
+        self.codon_positions = None
+        self.degenerated = None
+        self.translated = None
+        self.warnings = []
+        self.errors = []
+
+    @property
+    def ok(self):
+        return not self.errors
+
+
+def _as_task(item):
+    """Records are sent to the workers as plain tuples, which are much
+    cheaper to pickle than ``Bio.Seq.Seq`` objects.
+
+    """
+    if isinstance(item, _SeqRecordMethods):
+        return (item._sequence_string(), item.reading_frame, item.table, item.gene_code,
+                item.voucher_code)
+    return tuple(item)
+
+
+def _process_task(task, codon_positions, degenerate, translate):
+    seq, reading_frame, table, gene_code, voucher_code = task
+    result = RecordResult(voucher_code=voucher_code, gene_code=gene_code)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        record = CompactSeqRecordExpanded(seq, reading_frame=reading_frame, table=table,
+                                          gene_code=gene_code, voucher_code=voucher_code)
+        if codon_positions:
+            try:
+                result.codon_positions = record.codon_positions(codon_positions)
+            except Exception as e:
+                result.errors.append(e)
+        if degenerate:
+            try:
+                method = None if degenerate is True else degenerate
+                result.degenerated = record.degenerate(method=method)
+            except Exception as e:
+                result.errors.append(e)
+        if translate:
+            try:
+                table = None if translate is True else translate
+                result.translated = record.translate(table=table)
+            except Exception as e:
+                result.errors.append(e)
+
+    for warning in caught:
+        message = str(warning.message)
+        if message not in result.warnings:
+            result.warnings.append(message)
+    return result
+
+
+class _Worker(object):
+    def __init__(self, codon_positions, degenerate, translate):
+        self.codon_positions = codon_positions
+        self.degenerate = degenerate
+        self.translate = translate
+
+    def __call__(self, task):
+        return _process_task(task, self.codon_positions, self.degenerate, self.translate)
+
+
+def process_records(records, codon_positions=None, degenerate=None, translate=None,
+                    processes=None, chunksize=64):
+    """Degenerates, translates and splits codon positions of many records
+    using a pool of processes.
+
+    Errors and warnings do not stop the batch, they are collected in the
+    ``RecordResult`` of each record.
+
+    Parameters:
+        records (iterable):    SeqRecordExpanded or CompactSeqRecordExpanded
+                               instances, or tuples
+                               ``(seq, reading_frame, table, gene_code, voucher_code)``.
+        codon_positions (str): Optional. "1", "2", "3", "12", "13", "23" or "123".
+        degenerate:            Optional. ``True`` to use the translation table of
+                               each record, or a method: S, Z, SZ, normal.
+        translate:             Optional. ``True`` to use the translation table of
+                               each record, or the NCBI code of a table.
+        processes (int):       Size of the pool. Defaults to the number of CPUs.
+                               Use 1 to process the records in this process.
+        chunksize (int):       Number of records sent to a worker at a time.
+
+    Returns:
+        (list): RecordResult instances, in the same order as ``records``.
+
+    """
+    worker = _Worker(codon_positions, degenerate, translate)
+    tasks = (_as_task(item) for item in records)
+
+    if processes == 1:
+        return [worker(task) for task in tasks]
+
+    pool = multiprocessing.Pool(processes)
+    try:
+        results = list(pool.imap(worker, tasks, chunksize))
+    finally:
+        pool.close()
+        pool.join()
+    return results
@@ -0,0 +1,148 @@
+import io
+import re
+
+import six
+
+from .seqrecord import SeqRecordExpanded
+
+
+FORMATS = ('fasta', 'phylip', 'nexus')
+
+_NEXUS_COMMENT = re.compile(r'\[[^\]]*\]')
+
+
+def read_records(handle, format='fasta', gene_code=None, reading_frame=None, table=None,
+                 settings=None):
+    """Reads an alignment and yields SeqRecordExpanded instances one at a time.
+
+    Only the record being parsed is kept in memory, so memory use does not
+    grow with the number of taxa in the alignment.
+
+    Parameters:
+        handle:               path to the alignment file, or file-like object.
+        format (str):         fasta, phylip (relaxed, sequential) or nexus
+                              (non interleaved matrix).
+        gene_code (str):      gene code for all records of the file.
+        reading_frame (int):  1, 2 or 3, for all records of the file.
+        table (int):          NCBI code for translation table, for all records
+                              of the file.
+        settings:             Optional. Dictionary ``{voucher_code: {'reading_frame': 2}}``
+                              or function taking the voucher code and returning
+                              such a dictionary, to override the arguments above
+                              for some records.
+
+    Yields:
+        SeqRecordExpanded: using the first word of the FASTA header or the
+        taxon name as ``voucher_code``.
+
+    """
+    if format not in FORMATS:
+        raise ValueError('format should be one of {0}.'.format(', '.join(FORMATS)))
+    parser = {'fasta': _parse_fasta, 'phylip': _parse_phylip, 'nexus': _parse_nexus}[format]
+
+    defaults = {'gene_code': gene_code, 'reading_frame': reading_frame, 'table': table}
+    if isinstance(handle, six.string_types):
+        handle = io.open(handle, 'r')
+        close = True
+    else:
+        close = False
+
+    try:
+        for voucher_code, seq in parser(handle):
+            kwargs = _settings_for(voucher_code, defaults, settings)
+            yield SeqRecordExpanded(seq, voucher_code=voucher_code, **kwargs)
+    finally:
+        if close:
+            handle.close()
+
+
+def _settings_for(voucher_code, defaults, settings):
+    kwargs = dict(defaults)
+    if callable(settings):
+        kwargs.update(settings(voucher_code) or {})
+    elif settings:
+        kwargs.update(settings.get(voucher_code, {}))
+    return kwargs
+
+
+def _parse_fasta(handle):
+    voucher_code = None
+    chunks = []
+    for line in handle:
+        line = line.strip()
+        if line.startswith('>'):
+            if voucher_code is not None:
+                yield voucher_code, ''.join(chunks)
+            voucher_code = line[1:].split(None, 1)[0] if line[1:].strip() else ''
+            chunks = []
+        elif line:
+            if voucher_code is None:
+                raise ValueError('FASTA file should start with a header line.')
+            chunks.append(line)
+    if voucher_code is not None:
+        yield voucher_code, ''.join(chunks)
+
+
+def _parse_phylip(handle):
+    nchar = None
+    voucher_code = None
+    chunks = []
+    length = 0
+    for line in handle:
+        line = line.strip()
+        if not line:
+            continue
+        if nchar is None:
+            nchar = int(line.split()[1])
+            continue
+        if voucher_code is None:
+            fields = line.split()
+            voucher_code = fields[0]
+            chunks = fields[1:]
+        else:
+            chunks.extend(line.split())
+        length = sum(len(chunk) for chunk in chunks)
+        if length >= nchar:
+            yield voucher_code, ''.join(chunks)
+            voucher_code = None
+            chunks = []
+    if voucher_code is not None:
+        raise ValueError('Sequence of {0} is shorter than {1} characters.'.format(voucher_code, nchar))
+
+
+def _parse_nexus(handle):
+    in_matrix = False
+    seen = set()
+    for line in handle:
+        line = _NEXUS_COMMENT.sub('', line).strip()
+        if not in_matrix:
+            fields = line.split(None, 1)
+            if not fields or fields[0].lower() != 'matrix':
+                continue
+            # the first row can follow MATRIX on the same line
+            in_matrix = True
+            line = fields[1] if len(fields) > 1 else ''
+        if not line:
+            continue
+
+        end = line.endswith(';')
+        line = line.rstrip(';').strip()
+        if line:
+            voucher_code, seq = _split_nexus_row(line)
+            if voucher_code in seen:
+                raise ValueError('Interleaved NEXUS matrices cannot be streamed, '
+                                 '{0} appears more than once.'.format(voucher_code))
+            seen.add(voucher_code)
+            yield voucher_code, seq
+        if end:
+            return
+    if not in_matrix:
+        raise ValueError('NEXUS file has no MATRIX command.')
+
+
+def _split_nexus_row(line):
+    if line.startswith("'"):
+        end = line.index("'", 1)
+        return line[1:end], ''.join(line[end + 1:].split())
+    fields = line.split()
+    return fields[0], ''.join(fields[1:])
@@ -1,93 +1,164 @@
-import re
 import warnings
 
-from Bio.Alphabet import IUPAC
-from Bio.Data.CodonTable import TranslationError
-from Bio.Seq import Seq
+import six
 
-from degenerate_dna import Degenera
-
-from .utils import chain_and_flatten
+# Biopython, degenerate_dna and NumPy are imported on first use so that
+# importing the package stays fast for jobs that only need codon positions.
+from .cache import get_result_cache, sequence_digest
+from .codons import CODON_POSITION_OFFSETS, select_codon_positions, TRANSLATION_OFFSETS
+from .utils import clean_taxon_name
 from .exceptions import MissingParameterError, TranslationErrorMixedGappedSeq
+from .instrumentation import instrument_methods, instrumented, record_size, sequence_size
 from ._warnings import SeqRecordExpandedWarning
 
 
-class SeqRecordExpanded(object):
-    """Creates an Expanded SeqRecord.
+@instrumented('seqrecord.seq_construction', size=sequence_size)
+def _make_seq(seq):
+    from Bio.Alphabet import IUPAC
+    from Bio.Seq import Seq
+    return Seq(seq, alphabet=IUPAC.ambiguous_dna)
 
-    Assumes DNA ambiguous sequence.
 
-    Parameters:
-        seq (str):            DNA sequence
-        voucher_code (str):   code of voucher that the sequence belongs to
-        taxonomy (dict):      ``{'genus': 'Aus', 'species': 'bus'}``
-        lineage (str):        ``Eukaryota; Metazoa; Ecdysozoa; Arthropoda; Hexapoda; Insecta;
-                              Pterygota; Neoptera; Holometabola; Lepidoptera; Glossata; Ditrysia;
-                              Papilionoidea; Nymphalidae; Satyrinae; Satyrini; Euptychiina;``
-        gene_code (str):      gene code
-        reading_frame (int):  1, 2 or 3.
-        table (int):          NCBI code for translation table
-        accession_number (str)
-
-    Attributes:
-        seq:               DNA sequence as string
-        voucher_code:      Code of voucher tha the sequence belongs to.
-        taxonomy:          Dictionary ``{'genus': 'Aus', 'species': 'bus'}``.
-        lineage:           string
-        gene_code:         Gene code.
-        reading_frame:     1, 2 or 3.
-        table:             NCBI code for translation table.
-        warnings:          List.
-        accession_number:  NCBI accession number as string
+@instrument_methods
+class _SeqRecordMethods(object):
+    """Methods shared by SeqRecordExpanded and CompactSeqRecordExpanded.
 
-    Raises:
-        MissingParameterError:  if user wants either first, second, third or
-                                first and second codon positions and
-                                ``reading_frame`` is not specified.
+    The sequence is kept as the given string and the Biopython ``Seq``
+    object is only built when ``seq`` is accessed. The offsets of the
+    reading frame are set along with it, and the in-frame views and codon
+    positions of the sequence are kept in ``_cache`` until ``seq`` or
+    ``reading_frame`` change, so the sequence itself is never trimmed.
 
     """
-    def __init__(self, seq=None, voucher_code=None, taxonomy=None, lineage=None,
-                 gene_code=None, reading_frame=None, table=None, accession_number=None):
-        self.warnings = []
-        self.seq = Seq(
-            seq.replace("-", "?"),
-            alphabet=IUPAC.ambiguous_dna,
-        )
-        self.voucher_code = voucher_code
-        self.taxonomy = ""
-        self.lineage = lineage
-        self.gene_code = gene_code
-        self.reading_frame = reading_frame
-        self.table = table
-        self.accession_number = accession_number
-        self._sequence_was_corrected = None
-        self._clean_taxonomy(taxonomy)
+    __slots__ = ()
+
+    @property
+    def reading_frame(self):
+        return self._reading_frame
+
+    @reading_frame.setter
+    def reading_frame(self, value):
+        # offsets and results computed for the previous frame are no longer valid
+        self._reading_frame = value
+        if value in (1, 2, 3):
+            self._codon_offset = CODON_POSITION_OFFSETS[value]
+            self._translation_offset = TRANSLATION_OFFSETS[value]
+        else:
+            self._codon_offset = self._translation_offset = None
+        self._cache = None
+
+    @property
+    def seq(self):
+        if self._seq is None:
+            self._seq = _make_seq(self._sequence_string())
+        return self._seq
+
+    @seq.setter
+    def seq(self, value):
+        # results computed from the previous sequence are no longer valid
+        if isinstance(value, (six.text_type, bytes)):
+            self._seq = None
+        else:
+            self._seq = value
+            value = str(value)
+        self._data = value
+        self._cache = None
+
+    def _sequence_string(self):
+        if isinstance(self._data, str):
+            return self._data
+        return self._data.decode('ascii')
+
+    def _sequence_length(self):
+        return len(self._data)
+
+    def _cached(self, key, function, *args):
+        if self._cache is None:
+            self._cache = dict()
+        if key not in self._cache:
+            self._cache[key] = function(*args)
+        return self._cache[key]
+
+    def _frame_offsets(self):
+        """Leading bases to skip for codon positions and for translation,
+        see ``CODON_POSITION_OFFSETS`` and ``TRANSLATION_OFFSETS``.
 
-    def _clean_taxonomy(self, taxonomy):
-        self.taxonomy = dict()
-        if taxonomy:
-            for key, value in taxonomy.items():
-                # remove special characters so Biopython will not choke on them.
-                self.taxonomy[key] = re.sub("\W", "_", value)
+        Returns:
+            (tuple): both offsets, or ``(None, None)`` if ``reading_frame`` is None.
+
+        Raises:
+            ValueError:  if ``reading_frame`` is not 1, 2, 3 or None.
 
-    def first_codon_position(self):
         """
-        :return: string containing the first positions of each codon.
+        if self._codon_offset is None:
+            self._check_reading_frame()
+        return self._codon_offset, self._translation_offset
+
+    def _in_frame(self, offset):
+        return self._cached(('in_frame', offset), self._sequence_from, offset)
 
+    def _sequence_from(self, offset):
+        return self._sequence_string()[offset:]
+
+    def in_frame_sequence(self):
         """
-        self._check_reading_frame()
+        Returns:
+            (str): the sequence starting at the first codon position. Kept
+                   until ``seq`` or ``reading_frame`` change.
 
-        seq = str(self.seq)
-        if self.reading_frame == 1:
-            pass
-        elif self.reading_frame == 2:
-            seq = seq[2:]
-        elif self.reading_frame == 3:
-            seq = seq[1:]
-        else:  # None
+        Raises:
+            MissingParameterError:  if ``reading_frame`` is not specified.
+
+        """
+        offset = self._frame_offsets()[0]
+        if offset is None:
             raise MissingParameterError('reading_frame attribute for gene {0} '
                                         'should be either 1, 2 or 3.'.format(self.gene_code))
-        return seq[::3]
+        return self._in_frame(offset)
+
+    @instrumented('record.codon_positions', size=record_size)
+    def codon_positions(self, positions='123'):
+        """
+        Parameters:
+            positions (str):  "1", "2", "3", "12", "13", "23" or "123".
+
+        Returns:
+            (str): string containing the requested positions of each codon.
+                   Kept until ``seq`` or ``reading_frame`` change.
+
+        """
+        key = ('positions', positions)
+        cache = self._cache
+        if cache is not None and key in cache:
+            return cache[key]
+        return self._cached(key, select_codon_positions, self.in_frame_sequence(), positions)
+
+    def windows(self, size, step=None, positions='123'):
+        """Windows over a codon position subset, as NumPy views instead of
+        strings.
+
+        Parameters:
+            size (int):       number of sites of each window.
+            step (int):       sites between the starts of two windows. Defaults
+                              to ``size``.
+            positions (str):  "1", "2", "3", "12", "13", "23" or "123".
+
+        Returns:
+            (numpy.ndarray): read-only ``uint8`` view with one window per row,
+                             see ``windows.sliding_windows``.
+
+        """
+        from .windows import as_array, codon_position_view, sliding_windows
+
+        array = self._cached('in_frame_array', as_array, self.in_frame_sequence())
+        return sliding_windows(codon_position_view(array, positions), size, step)
+
+    def first_codon_position(self):
+        """
+        :return: string containing the first positions of each codon.
+
+        """
+        return self.codon_positions('1')
 
     def _check_reading_frame(self):
         """Raises errors if reading frame is not integer and is not 1, 2, 3 or None.
@@ -101,93 +172,108 @@ class SeqRecordExpanded(object):
         :return: string containing the second positions of each codon.
 
         """
-        self._check_reading_frame()
-
-        seq = str(self.seq)
-        if self.reading_frame == 1:
-            pass
-        elif self.reading_frame == 2:
-            seq = seq[2:]
-        elif self.reading_frame == 3:
-            seq = seq[1:]
-        else:  # None
-            raise MissingParameterError('reading_frame attribute for gene {0} '
-                                        'should be either 1, 2 or 3.'.format(self.gene_code))
-        return seq[1::3]
+        return self.codon_positions('2')
 
     def third_codon_position(self):
         """
         :return: string containing the third positions of each codon.
 
         """
-        self._check_reading_frame()
-
-        seq = str(self.seq)
-        if self.reading_frame == 1:
-            pass
-        elif self.reading_frame == 2:
-            seq = seq[2:]
-        elif self.reading_frame == 3:
-            seq = seq[1:]
-        else:  # None
-            raise MissingParameterError('reading_frame attribute for gene {0} '
-                                        'should be either 1, 2 or 3.'.format(self.gene_code))
-        return seq[2::3]
+        return self.codon_positions('3')
 
     def first_and_second_codon_positions(self):
         """
         :return: string containing both positions of each codon.
 
         """
-        return chain_and_flatten(self.first_codon_position(), self.second_codon_position())
+        return self.codon_positions('12')
+
+    @instrumented('record.stats', size=record_size)
+    def stats(self):
+        """
+        Returns:
+            (SequenceStats): base composition, missing data and GC content of
+                             the whole sequence and of each codon position.
+                             Kept until ``seq`` or ``reading_frame`` change.
+
+        """
+        return self._cached('stats', self._stats)
+
+    def _stats(self):
+        import numpy as np
+        from .stats import count_symbols, reading_frame_shift, SequenceStats
 
+        seq = self._sequence_string().encode('ascii')
+        counts = count_symbols(np.frombuffer(seq, dtype=np.uint8), [0], [len(seq)],
+                               [reading_frame_shift(self.reading_frame)])
+        return SequenceStats(counts[0])
+
+    @instrumented('record.degenerate', size=record_size)
     def degenerate(self, method=None):
         """
         Parameters:
             method (str):   S, Z, SZ, normal
 
         Returns:
-            (str): Degenerated sequence using Zwick et al methods.
+            (str): Degenerated sequence using Zwick et al methods. The result is
+                   kept until ``seq`` or ``reading_frame`` change.
 
         """
-        self._check_reading_frame()
-        self._correct_seq_based_on_reading_frame()
+        from .degeneration import degenerate
 
-        if not method:
-            table = self.table
-            method = 'normal'
-        else:
-            table = 1
-            method = method
+        seq = self._translation_sequence()
+        table, method = self._degeneration_parameters(method)
+        key = ('degenerate', table, method)
+        return self._cached(key, self._persisted, key, degenerate, seq, table, method)
 
-        res = Degenera(dna=str(self.seq), table=table, method=method)
-        res.degenerate()
-        return res.degenerated
+    def _persisted(self, operation, function, *args):
+        """Calls ``function(*args)`` unless its result is already in the
+        cache set with ``use_result_cache``.
 
-    def _correct_seq_based_on_reading_frame(self):
-        """Trims leading end of `self.seq`.
+        """
+        result_cache, key = self._result_cache_key(operation)
+        if result_cache is None:
+            return function(*args)
+        return result_cache.fetch(key, function, *args)
 
-        If the reading frame does not start in 1st codon position of the
-        sequence.
+    def _result_cache_key(self, operation):
+        """
+        :return: the cache set with ``use_result_cache`` and the key of
+                 ``operation`` for this record, or ``(None, None)``.
 
         """
-        if not self._sequence_was_corrected:
-            self._sequence_was_corrected = True
+        result_cache = get_result_cache()
+        if result_cache is None:
+            return None, None
+        digest = self._cached('digest', sequence_digest, self._sequence_string())
+        return result_cache, result_cache.key(digest, self.reading_frame, operation)
+
+    def _degeneration_parameters(self, method):
+        if not method:
+            return self.table, 'normal'
+        return 1, method
 
-            if self.reading_frame == 1:
-                pass
-            elif self.reading_frame == 2:
-                self.seq = self.seq[1:]
-            elif self.reading_frame == 3:
-                self.seq = self.seq[2:]
-            else:  # reading_frame is None
-                self.seq = '?'
-                msg = 'reading_frame attribute should be either 1, 2 or 3.'
-                warnings.warn(msg, SeqRecordExpandedWarning)
-                self.warnings.append(msg)
+    def _translation_sequence(self):
+        """In-frame view used by ``translate()`` and ``degenerate()``.
 
+        It is ``?`` if the reading frame is not specified, warning only
+        the first time.
+
+        """
+        offset = self._frame_offsets()[1]
+        if offset is not None:
+            return self._in_frame(offset)
+        return self._cached(('in_frame', None), self._missing_reading_frame)
+
+    def _missing_reading_frame(self):
+        msg = 'reading_frame attribute should be either 1, 2 or 3.'
+        warnings.warn(msg, SeqRecordExpandedWarning)
+        self.warnings.append(msg)
+        return '?'
+
+    @instrumented('record.translate', size=record_size)
     def translate(self, table=None):
-        """Uses BioPython translation method into Aminoacid sequence.
+        """Translates into Aminoacid sequence using a precompiled codon table.
 
         Parameters:
             table (int): Optional. It can be specified when creating the class instance.
@@ -196,27 +282,163 @@ class SeqRecordExpanded(object):
             (str): Aminoacid sequence.
 
         """
+        from Bio.Data.CodonTable import TranslationError
+
         if not table:
             table = self.table
 
         self._check_reading_frame()
         self._check_translation_table(table)
-        self._correct_seq_based_on_reading_frame()
+        seq = self._translation_sequence()
 
-        new_seq = Seq(str(self.seq).replace('?', 'N'), alphabet=IUPAC.ambiguous_dna)
         try:
-            translated_seq = self._translate(new_seq, table)
+            translated_seq = self._persisted(('translate', table), self._translate, seq, table)
         except TranslationError as e:
             raise TranslationErrorMixedGappedSeq(self.voucher_code, self.gene_code, e)
         return translated_seq
 
-    def _translate(self, new_seq, table):
+    def codon_alignment(self, aligned_protein):
+        """Threads the sequence onto its aligned protein, such as an
+        alignment of ``translate()`` output.
+
+        Parameters:
+            aligned_protein (str):  translation of the sequence with gaps ``-`` or ``.``.
+
+        Returns:
+            (str): codon-aligned DNA in the frame used by ``translate()``, with
+                   ``???`` for each gap.
+
+        Raises:
+            MissingParameterError:  if ``reading_frame`` is not specified.
+            ValueError:             if the number of residues is not the number
+                                    of codons.
+
+        """
+        from .codon_alignment import thread_codons
+
+        offset = self._frame_offsets()[1]
+        if offset is None:
+            raise MissingParameterError('reading_frame attribute for gene {0} '
+                                        'should be either 1, 2 or 3.'.format(self.gene_code))
+        return thread_codons(self._in_frame(offset), aligned_protein,
+                             self.voucher_code, self.gene_code)
+
+    def _translate(self, seq, table):
+        from .translation import get_codon_table
+
         if not table:
-            return str(new_seq.translate(table=self.table, gap="-"))
+            return get_codon_table(self.table).translate(seq)
         else:
-            return str(new_seq.translate(table=table, gap="-"))
+            return get_codon_table(table).translate(seq)
 
     def _check_translation_table(self, table):
         if self.table is None and table is None:
             raise MissingParameterError('It is necessary to specify the translation'
                                         ' table to use: seq_record.translate(table=1)')
+
+
+@instrument_methods
+class SeqRecordExpanded(_SeqRecordMethods):
+    """Creates an Expanded SeqRecord.
+
+    Assumes DNA ambiguous sequence.
+
+    Parameters:
+        seq (str):            DNA sequence
+        voucher_code (str):   code of voucher that the sequence belongs to
+        taxonomy (dict):      ``{'genus': 'Aus', 'species': 'bus'}``
+        lineage (str):        ``Eukaryota; Metazoa; Ecdysozoa; Arthropoda; Hexapoda; Insecta;
+                              Pterygota; Neoptera; Holometabola; Lepidoptera; Glossata; Ditrysia;
+                              Papilionoidea; Nymphalidae; Satyrinae; Satyrini; Euptychiina;``
+        gene_code (str):      gene code
+        reading_frame (int):  1, 2 or 3.
+        table (int):          NCBI code for translation table
+        accession_number (str)
+
+    Attributes:
+        seq:               DNA sequence as string
+        voucher_code:      Code of voucher tha the sequence belongs to.
+        taxonomy:          Dictionary ``{'genus': 'Aus', 'species': 'bus'}``.
+        lineage:           string
+        gene_code:         Gene code.
+        reading_frame:     1, 2 or 3.
+        table:             NCBI code for translation table.
+        warnings:          List.
+        accession_number:  NCBI accession number as string
+
+    Raises:
+        MissingParameterError:  if user wants either first, second, third or
+                                first and second codon positions and
+                                ``reading_frame`` is not specified.
+
+    """
+    @instrumented('record.init', size=lambda self, seq=None, *args, **kwargs: sequence_size(seq))
+    def __init__(self, seq=None, voucher_code=None, taxonomy=None, lineage=None,
+                 gene_code=None, reading_frame=None, table=None, accession_number=None):
+        self.warnings = []
+        self.seq = seq.replace("-", "?")
+        self.voucher_code = voucher_code
+        self.taxonomy = ""
+        self.lineage = lineage
+        self.gene_code = gene_code
+        self.reading_frame = reading_frame
+        self.table = table
+        self.accession_number = accession_number
+        self._clean_taxonomy(taxonomy)
+
+    @instrumented('record.clean_taxonomy')
+    def _clean_taxonomy(self, taxonomy):
+        self.taxonomy = dict()
+        if taxonomy:
+            for key, value in taxonomy.items():
+                # remove special characters so Biopython will not choke on them.
+                self.taxonomy[key] = clean_taxon_name(value)
+
+
+@instrument_methods
+class CompactSeqRecordExpanded(_SeqRecordMethods):
+    """Lightweight version of SeqRecordExpanded for very large datasets.
+
+    Takes the same parameters and has the same methods and attributes, but
+    uses ``__slots__`` and also accepts the sequence as bytes. ``taxonomy``
+    and ``warnings`` are created on first use.
+
+    """
+    __slots__ = ('_data', '_seq', '_cache', '_taxonomy', '_warnings', 'voucher_code',
+                 'lineage', 'gene_code', '_reading_frame', '_codon_offset', '_translation_offset',
+                 'table', 'accession_number')
+
+    @instrumented('record.init', size=lambda self, seq=None, *args, **kwargs: sequence_size(seq))
+    def __init__(self, seq=None, voucher_code=None, taxonomy=None, lineage=None,
+                 gene_code=None, reading_frame=None, table=None, accession_number=None):
+        self._warnings = None
+        self.seq = seq.replace(b"-", b"?") if isinstance(seq, bytes) else seq.replace("-", "?")
+        self.voucher_code = voucher_code
+        self.lineage = lineage
+        self.gene_code = gene_code
+        self.reading_frame = reading_frame
+        self.table = table
+        self.accession_number = accession_number
+        self._taxonomy = None
+        if taxonomy:
+            self._taxonomy = dict((key, clean_taxon_name(value)) for key, value in taxonomy.items())
+
+    @property
+    def taxonomy(self):
+        if self._taxonomy is None:
+            self._taxonomy = dict()
+        return self._taxonomy
+
+    @taxonomy.setter
+    def taxonomy(self, value):
+        self._taxonomy = value
+
+    @property
+    def warnings(self):
+        if self._warnings is None:
+            self._warnings = []
+        return self._warnings
+
+    @warnings.setter
+    def warnings(self, value):
+        self._warnings = value
@@ -0,0 +1,161 @@
+import numpy as np
+
+from .codons import codon_columns, CODON_POSITION_OFFSETS
+
+
+#: Symbols counted by SequenceStats. Lower case letters are counted as upper
+#: case, gaps as ``?`` and anything else as ``other``.
+SYMBOLS = ('A', 'C', 'G', 'T', 'R', 'Y', 'S', 'W', 'K', 'M', 'B', 'D', 'H', 'V', 'N', '?',
+           'other')
+
+AMBIGUITY_CODES = ('R', 'Y', 'S', 'W', 'K', 'M', 'B', 'D', 'H', 'V')
+
+# Row of the counts used for bases outside the reading frame: those before
+# the first codon position, or all of them if the reading frame is unknown.
+_OUTSIDE_FRAME = 3
+
+_SYMBOL_CODES = np.full(256, SYMBOLS.index('other'), dtype=np.int64)
+for _index, _symbol in enumerate(SYMBOLS[:-1]):
+    _SYMBOL_CODES[ord(_symbol)] = _index
+    _SYMBOL_CODES[ord(_symbol.lower())] = _index
+_SYMBOL_CODES[ord('-')] = SYMBOLS.index('?')
+
+# Maximum number of bases counted at once.
+_COUNT_CHUNK = 1 << 22
+
+
+def reading_frame_shift(reading_frame):
+    """Codon position offset of a reading frame, or -1 if it is None.
+
+    Raises:
+        ValueError:  if ``reading_frame`` is not 1, 2, 3 or None.
+
+    """
+    if reading_frame not in [1, 2, 3, None]:
+        raise ValueError("The reading_frame attribute should be either 1, 2, 3 or None.")
+    if reading_frame is None:
+        return -1
+    return CODON_POSITION_OFFSETS[reading_frame]
+
+
+def count_symbols(buffer, offsets, lengths, shifts):
+    """Counts every symbol of many sequences, per codon position, in one pass.
+
+    Parameters:
+        buffer:   ``numpy.uint8`` array with the sequences.
+        offsets:  start of each sequence in ``buffer``.
+        lengths:  length of each sequence.
+        shifts:   codon position offset of each sequence, see
+                  ``reading_frame_shift``.
+
+    Returns:
+        (numpy.ndarray): ``int64`` array of shape ``(len(offsets), 4, len(SYMBOLS))``.
+        Rows 0, 1 and 2 hold the first, second and third codon positions and
+        row 3 the bases outside the reading frame.
+
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    shifts = np.asarray(shifts, dtype=np.int64)
+    counts = np.zeros((len(offsets), 4, len(SYMBOLS)), dtype=np.int64)
+
+    first = 0
+    while first < len(offsets):
+        last = first + 1
+        total = lengths[first]
+        while last < len(offsets) and total + lengths[last] <= _COUNT_CHUNK:
+            total += lengths[last]
+            last += 1
+
+        chunk_lengths = lengths[first:last]
+        records = np.repeat(np.arange(last - first), chunk_lengths)
+        within = np.arange(total) - np.repeat(np.cumsum(chunk_lengths) - chunk_lengths, chunk_lengths)
+        symbols = _SYMBOL_CODES[buffer[np.repeat(offsets[first:last], chunk_lengths) + within]]
+
+        shift = shifts[first:last][records]
+        relative = within - shift
+        rows = np.where((shift < 0) | (relative < 0), _OUTSIDE_FRAME, relative % 3)
+
+        keys = (records * 4 + rows) * len(SYMBOLS) + symbols
+        counts[first:last] = np.bincount(
+            keys, minlength=(last - first) * 4 * len(SYMBOLS)).reshape(-1, 4, len(SYMBOLS))
+        first = last
+    return counts
+
+
+class SequenceStats(object):
+    """Base composition, missing data and GC content of a sequence, for the
+    whole sequence or per codon position.
+
+    Methods take ``positions``: None for the whole sequence, or a codon
+    position subset such as "1", "3" or "12". Codon position values are
+    ``nan`` if the reading frame is unknown.
+
+    When built for a SeqRecordBatch, values are NumPy arrays with one item
+    per record instead of numbers.
+
+    Parameters:
+        counts (numpy.ndarray):  as returned by ``count_symbols``, for one
+                                 record or for many.
+
+    """
+    def __init__(self, counts):
+        self.counts = counts
+
+    def _counts(self, positions=None):
+        if positions is None:
+            return self.counts.sum(axis=-2)
+        return self.counts[..., list(codon_columns(positions)), :].sum(axis=-2)
+
+    def _fraction(self, numerator, denominator):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return numerator / np.asarray(denominator, dtype=np.float64)
+
+    def length(self, positions=None):
+        return self._counts(positions).sum(axis=-1)
+
+    def composition(self, positions=None):
+        """
+        :return: dictionary ``{'A': 10, 'C': 4, ...}`` with counts of each symbol.
+
+        """
+        counts = self._counts(positions)
+        return dict((symbol, counts[..., index]) for index, symbol in enumerate(SYMBOLS))
+
+    def missing_fraction(self, positions=None):
+        """Fraction of ``?``, which includes gaps."""
+        counts = self._counts(positions)
+        return self._fraction(counts[..., SYMBOLS.index('?')], counts.sum(axis=-1))
+
+    def n_fraction(self, positions=None):
+        counts = self._counts(positions)
+        return self._fraction(counts[..., SYMBOLS.index('N')], counts.sum(axis=-1))
+
+    def ambiguous_fraction(self, positions=None):
+        """Fraction of IUPAC ambiguity codes other than N."""
+        counts = self._counts(positions)
+        ambiguous = counts[..., [SYMBOLS.index(i) for i in AMBIGUITY_CODES]].sum(axis=-1)
+        return self._fraction(ambiguous, counts.sum(axis=-1))
+
+    def gc_content(self, positions=None):
+        """Fraction of G and C among the unambiguous bases A, C, G and T."""
+        counts = self._counts(positions)
+        return self._fraction(counts[..., 1] + counts[..., 2], counts[..., :4].sum(axis=-1))
+
+    def as_dict(self):
+        """
+        :return: dictionary with all values for the whole sequence and each
+                 codon position, keyed by ``None``, "1", "2" and "3".
+
+        """
+        out = dict()
+        for positions in (None, '1', '2', '3'):
+            out[positions] = {
+                'length': self.length(positions),
+                'composition': self.composition(positions),
+                'missing_fraction': self.missing_fraction(positions),
+                'n_fraction': self.n_fraction(positions),
+                'ambiguous_fraction': self.ambiguous_fraction(positions),
+                'gc_content': self.gc_content(positions),
+            }
+        return out
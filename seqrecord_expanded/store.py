@@ -0,0 +1,112 @@
+from .seqrecord import CompactSeqRecordExpanded
+
+
+class RecordStore(object):
+    """Keeps each distinct (sequence, reading_frame, table) only once.
+
+    Records added to the store refer to the sequence string of a shared
+    entry and share its cache of in-frame views and ``degenerate()``
+    results. The methods of the store compute each result once per entry
+    and return it for every record, in the order they were added.
+
+    A record whose ``seq``, ``reading_frame`` or ``table`` is changed after
+    being added stops sharing and is computed on its own. Errors and
+    warnings name the first voucher added for each entry.
+
+    Parameters:
+        seq_records (iterable):  Optional. SeqRecordExpanded or CompactSeqRecordExpanded instances.
+
+    Attributes:
+        records:   List of added records.
+        entries:   List of CompactSeqRecordExpanded, one per distinct
+                   (sequence, reading_frame, table).
+
+    """
+    def __init__(self, seq_records=None):
+        self.records = []
+        self.entries = []
+        self._keys = dict()
+        self._indexes = []
+        for seq_record in seq_records or []:
+            self.add(seq_record)
+
+    def __len__(self):
+        return len(self.records)
+
+    def add(self, seq_record):
+        """Adds a record, making it share the entry of identical records.
+
+        Returns:
+            (CompactSeqRecordExpanded): the shared entry.
+
+        """
+        key = (seq_record._sequence_string(), seq_record.reading_frame, seq_record.table)
+        index = self._keys.get(key)
+        if index is None:
+            index = len(self.entries)
+            entry = CompactSeqRecordExpanded(key[0], voucher_code=seq_record.voucher_code,
+                                             gene_code=seq_record.gene_code,
+                                             reading_frame=key[1], table=key[2])
+            entry._cache = dict()
+            self._keys[key] = index
+            self.entries.append(entry)
+        entry = self.entries[index]
+        seq_record._data = entry._data
+        seq_record._cache = entry._cache
+        self.records.append(seq_record)
+        self._indexes.append(index)
+        return entry
+
+    def _fan_out(self, function):
+        results = dict()
+        out = []
+        for seq_record, index in zip(self.records, self._indexes):
+            entry = self.entries[index]
+            if seq_record._cache is not entry._cache or seq_record.table != entry.table:
+                out.append(function(seq_record))
+                continue
+            if index not in results:
+                results[index] = function(entry)
+            out.append(results[index])
+        return out
+
+    def codon_positions(self, positions='123'):
+        """
+        Parameters:
+            positions (str):  "1", "2", "3", "12", "13", "23" or "123".
+
+        Returns:
+            (list): string with the requested codon positions of each record.
+
+        """
+        return self._fan_out(lambda seq_record: seq_record.codon_positions(positions))
+
+    def degenerate(self, method=None):
+        """
+        Parameters:
+            method (str):   S, Z, SZ, normal
+
+        Returns:
+            (list): Degenerated sequence of each record.
+
+        """
+        return self._fan_out(lambda seq_record: seq_record.degenerate(method))
+
+    def translate(self, table=None):
+        """
+        Parameters:
+            table (int): Optional. Overrides the translation table of each record.
+
+        Returns:
+            (list): Aminoacid sequence of each record.
+
+        """
+        return self._fan_out(lambda seq_record: seq_record.translate(table))
+
+    def stats(self):
+        """
+        Returns:
+            (list): SequenceStats of each record, shared by identical records.
+
+        """
+        return self._fan_out(lambda seq_record: seq_record.stats())
@@ -0,0 +1,136 @@
+import warnings
+
+from .codons import codon_columns
+from .writers import get_writer
+from ._warnings import SeqRecordExpandedWarning
+
+
+class SupermatrixBuilder(object):
+    """Concatenates the genes of many vouchers into one matrix with one
+    partition per gene, or per codon position subset of each gene.
+
+    Records can be added in any order and at any time, also after the
+    matrix has been written. Cells of vouchers lacking a gene are filled
+    with ``?``.
+
+    Parameters:
+        codon_positions (tuple):  Optional. Codon position subsets to split
+                                  each gene into, such as ``('1', '2', '3')``
+                                  or ``('12', '3')``. Records then need a
+                                  ``reading_frame``. By default each gene is
+                                  a single partition with the whole sequence.
+
+    Attributes:
+        genes:          List of gene codes, in the order they were added.
+        voucher_codes:  List of voucher codes, in the order they were added.
+
+    """
+    def __init__(self, codon_positions=None):
+        if codon_positions:
+            for positions in codon_positions:
+                codon_columns(positions)
+        self.codon_positions = tuple(codon_positions or ())
+        self.genes = []
+        self.voucher_codes = []
+        self._cells = dict()   # {gene_code: {voucher_code: [partition strings]}}
+        self._widths = dict()  # {gene_code: [partition widths]}
+        self._vouchers = set()
+
+    def add(self, seq_record):
+        """Adds the sequence of a voucher for one gene.
+
+        Only the cells of that gene change, the rest of the matrix is kept.
+
+        """
+        gene_code = seq_record.gene_code
+        voucher_code = seq_record.voucher_code
+        if self.codon_positions:
+            cells = [seq_record.codon_positions(positions) for positions in self.codon_positions]
+        else:
+            cells = [seq_record._sequence_string()]
+
+        if gene_code not in self._cells:
+            self.genes.append(gene_code)
+            self._cells[gene_code] = dict()
+            self._widths[gene_code] = [0] * len(cells)
+        if voucher_code not in self._vouchers:
+            self._vouchers.add(voucher_code)
+            self.voucher_codes.append(voucher_code)
+
+        gene = self._cells[gene_code]
+        if voucher_code in gene:
+            warnings.warn('Replacing sequence of voucher {0} for gene {1}.'.format(
+                voucher_code, gene_code), SeqRecordExpandedWarning)
+        gene[voucher_code] = cells
+
+        widths = self._widths[gene_code]
+        for index, cell in enumerate(cells):
+            if len(cell) > widths[index]:
+                widths[index] = len(cell)
+
+    def extend(self, seq_records):
+        for seq_record in seq_records:
+            self.add(seq_record)
+
+    def partition_names(self, gene_code):
+        if not self.codon_positions:
+            return [gene_code]
+        return ['{0}_pos{1}'.format(gene_code, positions) for positions in self.codon_positions]
+
+    def partitions(self):
+        """
+        Returns:
+            (list): ``[(name, start, end), ...]`` with 1-based, inclusive
+            boundaries such as ``('COI_pos1', 1, 220)``.
+
+        """
+        out = []
+        start = 1
+        for gene_code in self.genes:
+            for name, width in zip(self.partition_names(gene_code), self._widths[gene_code]):
+                out.append((name, start, start + width - 1))
+                start += width
+        return out
+
+    @property
+    def nchar(self):
+        return sum(sum(widths) for widths in self._widths.values())
+
+    def row(self, voucher_code):
+        """
+        :return: string with the concatenated genes of a voucher.
+
+        """
+        out = []
+        for gene_code in self.genes:
+            cells = self._cells[gene_code].get(voucher_code)
+            for index, width in enumerate(self._widths[gene_code]):
+                cell = cells[index] if cells else ''
+                out.append(cell)
+                if len(cell) < width:
+                    out.append('?' * (width - len(cell)))
+        return ''.join(out)
+
+    def write(self, handle, format='nexus'):
+        """Writes the matrix in a single pass over the vouchers.
+
+        Parameters:
+            handle:        file-like object opened for writing text.
+            format (str):  nexus, phylip, fasta or tnt. NEXUS files include
+                           the partitions as CHARSETs.
+
+        """
+        kwargs = dict(ntax=len(self.voucher_codes), nchar=self.nchar)
+        if format != 'fasta':
+            kwargs['name_width'] = max([len(i) for i in self.voucher_codes] + [0]) + 1
+        if format == 'nexus':
+            kwargs['charsets'] = self.partitions()
+
+        with get_writer(handle, format, **kwargs) as writer:
+            for voucher_code in self.voucher_codes:
+                writer.write(voucher_code, self.row(voucher_code))
+
+    def write_partitions(self, handle):
+        """Writes the partitions in RAxML format: ``DNA, COI_pos1 = 1-220``."""
+        handle.write(''.join('DNA, {0} = {1}-{2}\n'.format(*partition)
+                             for partition in self.partitions()))
@@ -0,0 +1,120 @@
+import itertools
+import warnings
+
+from Bio import BiopythonWarning
+from Bio.Data.CodonTable import TranslationError
+from Bio.Seq import translate as biopython_translate
+
+from .instrumentation import instrument_methods, instrumented
+
+
+# IUPAC ambiguous DNA and RNA letters plus the missing data and gap symbols.
+NUCLEOTIDES = 'ACGTURYSWKMBDHVN?-'
+
+PARTIAL_CODON_WARNING = ("Partial codon, len(sequence) not a multiple of three. "
+                         "Explicitly trim the sequence or add trailing N before "
+                         "translation. This may become an error in future.")
+
+_compiled_tables = {}
+
+
+@instrument_methods
+class CompiledCodonTable(object):
+    """Direct codon to aminoacid lookup for one NCBI translation table.
+
+    Every codon made of IUPAC ambiguous letters, ``?`` and ``-`` is
+    translated once with Biopython (``?`` as ``N``, ``-`` as gap) and
+    stored in a dictionary. Codons Biopython rejects, such as ``N--``, are
+    left out so that translating them raises ``TranslationError``.
+
+    Parameters:
+        table (int):  NCBI code for translation table.
+
+    Attributes:
+        table:     NCBI code for translation table.
+        lookup:    Dictionary ``{'TCT': 'S', 'NNN': 'X', '---': '-', ...}``.
+        warnings:  Messages Biopython issues for every translation with this
+                   table, such as those for dual coding stop codons.
+
+    """
+    @instrumented('translation.compile_table')
+    def __init__(self, table):
+        self.table = table
+        self.lookup = dict()
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for codon in itertools.product(NUCLEOTIDES, repeat=3):
+                codon = ''.join(codon)
+                try:
+                    amino_acid = biopython_translate(codon.replace('?', 'N'), table=table, gap='-')
+                except TranslationError:
+                    continue
+                self.lookup[codon] = str(amino_acid)
+
+        self.warnings = []
+        for warning in caught:
+            message = str(warning.message)
+            if message not in self.warnings:
+                self.warnings.append(message)
+
+    @instrumented('translation.translate', size=lambda self, seq: len(seq))
+    def translate(self, seq):
+        """Translates a DNA sequence. Trailing partial codons are dropped.
+
+        Parameters:
+            seq (str):  DNA sequence, already in frame.
+
+        Returns:
+            (str): Aminoacid sequence.
+
+        Raises:
+            TranslationError:  if a codon is invalid, such as ``N--``.
+
+        """
+        seq = str(seq).upper()
+        n = len(seq)
+
+        for message in self.warnings:
+            warnings.warn(message, BiopythonWarning)
+        if n % 3 != 0:
+            warnings.warn(PARTIAL_CODON_WARNING, BiopythonWarning)
+
+        lookup = self.lookup
+        try:
+            return ''.join([lookup[seq[i:i + 3]] for i in range(0, n - n % 3, 3)])
+        except KeyError as e:
+            codon = e.args[0].replace('?', 'N')
+            raise TranslationError("Codon '{0}' is invalid".format(codon))
+
+
+def get_codon_table(table):
+    """Compiles the translation table the first time it is requested and
+    reuses it afterwards.
+
+    Parameters:
+        table (int):  NCBI code for translation table.
+
+    Returns:
+        (CompiledCodonTable)
+
+    """
+    try:
+        return _compiled_tables[table]
+    except KeyError:
+        compiled = _compiled_tables[table] = CompiledCodonTable(table)
+        return compiled
+
+
+def translate(seq, table):
+    """Translates a DNA sequence that is already in frame.
+
+    Parameters:
+        seq (str):    DNA sequence. ``?`` is treated as ``N`` and ``-`` as gap.
+        table (int):  NCBI code for translation table.
+
+    Returns:
+        (str): Aminoacid sequence.
+
+    """
+    return get_codon_table(table).translate(seq)
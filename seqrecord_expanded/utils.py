@@ -1,12 +1,19 @@
 import itertools
+import re
+import threading
+from collections import OrderedDict
 
 import six
+from six.moves import intern
 if six.PY2:
     from six.moves import zip_longest
 else:
     from itertools import zip_longest
 
+from .instrumentation import instrumented
 
+
+@instrumented('utils.chain_and_flatten', size=lambda seq1, seq2: len(seq1) + len(seq2))
 def chain_and_flatten(seq1, seq2):
     """Takes two strings (first and second codon positions) and chains them.
 
@@ -16,3 +23,69 @@ def chain_and_flatten(seq1, seq2):
     my_chain = zip_longest(seq1, seq2)
     out = [i for i in itertools.chain.from_iterable(my_chain) if i]
     return ''.join(out)
+
+
+class LRUCache(object):
+    """Thread safe mapping that evicts the least recently used entries once
+    it holds ``maxsize`` items.
+
+    Parameters:
+        maxsize (int):  maximum number of entries.
+
+    """
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+_NON_WORD = re.compile(r"\W")
+
+# Cleaned taxon names, emptied when it reaches ``_TAXON_NAMES_MAXSIZE`` so
+# that the lookup of names already seen stays a plain dict lookup.
+_taxon_names = dict()
+_TAXON_NAMES_MAXSIZE = 65536
+
+
+def clean_taxon_name(value):
+    """Replaces special characters by underscores so Biopython will not choke
+    on them.
+
+    Cleaned names are interned and kept in a cache shared by all records, so
+    records of the same taxon share one string.
+
+    Returns:
+        (str): for example ``"bus___"`` for ``"bus(?)"``.
+    """
+    cleaned = _taxon_names.get(value)
+    if cleaned is None:
+        if len(_taxon_names) >= _TAXON_NAMES_MAXSIZE:
+            _taxon_names.clear()
+        cleaned = _taxon_names[value] = intern(str(_NON_WORD.sub("_", value)))
+    return cleaned
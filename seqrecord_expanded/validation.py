@@ -0,0 +1,192 @@
+import itertools
+
+import numpy as np
+
+from .codons import TRANSLATION_OFFSETS
+from .translation import get_codon_table
+
+
+# Symbols of in-frame codons. Lower case letters are read as upper case,
+# gaps as ``?`` and anything else as invalid.
+_SYMBOLS = 'ACGTURYSWKMBDHVN?'
+_INVALID = len(_SYMBOLS)
+_CLASSES = len(_SYMBOLS) + 1
+
+_SYMBOL_CLASSES = np.full(256, _INVALID, dtype=np.int64)
+for _index, _symbol in enumerate(_SYMBOLS):
+    _SYMBOL_CLASSES[ord(_symbol)] = _index
+    _SYMBOL_CLASSES[ord(_symbol.lower())] = _index
+_SYMBOL_CLASSES[ord('-')] = _SYMBOLS.index('?')
+
+_VALID, _STOP, _INVALID_CODON = 0, 1, 2
+
+# Codons with missing data next to bases, such as ``A??``, which translate to X.
+_MIXED_GAPS = np.zeros(_CLASSES ** 3, dtype=bool)
+for _codon in itertools.product(range(_CLASSES), repeat=3):
+    if _INVALID not in _codon:
+        _missing = _codon.count(_SYMBOLS.index('?'))
+        _MIXED_GAPS[(_codon[0] * _CLASSES + _codon[1]) * _CLASSES + _codon[2]] = 0 < _missing < 3
+
+# Maximum number of codons checked at once.
+_CODON_CHUNK = 1 << 21
+
+# Codon status arrays already built, keyed by translation table.
+_statuses = dict()
+
+
+class FrameReport(object):
+    """Translation problems found in one record by ``validate_batch``.
+
+    Positions are 1-based and point to the first base of the codon in the
+    sequence of the record.
+
+    Attributes:
+        voucher_code:       Code of voucher that the sequence belongs to.
+        gene_code:          Gene code.
+        internal_stops:     List of positions of stop codons before the last codon.
+        mixed_gap_codons:   List of positions of codons mixing missing data
+                            and bases, such as ``A??``, translated as X.
+        invalid_codons:     List of positions of codons with symbols that are
+                            not IUPAC, which make ``translate()`` raise.
+        remainder:          Bases left after the last full codon, or None if
+                            the reading frame is not valid.
+        errors:             List of messages for problems of the record itself,
+                            such as a missing reading frame or table.
+
+    """
+    def __init__(self, voucher_code=None, gene_code=None):
+        self.voucher_code = voucher_code
+        self.gene_code = gene_code
+        self.internal_stops = []
+        self.mixed_gap_codons = []
+        self.invalid_codons = []
+        self.remainder = None
+        self.errors = []
+
+    @property
+    def ok(self):
+        return not (self.internal_stops or self.mixed_gap_codons or self.invalid_codons or
+                    self.remainder or self.errors)
+
+    def as_dict(self):
+        return {
+            'voucher_code': self.voucher_code,
+            'gene_code': self.gene_code,
+            'internal_stops': self.internal_stops,
+            'mixed_gap_codons': self.mixed_gap_codons,
+            'invalid_codons': self.invalid_codons,
+            'remainder': self.remainder,
+            'errors': self.errors,
+        }
+
+
+def _codon_status(table):
+    """
+    :return: array with the status of every codon code for ``table``.
+
+    """
+    if table in _statuses:
+        return _statuses[table]
+    lookup = get_codon_table(table).lookup
+    status = np.full(_CLASSES ** 3, _INVALID_CODON, dtype=np.int8)
+    for codon in itertools.product(range(len(_SYMBOLS)), repeat=3):
+        amino_acid = lookup.get(''.join(_SYMBOLS[i] for i in codon))
+        if amino_acid is not None:
+            code = (codon[0] * _CLASSES + codon[1]) * _CLASSES + codon[2]
+            status[code] = _STOP if amino_acid == '*' else _VALID
+    _statuses[table] = status
+    return status
+
+
+def validate_batch(batch, table=None):
+    """Checks every record of a batch for problems found when translating,
+    in one vectorized pass, without raising.
+
+    Codons are read in the frame used by ``translate()``.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        table (int):  Optional. Overrides the translation table of each record.
+
+    Returns:
+        (list): FrameReport instances, in the same order as the records.
+
+    """
+    reports = [FrameReport(voucher_code, gene_code)
+               for voucher_code, gene_code in zip(batch.voucher_codes, batch.gene_codes)]
+    shifts = np.zeros(len(batch), dtype=np.int64)
+    codons = np.zeros(len(batch), dtype=np.int64)
+    table_indexes = np.zeros(len(batch), dtype=np.int64)
+    tables = []
+
+    for index, report in enumerate(reports):
+        reading_frame = batch.reading_frames[index]
+        record_table = table or batch.tables[index]
+        if reading_frame not in [1, 2, 3, None]:
+            report.errors.append("The reading_frame attribute should be either 1, 2, 3 or None.")
+            continue
+        if reading_frame is None:
+            report.errors.append('reading_frame attribute should be either 1, 2 or 3.')
+            continue
+        shifts[index] = TRANSLATION_OFFSETS[reading_frame]
+        length = max(int(batch.lengths[index]) - TRANSLATION_OFFSETS[reading_frame], 0)
+        report.remainder = length % 3
+        if record_table is None:
+            report.errors.append('It is necessary to specify the translation table to use: '
+                                 'batch.translate(table=1)')
+            continue
+        if record_table not in tables:
+            tables.append(record_table)
+        table_indexes[index] = tables.index(record_table)
+        codons[index] = length // 3
+
+    statuses = np.zeros((len(tables), _CLASSES ** 3), dtype=np.int8)
+    for index, record_table in enumerate(tables):
+        statuses[index] = _codon_status(record_table)
+
+    for records, within, positions, code in _codon_chunks(batch, shifts, codons):
+        status = statuses[table_indexes[records], code]
+        flagged = [
+            ('internal_stops', (status == _STOP) & (within < codons[records] - 1)),
+            ('mixed_gap_codons', _MIXED_GAPS[code]),
+            ('invalid_codons', status == _INVALID_CODON),
+        ]
+        for name, mask in flagged:
+            hits = np.flatnonzero(mask)
+            for record, position in zip(records[hits].tolist(), (positions[hits] + 1).tolist()):
+                getattr(reports[record], name).append(position)
+    return reports
+
+
+def _codon_chunks(batch, shifts, codons):
+    """Encodes the codons of the records of a batch, a chunk of records at a time.
+
+    Parameters:
+        batch (SeqRecordBatch)
+        shifts:  leading bases to skip in each record.
+        codons:  number of codons to read from each record.
+
+    Yields:
+        tuple: arrays with the record, the index within the record, the
+        position in the record and the code of each codon.
+
+    """
+    first = 0
+    while first < len(batch):
+        last = first + 1
+        total = codons[first]
+        while last < len(batch) and total + codons[last] <= _CODON_CHUNK:
+            total += codons[last]
+            last += 1
+
+        counts = codons[first:last]
+        records = np.repeat(np.arange(first, last), counts)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        positions = shifts[records] + within * 3
+        starts = batch.offsets[records] + positions
+
+        code = _SYMBOL_CLASSES[batch.buffer[starts]] * _CLASSES
+        code = (code + _SYMBOL_CLASSES[batch.buffer[starts + 1]]) * _CLASSES
+        code += _SYMBOL_CLASSES[batch.buffer[starts + 2]]
+        yield records, within, positions, code
+        first = last
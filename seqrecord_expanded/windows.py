@@ -0,0 +1,92 @@
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from .codons import codon_columns
+
+
+def as_array(seq):
+    """
+    :return: ``numpy.uint8`` array with the bytes of a sequence, without
+             copying if it is already bytes or an array.
+
+    """
+    if isinstance(seq, np.ndarray):
+        return seq
+    if not isinstance(seq, (bytes, bytearray, memoryview)):
+        seq = seq.encode('ascii')
+    return np.frombuffer(seq, dtype=np.uint8)
+
+
+def codon_position_view(seq, positions='123'):
+    """Selects codon positions of a sequence that starts at a first codon
+    position, as ``select_codon_positions`` does, without building a string.
+
+    Single positions and ``"123"`` are strided views of ``seq``. The bases of
+    two positions are not evenly spaced, so they are gathered into one new
+    array.
+
+    Parameters:
+        seq:              in-frame DNA as str, bytes or ``numpy.uint8`` array.
+        positions (str):  "1", "2", "3", "12", "13", "23" or "123".
+
+    Returns:
+        (numpy.ndarray): ``uint8`` array of the requested positions.
+
+    """
+    array = as_array(seq)
+    columns = codon_columns(positions)
+    if len(columns) == 3:
+        return array
+    if len(columns) == 1:
+        return array[columns[0]::3]
+    return array[np.isin(np.arange(len(array)) % 3, columns)]
+
+
+def sliding_windows(array, size, step=None):
+    """Read-only windows over an array, with no copy.
+
+    Parameters:
+        array (numpy.ndarray):  such as a ``codon_position_view``.
+        size (int):             number of sites of each window.
+        step (int):             sites between the starts of two windows.
+                                Defaults to ``size``, so windows do not overlap.
+
+    Returns:
+        (numpy.ndarray): 2-D view with one window per row. Sites after the
+        last full window are left out.
+
+    """
+    step = size if step is None else step
+    if size < 1 or step < 1:
+        raise ValueError('Window size and step should be positive, got {0} and {1}.'.format(
+            size, step))
+    if len(array) < size:
+        return np.empty((0, size), dtype=array.dtype)
+    # as_strided instead of sliding_window_view, which needs NumPy 1.20
+    stride = array.strides[0]
+    return as_strided(array, shape=((len(array) - size) // step + 1, size),
+                      strides=(stride * step, stride), writeable=False)
+
+
+def window_counts(array, symbols, size, step=None):
+    """Counts symbols in every window of an array from one cumulative sum,
+    so the cost does not grow with the window size.
+
+    Parameters:
+        array (numpy.ndarray):  such as a ``codon_position_view``.
+        symbols (str):          symbols to count, such as ``"GC"``. Lower
+                                case letters are counted too.
+        size (int):             see ``sliding_windows``.
+        step (int):             see ``sliding_windows``.
+
+    Returns:
+        (numpy.ndarray): ``int64`` count of each window.
+
+    """
+    windows = sliding_windows(array, size, step)
+    selected = np.zeros(256, dtype=bool)
+    for symbol in symbols:
+        selected[ord(symbol.upper())] = selected[ord(symbol.lower())] = True
+    cumulative = np.concatenate(([0], np.cumsum(selected[array], dtype=np.int64)))
+    starts = np.arange(len(windows), dtype=np.int64) * (size if step is None else step)
+    return cumulative[starts + size] - cumulative[starts]
@@ -0,0 +1,410 @@
+import re
+
+import six
+
+from .batch import _decode
+
+
+FORMATS = ('fasta', 'phylip', 'nexus', 'tnt')
+
+DATATYPES = ('DNA', 'PROTEIN')
+
+# Rows are sent to the file handle in blocks of about this many characters.
+BUFFER_SIZE = 1 << 20
+
+# Characters of interleaved blocks.
+BLOCK_WIDTH = 60
+
+# Width of the NTAX and NCHAR placeholders written when the dimensions are
+# filled in by seeking back at the end.
+_DIMENSION_WIDTH = 12
+
+_NEXUS_PUNCTUATION = re.compile(r"[\s'\"()\[\]{}/\\,;:=*`+<>]")
+
+# PHYLIP and TNT names end at the first space, so spaces become underscores.
+_WHITESPACE = re.compile(r"\s")
+
+
+class MatrixWriter(object):
+    """Streams aligned sequences to a file handle, writing in large blocks.
+
+    Rows are written as they are given, so the matrix is never held in
+    memory. Use ``write()`` for one row at a time, or ``write_records()``,
+    ``write_batch()`` and ``write_interleaved()`` for many.
+
+    If ``ntax`` and ``nchar`` are not given, the header is written with
+    placeholders that are filled in by ``close()``, which needs a seekable
+    handle. Rows shorter than ``nchar`` are padded with ``?``.
+
+    Parameters:
+        handle:             file-like object opened for writing text.
+        ntax (int):         Optional. Number of rows.
+        nchar (int):        Optional. Length of the rows.
+        datatype (str):     DNA or PROTEIN.
+        name_width (int):   Optional. Names are padded to this width so that
+                            the sequences line up.
+        buffer_size (int):  Characters kept before writing to ``handle``.
+
+    Raises:
+        ValueError:  if the dimensions are not known and ``handle`` is not
+                     seekable, or if rows do not fit ``nchar``.
+
+    """
+    format = None
+
+    def __init__(self, handle, ntax=None, nchar=None, datatype='DNA', name_width=None,
+                 buffer_size=BUFFER_SIZE):
+        if datatype not in DATATYPES:
+            raise ValueError('datatype should be one of {0}.'.format(', '.join(DATATYPES)))
+        self.handle = handle
+        self.ntax = ntax
+        self.nchar = nchar
+        self.datatype = datatype
+        self.name_width = name_width
+        self.buffer_size = buffer_size
+        self.rows = 0
+        self._block = []
+        self._size = 0
+        self._header_position = None
+        self._started = False
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+
+    def _emit(self, text):
+        self._block.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.handle.write(''.join(self._block))
+        self._block = []
+        self._size = 0
+
+    def _start(self, interleave):
+        if self._started:
+            if interleave:
+                raise ValueError('Interleaved matrices should be written with a single '
+                                 'call to write_interleaved().')
+            return
+        self._started = True
+        self._interleave = interleave
+        if self._needs_dimensions() and (self.ntax is None or self.nchar is None):
+            if not _seekable(self.handle):
+                raise ValueError('ntax and nchar are needed to write to a handle that '
+                                 'is not seekable.')
+            self.flush()
+            self._emit(self._preamble())
+            self.flush()
+            self._header_position = self.handle.tell()
+            self._emit(self._dimensions(' ' * _DIMENSION_WIDTH, ' ' * _DIMENSION_WIDTH))
+            self._emit(self._after_dimensions())
+        elif self._needs_dimensions():
+            self._emit(self._preamble())
+            self._emit(self._dimensions(self.ntax, self.nchar))
+            self._emit(self._after_dimensions())
+
+    def _fit(self, name, length):
+        if self.nchar is None:
+            if self._needs_dimensions():
+                self.nchar = length
+            return 0
+        if length > self.nchar:
+            raise ValueError('Sequence of {0} is longer than {1} characters.'.format(
+                name, self.nchar))
+        return self.nchar - length
+
+    def _label(self, name):
+        if self.name_width:
+            return '{0:<{1}} '.format(name, self.name_width)
+        return '{0} '.format(name)
+
+    def write(self, name, seq):
+        """Writes one row.
+
+        Parameters:
+            name (str):  voucher code or taxon name.
+            seq (str):   sequence. Gaps ``-`` are written as ``?``.
+
+        """
+        self._start(False)
+        seq = _text(seq)
+        padding = self._fit(name, len(seq))
+        self._emit(self._row(self._name(name), seq + '?' * padding))
+        self.rows += 1
+
+    def write_records(self, seq_records, sequence=None):
+        """Writes one row per record, named by its voucher code.
+
+        Parameters:
+            seq_records (iterable):  SeqRecordExpanded or CompactSeqRecordExpanded
+                                     instances.
+            sequence (callable):     Optional. Function taking a record and
+                                     returning the string to write, such as
+                                     ``lambda record: record.degenerate()``.
+                                     Defaults to the sequence of the record.
+
+        """
+        for seq_record in seq_records:
+            if sequence is None:
+                seq = seq_record._sequence_string()
+            else:
+                seq = sequence(seq_record)
+            self.write(seq_record.voucher_code, seq)
+
+    def write_batch(self, batch, interleave=False, width=BLOCK_WIDTH):
+        """Writes the sequences of a SeqRecordBatch straight from its buffer.
+
+        Parameters:
+            batch (SeqRecordBatch)
+            interleave (bool):  write blocks of ``width`` characters.
+            width (int):        Characters per interleaved block.
+
+        """
+        views = [batch.buffer[start:start + length]
+                 for start, length in zip(batch.offsets, batch.lengths)]
+        if interleave:
+            self.write_interleaved(batch.voucher_codes, views, width)
+        else:
+            for name, view in zip(batch.voucher_codes, views):
+                self.write(name, view)
+
+    def write_interleaved(self, names, sequences, width=BLOCK_WIDTH):
+        """Writes the whole matrix in blocks of ``width`` characters.
+
+        Only one block of each sequence is converted to text at a time, so
+        ``sequences`` can be views into a large buffer.
+
+        Parameters:
+            names (list):      voucher codes or taxon names.
+            sequences (list):  strings, or ``numpy.uint8`` arrays as held by
+                               SeqRecordBatch.
+
+        """
+        if self.ntax is None:
+            self.ntax = len(names)
+        if self.nchar is None:
+            self.nchar = max([len(seq) for seq in sequences] + [0])
+        if self.name_width is None:
+            self.name_width = max([len(self._name(name)) for name in names] + [0])
+        for name, seq in zip(names, sequences):
+            self._fit(name, len(seq))
+        self._start(True)
+
+        labels = [self._label(self._name(name)) for name in names]
+        blank = ' ' * (self.name_width + 1)
+        for start in range(0, self.nchar, width):
+            self._emit(self._block_start(start == 0))
+            for label, seq in zip(labels, sequences):
+                chunk = _text(seq[start:start + width])
+                chunk += '?' * (min(width, self.nchar - start) - len(chunk))
+                if start and not self._names_in_every_block():
+                    label = blank
+                self._emit(label + chunk + '\n')
+        self.rows = len(names)
+
+    def close(self):
+        """Writes the end of the file and fills in the dimensions if they
+        were not known in advance. The handle itself is not closed.
+
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._start(False)
+        self._emit(self._footer())
+        self.flush()
+        if self._header_position is not None:
+            end = self.handle.tell()
+            self.handle.seek(self._header_position)
+            self.handle.write(self._dimensions(
+                str(self.rows).ljust(_DIMENSION_WIDTH),
+                str(self.nchar or 0).ljust(_DIMENSION_WIDTH)))
+            self.handle.seek(end)
+
+    def _needs_dimensions(self):
+        return True
+
+    def _names_in_every_block(self):
+        return True
+
+    def _name(self, name):
+        return name
+
+    def _row(self, name, seq):
+        return self._label(name) + seq + '\n'
+
+    def _preamble(self):
+        return ''
+
+    def _dimensions(self, ntax, nchar):
+        return ''
+
+    def _after_dimensions(self):
+        return ''
+
+    def _block_start(self, first):
+        return '' if first else '\n'
+
+    def _footer(self):
+        return ''
+
+
+class FastaWriter(MatrixWriter):
+    """Writes FASTA files, optionally wrapping sequences every ``line_width``
+    characters. Rows are only padded if ``nchar`` is given and FASTA cannot
+    be interleaved.
+
+    """
+    format = 'fasta'
+
+    def __init__(self, handle, line_width=None, **kwargs):
+        super(FastaWriter, self).__init__(handle, **kwargs)
+        self.line_width = line_width
+
+    def _needs_dimensions(self):
+        return False
+
+    def _row(self, name, seq):
+        if self.line_width:
+            seq = '\n'.join(seq[i:i + self.line_width]
+                            for i in range(0, len(seq), self.line_width))
+        return '>{0}\n{1}\n'.format(name, seq)
+
+    def write_interleaved(self, names, sequences, width=BLOCK_WIDTH):
+        raise ValueError('FASTA files cannot be interleaved, use line_width instead.')
+
+
+class PhylipWriter(MatrixWriter):
+    """Writes relaxed PHYLIP files, as read by RAxML. Interleaved files only
+    have names in the first block. Spaces in names are replaced by ``_``.
+
+    """
+    format = 'phylip'
+
+    def _name(self, name):
+        return _WHITESPACE.sub('_', name)
+
+    def _dimensions(self, ntax, nchar):
+        return '{0} {1}'.format(ntax, nchar)
+
+    def _after_dimensions(self):
+        return '\n'
+
+    def _names_in_every_block(self):
+        return False
+
+
+class NexusWriter(MatrixWriter):
+    """Writes a NEXUS DATA block, as read by MrBayes and PAUP*, followed by
+    a SETS block if ``charsets`` are given.
+
+    Names with spaces or NEXUS punctuation are quoted.
+
+    Parameters:
+        charsets (list):  Optional. ``[(name, start, end), ...]`` with 1-based
+                          inclusive boundaries, see ``SupermatrixBuilder.partitions``.
+
+    """
+    format = 'nexus'
+
+    def __init__(self, handle, charsets=None, **kwargs):
+        super(NexusWriter, self).__init__(handle, **kwargs)
+        self.charsets = charsets
+
+    def _name(self, name):
+        if _NEXUS_PUNCTUATION.search(name):
+            return "'{0}'".format(name.replace("'", "''"))
+        return name
+
+    def _preamble(self):
+        return '#NEXUS\n\nBEGIN DATA;\nDIMENSIONS '
+
+    def _dimensions(self, ntax, nchar):
+        return 'NTAX={0} NCHAR={1};'.format(ntax, nchar)
+
+    def _after_dimensions(self):
+        return '\nFORMAT INTERLEAVE={0} DATATYPE={1} MISSING=? GAP=-;\nMATRIX\n'.format(
+            'YES' if self._interleave else 'NO', self.datatype)
+
+    def _footer(self):
+        out = ';\nEND;\n'
+        if self.charsets:
+            out += '\nBEGIN SETS;\n'
+            out += ''.join('    CHARSET {0} = {1}-{2};\n'.format(name, start, end)
+                           for name, start, end in self.charsets)
+            out += 'END;\n'
+        return out
+
+
+class TntWriter(MatrixWriter):
+    """Writes TNT ``xread`` files. Interleaved blocks start with
+    ``&[dna]`` or ``&[prot]``. Spaces in names are replaced by ``_``.
+
+    """
+    format = 'tnt'
+
+    def _name(self, name):
+        return _WHITESPACE.sub('_', name)
+
+    def _state(self):
+        return 'dna' if self.datatype == 'DNA' else 'prot'
+
+    def _preamble(self):
+        return 'nstates {0};\nxread\n'.format(self._state())
+
+    def _dimensions(self, ntax, nchar):
+        return '{0} {1}'.format(nchar, ntax)
+
+    def _after_dimensions(self):
+        return '\n'
+
+    def _block_start(self, first):
+        return '&[{0}]\n'.format(self._state())
+
+    def _footer(self):
+        return ';\nproc/;\n'
+
+
+WRITERS = {
+    'fasta': FastaWriter,
+    'phylip': PhylipWriter,
+    'nexus': NexusWriter,
+    'tnt': TntWriter,
+}
+
+
+def get_writer(handle, format='nexus', **kwargs):
+    """
+    Parameters:
+        handle:        file-like object opened for writing text.
+        format (str):  fasta, phylip, nexus or tnt.
+        kwargs:        passed to the writer class.
+
+    Returns:
+        (MatrixWriter): instance of the writer class of ``format``.
+
+    """
+    if format not in FORMATS:
+        raise ValueError('format should be one of {0}.'.format(', '.join(FORMATS)))
+    return WRITERS[format](handle, **kwargs)
+
+
+def _seekable(handle):
+    try:
+        return handle.seekable()
+    except AttributeError:
+        return False
+
+
+def _text(seq):
+    # gaps become missing data, as in records and SeqRecordBatch
+    if isinstance(seq, six.string_types):
+        return seq.replace('-', '?')
+    return _decode(seq)
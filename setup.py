@@ -32,6 +32,7 @@ setuptools.setup(
     install_requires=[
         'biopython==1.69',
         'degenerate-dna==0.0.9',
+        'numpy>=1.13',
         'six==1.10.0',
     ],
 
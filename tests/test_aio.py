@@ -0,0 +1,107 @@
+import sys
+import unittest
+
+if sys.version_info < (3, 7):
+    raise unittest.SkipTest('seqrecord_expanded.aio needs Python 3.7 or later.')
+
+import asyncio
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded.aio import degenerate_async, gather_records, translate_async
+from seqrecord_expanded.cache import ResultCache, use_result_cache
+from seqrecord_expanded.exceptions import TranslationErrorMixedGappedSeq
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Keeps the highest number of jobs that were running at the same time."""
+    def __init__(self):
+        super(_CountingExecutor, self).__init__(max_workers=8)
+        self.running = 0
+        self.most = 0
+        self.lock = threading.Lock()
+
+    def submit(self, function, *args):
+        def job():
+            with self.lock:
+                self.running += 1
+                self.most = max(self.most, self.running)
+            try:
+                return function(*args)
+            finally:
+                with self.lock:
+                    self.running -= 1
+        return super(_CountingExecutor, self).submit(job)
+
+
+class TestAsync(unittest.TestCase):
+    def setUp(self):
+        self.seq = 'TCTGAATGGAAGACAAAGCGTCCA'
+
+    def test_same_as_blocking_methods(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for reading_frame in [1, 2, 3]:
+                record = SeqRecordExpanded(self.seq, reading_frame=reading_frame, table=1)
+                expected = (record.translate(), record.degenerate(method='S'))
+                record = CompactSeqRecordExpanded(self.seq, reading_frame=reading_frame, table=1)
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                try:
+                    result = loop.run_until_complete(asyncio.gather(
+                        translate_async(record, chunk_size=3),
+                        degenerate_async(record, method='S', chunk_size=6)))
+                finally:
+                    asyncio.set_event_loop(None)
+                    loop.close()
+                self.assertEqual(list(expected), result)
+
+    def test_result_is_kept_in_record(self):
+        record = SeqRecordExpanded(self.seq, reading_frame=1, table=1)
+        result = asyncio.run(degenerate_async(record))
+        self.assertEqual('TCNGARTGGAARACNAARMGNCCN', result)
+        self.assertIs(result, record.degenerate())
+
+    def test_results_use_the_result_cache(self):
+        executor = _CountingExecutor()
+        with ResultCache(':memory:') as result_cache:
+            use_result_cache(result_cache)
+            try:
+                record = SeqRecordExpanded(self.seq, reading_frame=1, table=1)
+                self.assertEqual('SEWKTKRP', asyncio.run(translate_async(record)))
+                self.assertEqual('SEWKTKRP', record.translate())
+                self.assertEqual(1, len(result_cache))
+
+                record = CompactSeqRecordExpanded(self.seq, reading_frame=1, table=1)
+                record.degenerate(method='S')
+                self.assertEqual(2, len(result_cache))
+                record = CompactSeqRecordExpanded(self.seq, reading_frame=1, table=1)
+                asyncio.run(degenerate_async(record, method='S', executor=executor))
+                asyncio.run(translate_async(record, executor=executor))
+            finally:
+                use_result_cache(None)
+        executor.shutdown()
+        self.assertEqual(0, executor.most)
+
+    def test_wrong_chunk_size(self):
+        record = SeqRecordExpanded(self.seq, reading_frame=1, table=1)
+        self.assertRaises(ValueError, asyncio.run, translate_async(record, chunk_size=4))
+
+    def test_gather_records(self):
+        records = [SeqRecordExpanded(self.seq, reading_frame=1, table=1, voucher_code=str(i))
+                   for i in range(20)]
+        records.append(SeqRecordExpanded('ACTGGTXXX', reading_frame=1, table=1,
+                                         voucher_code='CP100-09', gene_code='COI'))
+        executor = _CountingExecutor()
+        results = asyncio.run(gather_records(records, 'translate', limit=3, executor=executor,
+                                             return_exceptions=True, chunk_size=3))
+        executor.shutdown()
+
+        self.assertEqual(['SEWKTKRP'] * 20, results[:20])
+        self.assertIsInstance(results[-1], TranslationErrorMixedGappedSeq)
+        self.assertLessEqual(executor.most, 3)
+
+    def test_gather_wrong_operation(self):
+        self.assertRaises(ValueError, asyncio.run, gather_records([], 'reverse'))
@@ -0,0 +1,56 @@
+import unittest
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.exceptions import MissingParameterError
+
+
+class TestSeqRecordBatch(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            SeqRecordExpanded('123123123123', voucher_code='CP100-09', reading_frame=1),
+            SeqRecordExpanded('23123123123', voucher_code='CP100-10', reading_frame=2),
+            SeqRecordExpanded('3123123123123', voucher_code='CP100-11', reading_frame=3),
+            SeqRecordExpanded('TCTGAATGG-AGACAAAGCGTCC', voucher_code='CP100-12', reading_frame=1),
+        ]
+        self.batch = SeqRecordBatch(self.records)
+
+    def test_sequences(self):
+        self.assertEqual(4, len(self.batch))
+        self.assertEqual('TCTGAATGG?AGACAAAGCGTCC', self.batch.sequence(3))
+
+    def test_codon_positions_match_records(self):
+        for positions, method in [('1', 'first_codon_position'),
+                                  ('2', 'second_codon_position'),
+                                  ('3', 'third_codon_position'),
+                                  ('12', 'first_and_second_codon_positions')]:
+            expected = [getattr(record, method)() for record in self.records]
+            self.assertEqual(expected, getattr(self.batch, method)(), method)
+            self.assertEqual(expected, self.batch.codon_positions(positions), positions)
+
+    def test_codon_positions_other_subsets(self):
+        self.assertEqual(['13131313', '131313', '13131313', 'TTGATG?GAAAGCTC'],
+                         self.batch.codon_positions('13'))
+        self.assertEqual('123123123123', self.batch.codon_positions('123')[0])
+
+    def test_codon_positions_matrix(self):
+        matrix = self.batch.codon_positions_matrix('1')
+        self.assertEqual((4, 8), matrix.shape)
+        self.assertEqual(b'111?????', matrix[1].tobytes())
+
+    def test_wrong_positions(self):
+        self.assertRaises(ValueError, self.batch.codon_positions, '4')
+        self.assertRaises(ValueError, self.batch.codon_positions, '11')
+        self.assertRaises(ValueError, self.batch.codon_positions, '')
+
+    def test_missing_reading_frame(self):
+        batch = SeqRecordBatch([SeqRecordExpanded('ACGT', gene_code='wingless')])
+        self.assertRaises(MissingParameterError, batch.first_codon_position)
+
+    def test_wrong_reading_frame(self):
+        batch = SeqRecordBatch([SeqRecordExpanded('ACGT', reading_frame=4)])
+        self.assertRaises(ValueError, batch.first_codon_position)
+
+    def test_empty_batch(self):
+        batch = SeqRecordBatch()
+        self.assertEqual([], batch.first_codon_position())
@@ -0,0 +1,34 @@
+import sys
+import unittest
+
+if sys.version_info < (3, 4):
+    raise unittest.SkipTest('The benchmarks need tracemalloc and time.perf_counter, '
+                            'from Python 3.4.')
+
+from benchmarks import import_time, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+    def test_run(self):
+        report = run_benchmarks.run([30], [3], verbose=False)
+        operations = [result['operation'] for result in report['results']]
+        self.assertEqual(['import'] + [name for name, _ in run_benchmarks.OPERATIONS], operations)
+        self.assertTrue(all(result['peak_memory_bytes'] > 0 for result in report['results'][1:]))
+
+    def test_skip_large_cells(self):
+        report = run_benchmarks.run([30], [3], max_bases=10, operations=['translate_table_1'],
+                                    verbose=False)
+        self.assertEqual([], report['results'])
+
+    def test_import_does_not_load_heavy_modules(self):
+        result = import_time.measure_import(repeat=1)
+        self.assertEqual([], result['loaded'])
+
+    def test_compare(self):
+        old = {'results': [{'operation': 'translate_table_1', 'gene_length': 30, 'taxa': 3,
+                            'seconds': 1.0}]}
+        new = {'results': [{'operation': 'translate_table_1', 'gene_length': 30, 'taxa': 3,
+                            'seconds': 1.5}]}
+        self.assertEqual([('translate_table_1', 30, 3, 1.0, 1.5, 1.5)],
+                         run_benchmarks.compare(old, new))
+        self.assertEqual([], run_benchmarks.compare(new, old))
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded import degeneration
+from seqrecord_expanded.cache import ResultCache, sequence_digest, use_result_cache
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'results.sqlite')
+        self.seq = 'TCTGAATGGAAGACAAAGCGTCCA'
+
+    def tearDown(self):
+        use_result_cache(None)
+
+    def test_results_persist_between_runs(self):
+        with ResultCache(self.path) as result_cache:
+            use_result_cache(result_cache)
+            record = SeqRecordExpanded(self.seq, reading_frame=1, table=1)
+            self.assertEqual('SEWKTKRP', record.translate())
+            self.assertEqual('AGYGARTGGAARACNAARMGNCCN', record.degenerate(method='S'))
+            self.assertEqual(2, len(result_cache))
+
+        with ResultCache(self.path) as result_cache:
+            use_result_cache(result_cache)
+            self.assertEqual(2, len(result_cache))
+            original = degeneration.degenerate
+            degeneration.degenerate = None  # would fail if called
+            try:
+                record = CompactSeqRecordExpanded(self.seq, reading_frame=1, table=1)
+                self.assertEqual('AGYGARTGGAARACNAARMGNCCN', record.degenerate(method='S'))
+            finally:
+                degeneration.degenerate = original
+
+    def test_parameters_are_part_of_the_key(self):
+        with ResultCache(self.path) as result_cache:
+            use_result_cache(result_cache)
+            self.assertEqual('SEWKTKRP',
+                             SeqRecordExpanded(self.seq, reading_frame=1, table=1).translate())
+            self.assertEqual('LNGRQSV',
+                             SeqRecordExpanded(self.seq, reading_frame=2, table=1).translate())
+            record = SeqRecordExpanded(self.seq, reading_frame=1, table=1)
+            self.assertEqual('SEWKTKRP', record.translate(table=2))
+            self.assertEqual(3, len(result_cache))
+
+            digest = sequence_digest(self.seq)
+            other_version = ResultCache(':memory:', version='0.0.1')
+            self.assertNotEqual(result_cache.key(digest, 1, ('translate', 1)),
+                                other_version.key(digest, 1, ('translate', 1)))
+
+    def test_eviction(self):
+        with ResultCache(self.path, max_entries=10) as result_cache:
+            for index in range(10):
+                result_cache[str(index)] = 'X'
+            result_cache.get('0')
+            result_cache['10'] = 'X'
+            self.assertEqual(9, len(result_cache))
+            self.assertEqual('X', result_cache.get('0'))
+            self.assertIsNone(result_cache.get('1'))
+            self.assertIsNone(result_cache.get('2'))
+            self.assertEqual('X', result_cache.get('10'))
@@ -0,0 +1,49 @@
+import unittest
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.codon_alignment import thread_codons
+from seqrecord_expanded.exceptions import MissingParameterError
+
+
+class TestCodonAlignment(unittest.TestCase):
+    def test_thread_codons(self):
+        self.assertEqual('ATG???AAA???TTT', thread_codons('ATGAAATTTC', 'M-K.F'))
+        self.assertEqual('??????', thread_codons('', '--'))
+
+    def test_record(self):
+        seq_record = SeqRecordExpanded('CATGAA-TTT', reading_frame=2, table=1)
+        self.assertEqual('MXF', seq_record.translate())
+        self.assertEqual('ATG???AA?TTT', seq_record.codon_alignment('M-XF'))
+
+        seq_record = CompactSeqRecordExpanded(b'GGATGAAA', reading_frame=3)
+        self.assertEqual('ATGAAA???', seq_record.codon_alignment('MK-'))
+
+    def test_errors(self):
+        seq_record = SeqRecordExpanded('ATGAAA', voucher_code='CP100-10', gene_code='EF1a')
+        self.assertRaises(MissingParameterError, seq_record.codon_alignment, 'MK')
+        seq_record.reading_frame = 1
+        with self.assertRaises(ValueError) as context:
+            seq_record.codon_alignment('M-')
+        self.assertIn("'CP100-10'", str(context.exception))
+        self.assertIn('1 residues but the sequence has 2 codons', str(context.exception))
+
+    def test_batch(self):
+        records = [
+            SeqRecordExpanded('ATGAAATTT', reading_frame=1),
+            SeqRecordExpanded('CATGAA-TTTG', reading_frame=2),
+            SeqRecordExpanded('GG', reading_frame=3),
+        ]
+        proteins = ['M-KF', 'MX-F', '---']
+        batch = SeqRecordBatch(records)
+        expected = [record.codon_alignment(protein) for record, protein in zip(records, proteins)]
+        self.assertEqual(expected, batch.codon_alignment(proteins))
+        self.assertEqual(['ATG???AAATTT', 'ATGAA????TTT', '?????????'], expected)
+
+        self.assertRaises(ValueError, batch.codon_alignment, proteins[:2])
+        self.assertRaises(ValueError, batch.codon_alignment, ['MK', 'MX-F', '---'])
+        self.assertEqual([], SeqRecordBatch([]).codon_alignment([]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.codon_usage import CODONS, CodonUsage, count_codons
+from seqrecord_expanded.exceptions import MissingParameterError
+
+
+def _codon_dict(counts):
+    return dict((codon, count) for codon, count in zip(CODONS, counts.tolist()) if count)
+
+
+class TestCodonUsage(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            SeqRecordExpanded('ATGAAAAAGTTTTAAG', gene_code='EF1a', reading_frame=1, table=1),
+            SeqRecordExpanded('CATGAARAAA', gene_code='EF1a', reading_frame=2, table=1),
+            SeqRecordExpanded('ATGCTG', gene_code='COI', reading_frame=1, table=5),
+        ]
+        self.batch = SeqRecordBatch(self.records)
+
+    def test_count_codons(self):
+        usage = self.batch.codon_usage()
+        self.assertEqual([('EF1a', 1), ('COI', 5)], usage.keys)
+        self.assertEqual({'ATG': 2, 'AAA': 2, 'AAG': 1, 'TTT': 1, 'TAA': 1},
+                         _codon_dict(usage[('EF1a', 1)]))
+        self.assertEqual({'ATG': 1, 'CTG': 1}, _codon_dict(usage[('COI', 5)]))
+        self.assertEqual([1, 0], usage.skipped.tolist())
+
+        usage = count_codons(self.batch, skip_ambiguous=False)
+        self.assertEqual({'ATG': 2, 'AAA': 2.5, 'AAG': 1.5, 'TTT': 1, 'TAA': 1},
+                         _codon_dict(usage[('EF1a', 1)]))
+        self.assertEqual([0, 0], usage.skipped.tolist())
+
+    def test_merge(self):
+        first = SeqRecordBatch(self.records[:2]).codon_usage()
+        second = SeqRecordBatch(self.records[1:]).codon_usage()
+        merged = first + second
+        self.assertEqual([('EF1a', 1), ('COI', 5)], merged.keys)
+        self.assertEqual(first[('EF1a', 1)].sum() + 2, merged[('EF1a', 1)].sum())
+        self.assertEqual([2, 0], merged.skipped.tolist())
+        self.assertEqual(len(merged), len(CodonUsage().merge(first, second)))
+
+    def test_rscu(self):
+        usage = self.batch.codon_usage()
+        rscu = usage.rscu()
+        row = dict(zip(CODONS, rscu[0].tolist()))
+        self.assertEqual(1.0, row['ATG'])
+        self.assertAlmostEqual(4 / 3.0, row['AAA'])
+        self.assertAlmostEqual(2 / 3.0, row['AAG'])
+        self.assertEqual(2.0, row['TTT'])
+        self.assertEqual(0.0, row['TTC'])
+        self.assertTrue(np.isnan(row['GGG']))
+        self.assertEqual(3.0, row['TAA'])
+        # ATA is methionine in the invertebrate mitochondrial code
+        row = dict(zip(CODONS, rscu[1].tolist()))
+        self.assertEqual(2.0, row['ATG'])
+        self.assertEqual(0.0, row['ATA'])
+        self.assertEqual(1.0, dict(zip(CODONS, usage.rscu(table=1)[1].tolist()))['ATG'])
+
+        usage = SeqRecordBatch([SeqRecordExpanded('ATG', reading_frame=1)]).codon_usage()
+        self.assertRaises(MissingParameterError, usage.rscu)
+
+    def test_missing_reading_frame(self):
+        batch = SeqRecordBatch([SeqRecordExpanded('ATG', table=1)])
+        self.assertRaises(MissingParameterError, batch.codon_usage)
+
+
+if __name__ == '__main__':
+    unittest.main()
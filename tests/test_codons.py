@@ -0,0 +1,41 @@
+import unittest
+
+from seqrecord_expanded.codons import split_codon_positions
+from seqrecord_expanded.exceptions import MissingParameterError
+from seqrecord_expanded.utils import chain_and_flatten
+
+
+class TestSplitCodonPositions(unittest.TestCase):
+    def setUp(self):
+        self.seqs = ['', '1', '12', '123', '1231', '12312', '123123123123',
+                     'TCTGAATGGAAGACAAAGCGTCCA', 'TCTGAATGGAAGACAAAGCGTCC']
+
+    def test_all_subsets(self):
+        for seq in self.seqs:
+            for reading_frame, offset in [(1, 0), (2, 2), (3, 1)]:
+                trimmed = seq[offset:]
+                expected = {
+                    '1': trimmed[::3],
+                    '2': trimmed[1::3],
+                    '3': trimmed[2::3],
+                    '12': chain_and_flatten(trimmed[::3], trimmed[1::3]),
+                    '13': chain_and_flatten(trimmed[::3], trimmed[2::3]),
+                    '23': chain_and_flatten(trimmed[1::3], trimmed[2::3]),
+                    '123': trimmed,
+                }
+                for positions, value in expected.items():
+                    self.assertEqual(value, split_codon_positions(seq, reading_frame, positions),
+                                     (seq, reading_frame, positions))
+
+    def test_unsorted_positions(self):
+        self.assertEqual('1313', split_codon_positions('123123', 1, '31'))
+
+    def test_wrong_positions(self):
+        self.assertRaises(ValueError, split_codon_positions, '123', 1, '4')
+        self.assertRaises(ValueError, split_codon_positions, '123', 1, '22')
+        self.assertRaises(ValueError, split_codon_positions, '123', 1, '')
+        self.assertEqual('12', split_codon_positions('123', 1, 12))
+
+    def test_wrong_reading_frame(self):
+        self.assertRaises(ValueError, split_codon_positions, '123', 4, '1')
+        self.assertRaises(MissingParameterError, split_codon_positions, '123', None, '1')
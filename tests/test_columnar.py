@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.columnar import (from_arrow, from_columns, pack_strings, to_arrow,
+                                         to_columns, unpack_strings)
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            SeqRecordExpanded('TCTGAATGGAAGACAAAGCGTCCA', voucher_code='CP100-10',
+                              taxonomy={'genus': 'Aus', 'species': 'bus'}, gene_code='EF1a',
+                              reading_frame=1, table=1, accession_number='AY123456'),
+            SeqRecordExpanded('ATGAAA-TT', voucher_code='CP100-11', lineage='Insecta;',
+                              gene_code='EF1a', reading_frame=1, table=1),
+        ]
+        self.batch = SeqRecordBatch(self.records)
+
+    def test_pack_strings(self):
+        packed = pack_strings(['ACG', '', 'T'])
+        self.assertEqual([0, 3, 3, 4], packed.offsets.tolist())
+        self.assertEqual(['ACG', '', 'T'], unpack_strings(packed))
+        self.assertEqual([], unpack_strings(pack_strings([])))
+
+    def test_to_columns(self):
+        columns = to_columns(self.batch, translate=True, degenerate=True, method='S')
+        self.assertEqual(['CP100-10', 'CP100-11'], columns['voucher_code'])
+        self.assertEqual([{'genus': 'Aus', 'species': 'bus'}, {}], columns['taxonomy'])
+        self.assertEqual([None, 'Insecta;'], columns['lineage'])
+        self.assertEqual(['AY123456', None], columns['accession_number'])
+        self.assertEqual([record.translate() for record in self.records],
+                         unpack_strings(columns['translated']))
+        self.assertEqual(self.batch.degenerate('S'), unpack_strings(columns['degenerated']))
+        self.assertTrue(np.shares_memory(self.batch.buffer, columns['sequence'].data))
+
+    def test_gaps_and_views(self):
+        batch = SeqRecordBatch.from_buffer(b'>a\nACG-TT\n>b\nGGG\n', [3, 13], [6, 3])
+        columns = to_columns(batch)
+        self.assertEqual(['ACG?TT', 'GGG'], unpack_strings(columns['sequence']))
+        self.assertEqual([0, 6, 9], columns['sequence'].offsets.tolist())
+
+    def test_round_trip(self):
+        batch = from_columns(to_columns(self.batch))
+        for name in ['voucher_codes', 'gene_codes', 'taxonomies', 'lineages', 'reading_frames',
+                     'tables', 'accession_numbers']:
+            self.assertEqual(getattr(self.batch, name), getattr(batch, name))
+        self.assertEqual(self.batch.codon_positions('12'), batch.codon_positions('12'))
+
+        batch = from_columns({'sequence': ['ATGAAA', 'ATG'], 'reading_frame': [1, 1]})
+        self.assertEqual(['TA', 'T'], batch.codon_positions('2'))
+        self.assertEqual(0, len(from_columns(to_columns(SeqRecordBatch([])))))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow(self):
+        columns = from_arrow(to_arrow(to_columns(self.batch, translate=True)))
+        self.assertEqual([{'genus': 'Aus', 'species': 'bus'}, {}], columns['taxonomy'])
+        self.assertEqual(self.batch.translate(), unpack_strings(columns['translated']))
+        self.assertEqual(['CP100-10', 'CP100-11'], from_columns(columns).voucher_codes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded import utils
+
+
+class TestCompactSeqRecordExpanded(unittest.TestCase):
+    def setUp(self):
+        self.kwargs = dict(voucher_code='CP100-09', taxonomy={'genus': 'A us-', 'species': 'bus(?)'},
+                           gene_code='wingless', reading_frame=2, table=1)
+        self.seq = 'ACACGTCGACTCC-GCAAGTCCACTACCACAGGA'
+
+    def test_same_results(self):
+        for method, args in [('first_codon_position', ()), ('second_codon_position', ()),
+                             ('third_codon_position', ()), ('codon_positions', ('13',)),
+                             ('first_and_second_codon_positions', ()),
+                             ('degenerate', ()), ('degenerate', ('SZ',)), ('translate', ())]:
+            expected = getattr(SeqRecordExpanded(self.seq, **self.kwargs), method)(*args)
+            result = getattr(CompactSeqRecordExpanded(self.seq, **self.kwargs), method)(*args)
+            self.assertEqual(expected, result, method)
+
+    def test_attributes(self):
+        seq_record = CompactSeqRecordExpanded(self.seq, **self.kwargs)
+        self.assertFalse(hasattr(seq_record, '__dict__'))
+        self.assertEqual({'genus': 'A_us_', 'species': 'bus___'}, seq_record.taxonomy)
+        self.assertEqual([], seq_record.warnings)
+        self.assertEqual('CP100-09', seq_record.voucher_code)
+
+    def test_lazy_seq(self):
+        seq_record = CompactSeqRecordExpanded(self.seq, **self.kwargs)
+        seq_record.first_codon_position()
+        self.assertIsNone(seq_record._seq)
+        self.assertEqual(self.seq.replace('-', '?'), str(seq_record.seq))
+        self.assertIsNotNone(seq_record._seq)
+
+    def test_missing_reading_frame(self):
+        seq_record = CompactSeqRecordExpanded(b'TCTGAATGG')
+        seq_record.degenerate(method='S')
+        self.assertEqual(1, len(seq_record.warnings))
+
+    def test_taxon_names_are_shared(self):
+        first = CompactSeqRecordExpanded(self.seq, **self.kwargs)
+        second = SeqRecordExpanded(self.seq, **self.kwargs)
+        self.assertIs(first.taxonomy['species'], second.taxonomy['species'])
+
+    def test_taxon_names_cache_is_bounded(self):
+        original = utils._TAXON_NAMES_MAXSIZE
+        utils._TAXON_NAMES_MAXSIZE = 2
+        try:
+            for name in ['Aus', 'Bus', 'Cus(?)']:
+                self.assertEqual(name.replace('(?)', '___'), utils.clean_taxon_name(name))
+            self.assertLessEqual(len(utils._taxon_names), 2)
+        finally:
+            utils._TAXON_NAMES_MAXSIZE = original
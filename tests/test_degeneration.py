@@ -0,0 +1,54 @@
+import random
+import unittest
+import warnings
+
+from degenerate_dna import Degenera
+from degenerate_dna import exceptions
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.degeneration import codon_cache, degenerate
+from seqrecord_expanded.utils import LRUCache
+
+
+class TestDegenerate(unittest.TestCase):
+    def test_same_as_degenera(self):
+        rng = random.Random(420)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for table, method in [(1, 'normal'), (1, 'S'), (1, 'Z'), (1, 'SZ'), (5, 'normal')]:
+                for length in [0, 1, 2, 30, 31, 32]:
+                    seq = ''.join(rng.choice('ACGTRYN?-acgt') for _ in range(length))
+                    res = Degenera(dna=seq, table=table, method=method)
+                    res.degenerate()
+                    self.assertEqual(res.degenerated, degenerate(seq, table, method), seq)
+
+    def test_codons_are_cached(self):
+        codon_cache.clear()
+        degenerate('TCTTCTTCT', 1, 'S')
+        self.assertEqual(1, len(codon_cache))
+        self.assertIn((1, 'S', 'TCT'), codon_cache)
+
+    def test_wrong_parameters(self):
+        self.assertRaises(exceptions.WrongParameterError, degenerate, 'TCT', 2, 'normal')
+        self.assertRaises(exceptions.MissingParameterError, degenerate, 'TCT', None, 'normal')
+
+    def test_results_are_kept_per_record(self):
+        seq_record = SeqRecordExpanded('TCTGAATGGAAGACAAAGCGTCCA', reading_frame=1)
+        first = seq_record.degenerate(method='SZ')
+        self.assertIs(first, seq_record.degenerate(method='SZ'))
+
+        seq_record.seq = 'TCTTCT'
+        self.assertEqual('NNNNNN', seq_record.degenerate(method='SZ'))
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.get('a')
+        cache['c'] = 3
+        self.assertEqual(2, len(cache))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIsNone(cache.get('b'))
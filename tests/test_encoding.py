@@ -0,0 +1,45 @@
+import random
+import unittest
+import warnings
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.encoding import EncodedSequence
+
+
+class TestEncodedSequence(unittest.TestCase):
+    def test_round_trip(self):
+        encoded = EncodedSequence('ACGTRYSWKMBDHVN?-acgtn')
+        self.assertEqual('ACGTRYSWKMBDHVN??ACGTN', encoded.decode())
+        self.assertEqual(22, len(encoded))
+        self.assertEqual(11, encoded.packed.nbytes)
+        self.assertEqual(encoded, EncodedSequence(b'ACGTRYSWKMBDHVN??ACGTN'))
+        self.assertEqual('ACG', str(EncodedSequence('ACG')))
+
+    def test_invalid_symbol(self):
+        self.assertRaises(ValueError, EncodedSequence, 'ACGX')
+
+    def test_same_as_records(self):
+        rng = random.Random(420)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for _ in range(50):
+                seq = ''.join(rng.choice('ACGTACGTACGTRYN?-') for _ in range(rng.randint(0, 40)))
+                encoded = EncodedSequence(seq)
+                for reading_frame in [1, 2, 3]:
+                    record = SeqRecordExpanded(seq, reading_frame=reading_frame, table=1)
+                    self.assertEqual(record.third_codon_position(),
+                                     encoded.codon_positions(reading_frame, '3').decode())
+                    self.assertEqual(record.codon_positions('12'),
+                                     encoded.codon_positions(reading_frame, '12').decode())
+                    self.assertEqual(record.translate(table=2), encoded.translate(2, reading_frame))
+                    for method in [None, 'S', 'Z', 'SZ']:
+                        self.assertEqual(record.degenerate(method=method),
+                                         encoded.degenerate(1, method or 'normal', reading_frame))
+
+    def test_warnings_and_errors(self):
+        encoded = EncodedSequence('ATGGCTA')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertEqual('MA', encoded.translate(1))
+        self.assertEqual(1, len(caught))
+        self.assertRaises(ValueError, encoded.translate, 1, 4)
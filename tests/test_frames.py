@@ -0,0 +1,41 @@
+import unittest
+import warnings
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.frames import count_stop_codons, set_reading_frames
+
+
+class TestFrames(unittest.TestCase):
+    def setUp(self):
+        # translates without stops in frame 1 only
+        self.seq = 'GGCTTGGTAATTAGGCTGAAAA'
+
+    def test_count_stop_codons(self):
+        batch = SeqRecordBatch([SeqRecordExpanded(self.seq, table=1),
+                                SeqRecordExpanded('C' + self.seq, table=1),
+                                SeqRecordExpanded(self.seq)])
+        counts = count_stop_codons(batch)
+        self.assertEqual([[0, 2, 1], [1, 0, 2], [-1, -1, -1]], counts.tolist())
+        self.assertEqual([1, 2, None], batch.infer_reading_frames())
+        self.assertEqual([1, 2, 1], batch.infer_reading_frames(table=1))
+
+    def test_update_batch(self):
+        batch = SeqRecordBatch([SeqRecordExpanded('CC' + self.seq, table=1),
+                                SeqRecordExpanded(self.seq, table=1, reading_frame=2),
+                                SeqRecordExpanded('ATG', table=1)])
+        self.assertEqual([3, 1, None], batch.infer_reading_frames(update=True))
+        self.assertEqual([3, 2, None], batch.reading_frames)
+
+    def test_set_reading_frames(self):
+        records = [CompactSeqRecordExpanded('C' + self.seq, table=1),
+                   SeqRecordExpanded(self.seq, table=1, reading_frame=3)]
+        set_reading_frames(records)
+        self.assertEqual([2, 3], [record.reading_frame for record in records])
+        set_reading_frames(records, overwrite=True)
+        self.assertEqual([2, 1], [record.reading_frame for record in records])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertNotIn('*', records[0].translate()[:-1])
+            self.assertNotIn('*', records[1].translate()[:-1])
@@ -0,0 +1,67 @@
+import unittest
+import warnings
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded import instrumentation
+from seqrecord_expanded.seqrecord import _SeqRecordMethods
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        instrumentation.reset()
+        self.seq = 'TCTGAATGGAAGACAAAGCGTCCA'
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_by_default(self):
+        SeqRecordExpanded(self.seq, reading_frame=1, table=1).translate()
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertEqual({}, instrumentation.report())
+
+    def test_counts(self):
+        calls = []
+        instrumentation.enable(callback=lambda *args: calls.append(args))
+        record = SeqRecordExpanded(self.seq, reading_frame=1, table=1,
+                                   taxonomy={'genus': 'Aus', 'species': 'bus'})
+        record.first_codon_position()
+        record.third_codon_position()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            record.degenerate()
+            record.degenerate()
+        report = instrumentation.report()
+
+        self.assertEqual({'calls': 2, 'bytes': 48}, _without_time(report['record.codon_positions']))
+        self.assertEqual(2, report['record.degenerate']['calls'])
+        self.assertEqual(1, report['degeneration.degenerate']['calls'])
+        self.assertNotIn('utils.clean_taxon_name', report)
+        self.assertNotIn('seqrecord.seq_construction', report)
+        self.assertGreaterEqual(report['record.degenerate']['seconds'],
+                                report['degeneration.degenerate']['seconds'])
+        self.assertEqual([24], [size for name, _, size in calls if name == 'record.init'])
+
+        record.seq
+        self.assertEqual(24, instrumentation.report()['seqrecord.seq_construction']['bytes'])
+
+    def test_methods_are_only_wrapped_while_enabled(self):
+        original = vars(_SeqRecordMethods)['codon_positions']
+        instrumentation.enable()
+        self.assertIsNot(original, vars(_SeqRecordMethods)['codon_positions'])
+        instrumentation.disable()
+        self.assertIs(original, vars(_SeqRecordMethods)['codon_positions'])
+
+    def test_compact_records(self):
+        instrumentation.enable()
+        record = CompactSeqRecordExpanded(self.seq.encode('ascii'), reading_frame=1, table=1)
+        record.translate()
+        instrumentation.disable()
+        record.translate()
+        report = instrumentation.report()
+        self.assertEqual({'calls': 1, 'bytes': 24}, _without_time(report['record.translate']))
+        self.assertNotIn('seqrecord.seq_construction', report)
+
+
+def _without_time(stats):
+    return dict((key, value) for key, value in stats.items() if key != 'seconds')
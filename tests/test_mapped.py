@@ -0,0 +1,79 @@
+import io
+import os
+import tempfile
+import unittest
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.mapped import map_alignment
+
+
+class TestMapAlignment(unittest.TestCase):
+    def setUp(self):
+        self.seqs = [('CP100-09', 'TCTGAATGGAAGACAAAGCGTCCA'),
+                     ('CP100-10', 'ACACGTCGACTCCGGCAAGTCCACTACCACAGGA'),
+                     ('CP100-11', 'TCT---GAATGGAAGACAAAGCGTCCA')]
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+
+    def write(self, content):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        with io.open(path, 'w') as handle:
+            handle.write(content)
+        self.paths.append(path)
+        return path
+
+    def test_fasta(self):
+        path = self.write(u''.join(u'>{0} some description\n{1}\n'.format(*i) for i in self.seqs))
+        batch = map_alignment(path, reading_frame=1, table=1,
+                              settings={'CP100-10': {'reading_frame': 2}})
+        records = [SeqRecordExpanded(seq, voucher_code=code, reading_frame=1, table=1)
+                   for code, seq in self.seqs]
+        records[1].reading_frame = 2
+
+        self.assertEqual(['CP100-09', 'CP100-10', 'CP100-11'], batch.voucher_codes)
+        self.assertEqual('TCT???GAATGGAAGACAAAGCGTCCA', batch.sequence(2))
+        self.assertEqual([i.first_and_second_codon_positions() for i in records],
+                         batch.first_and_second_codon_positions())
+        self.assertEqual([i.translate() for i in records], batch.translate())
+        self.assertEqual([i.degenerate(method='SZ') for i in records], batch.degenerate(method='SZ'))
+
+    def test_phylip(self):
+        path = self.write(u'2 24\r\nCP100-09  {0}\r\nCP100-10 {0} \r\n'.format(self.seqs[0][1]))
+        batch = map_alignment(path, format='phylip', reading_frame=1, table=1)
+        self.assertEqual(['CP100-09', 'CP100-10'], batch.voucher_codes)
+        self.assertEqual(['SEWKTKRP', 'SEWKTKRP'], batch.translate())
+
+    def test_close(self):
+        path = self.write(u'>CP100-09\n{0}\n'.format(self.seqs[0][1]))
+        with map_alignment(path, reading_frame=1) as batch:
+            source = batch._source
+            self.assertEqual(['TGTAAACC'], batch.first_codon_position())
+        self.assertTrue(source.closed)
+        self.assertEqual(0, len(batch))
+
+    def test_empty_file(self):
+        batch = map_alignment(self.write(u''))
+        self.assertEqual(0, len(batch))
+        batch.close()
+
+    def test_phylip_with_spaces(self):
+        path = self.write(u'2 6\nCP100-09 ATG AAA\nCP100-10 ATGAAA\n')
+        self.assertRaises(ValueError, map_alignment, path, format='phylip')
+        path = self.write(u'1 6\nCP100-09 ATGAA\n')
+        self.assertRaises(ValueError, map_alignment, path, format='phylip')
+
+    def test_wrapped_fasta(self):
+        path = self.write(u'>CP100-09\nTCTGAATGGAAG\nACAAAGCGTCCA\n')
+        self.assertRaises(ValueError, map_alignment, path)
+
+    def test_from_buffer(self):
+        buffer = bytearray(b'xxTCTGAATGGyyGAATGG')
+        batch = SeqRecordBatch.from_buffer(buffer, [2, 13], [9, 6], reading_frames=[1, 1])
+        self.assertEqual(['TCTGAATGG', 'GAATGG'], batch.codon_positions('123'))
+        buffer[2:5] = b'AAA'
+        self.assertEqual('AAAGAATGG', batch.sequence(0))
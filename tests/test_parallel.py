@@ -0,0 +1,50 @@
+import unittest
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.exceptions import MissingParameterError
+from seqrecord_expanded.exceptions import TranslationErrorMixedGappedSeq
+from seqrecord_expanded.parallel import process_records
+
+
+class TestProcessRecords(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            SeqRecordExpanded('TCTGAATGGAAGACAAAGCGTCCA', reading_frame=1, table=1,
+                              voucher_code='CP100-09', gene_code='wingless'),
+            ('TCTXXXGAATGG', 1, 1, 'wingless', 'CP100-10'),
+            ('ACACGTCGACTCCGGCAAGTCCACTACCACAGGA', 2, 1, 'wingless', 'CP100-11'),
+            ('TCTGAATGGAAGACAAAGCGTCC', None, 1, 'wingless', 'CP100-12'),
+        ]
+
+    def check_results(self, results):
+        self.assertEqual(['CP100-09', 'CP100-10', 'CP100-11', 'CP100-12'],
+                         [result.voucher_code for result in results])
+
+        self.assertTrue(results[0].ok)
+        self.assertEqual('TCNGARTGGAARACNAARMGNCCN', results[0].degenerated)
+        self.assertEqual('SEWKTKRP', results[0].translated)
+        self.assertEqual('TCGATGAAACAACGCC', results[0].codon_positions)
+
+        self.assertEqual(1, len(results[1].errors))
+        self.assertIsInstance(results[1].errors[0], TranslationErrorMixedGappedSeq)
+        self.assertIsNone(results[1].translated)
+        self.assertIn('Codon XXX cannot be degenerated', results[1].warnings)
+
+        self.assertEqual('HVDSGKSTTTG', results[2].translated)
+
+        self.assertIsInstance(results[3].errors[0], MissingParameterError)
+
+    def test_in_process(self):
+        results = process_records(self.records, codon_positions='12', degenerate=True,
+                                  translate=True, processes=1)
+        self.check_results(results)
+
+    def test_pool(self):
+        results = process_records(self.records, codon_positions='12', degenerate=True,
+                                  translate=True, processes=2, chunksize=1)
+        self.check_results(results)
+
+    def test_nothing_requested(self):
+        results = process_records(self.records, processes=1)
+        self.assertEqual(4, len(results))
+        self.assertIsNone(results[0].degenerated)
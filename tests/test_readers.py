@@ -0,0 +1,88 @@
+import io
+import os
+import tempfile
+import types
+import unittest
+
+from seqrecord_expanded.readers import read_records
+
+
+FASTA = u""">CP100-09 Melitaea phoebe
+TCTGAATGGAAG
+ACAAAGCGTCCA
+>CP100-10
+TCTGAATGG-AGACAAAGCGTCCA
+"""
+
+PHYLIP = u"""2 24
+CP100-09  TCTGAATGGAAGACAAAGCGTCCA
+CP100-10  TCTGAATGGAAG
+ACAAAGCGTCCA
+"""
+
+NEXUS = u"""#NEXUS
+BEGIN DATA;
+DIMENSIONS NTAX=2 NCHAR=24;
+FORMAT DATATYPE=DNA MISSING=? GAP=-;
+MATRIX
+CP100-09  TCTGAATGGAAGACAAAGCGTCCA [first]
+'CP100 10'  TCTGAATGGAAG ACAAAGCGTCCA
+;
+END;
+"""
+
+
+class TestReadRecords(unittest.TestCase):
+    def test_fasta(self):
+        records = read_records(io.StringIO(FASTA), gene_code='wingless', reading_frame=1, table=1)
+        self.assertIsInstance(records, types.GeneratorType)
+        records = list(records)
+        self.assertEqual(['CP100-09', 'CP100-10'], [i.voucher_code for i in records])
+        self.assertEqual('TCTGAATGGAAGACAAAGCGTCCA', str(records[0].seq))
+        self.assertEqual('TCTGAATGG?AGACAAAGCGTCCA', str(records[1].seq))
+        self.assertEqual('SEWKTKRP', records[0].translate())
+        self.assertEqual('wingless', records[1].gene_code)
+
+    def test_phylip(self):
+        records = list(read_records(io.StringIO(PHYLIP), format='phylip', reading_frame=1))
+        self.assertEqual(['CP100-09', 'CP100-10'], [i.voucher_code for i in records])
+        self.assertEqual(str(records[0].seq), str(records[1].seq))
+
+    def test_nexus(self):
+        records = list(read_records(io.StringIO(NEXUS), format='nexus'))
+        self.assertEqual(['CP100-09', 'CP100 10'], [i.voucher_code for i in records])
+        self.assertEqual('TCTGAATGGAAGACAAAGCGTCCA', str(records[1].seq))
+
+    def test_nexus_row_after_matrix(self):
+        nexus = NEXUS.replace('MATRIX\n', 'matrix ')
+        records = list(read_records(io.StringIO(nexus), format='nexus'))
+        self.assertEqual(['CP100-09', 'CP100 10'], [i.voucher_code for i in records])
+        self.assertEqual('TCTGAATGGAAGACAAAGCGTCCA', str(records[0].seq))
+
+        nexus = NEXUS.replace('MATRIX\n', '')
+        self.assertRaises(ValueError, list, read_records(io.StringIO(nexus), format='nexus'))
+
+    def test_interleaved_nexus(self):
+        nexus = NEXUS.replace("'CP100 10'", 'CP100-09')
+        self.assertRaises(ValueError, list, read_records(io.StringIO(nexus), format='nexus'))
+
+    def test_settings(self):
+        settings = {'CP100-10': {'reading_frame': 2}}
+        records = list(read_records(io.StringIO(FASTA), reading_frame=1, settings=settings))
+        self.assertEqual([1, 2], [i.reading_frame for i in records])
+
+        records = list(read_records(io.StringIO(FASTA), settings=lambda code: {'table': 5}))
+        self.assertEqual([5, 5], [i.table for i in records])
+
+    def test_path(self):
+        handle, path = tempfile.mkstemp(suffix='.fas')
+        os.close(handle)
+        try:
+            with io.open(path, 'w') as handle:
+                handle.write(FASTA)
+            self.assertEqual(2, len(list(read_records(path))))
+        finally:
+            os.remove(path)
+
+    def test_wrong_format(self):
+        self.assertRaises(ValueError, list, read_records(io.StringIO(FASTA), format='genbank'))
@@ -58,3 +58,35 @@ class TestDegenerate(unittest.TestCase):
                   "Papilionoidea; Nymphalidae; Satyrinae; Satyrini; Euptychiina;"
         seq_record = SeqRecordExpanded(self.seq, reading_frame=1, lineage=lineage)
         self.assertEqual(lineage, seq_record.lineage)
+
+
+class TestReadingFrame(unittest.TestCase):
+    def setUp(self):
+        self.seq = 'TCTGAATGGAAGACAAAGCGTCCA'
+
+    def test_seq_is_not_trimmed(self):
+        seq_record = SeqRecordExpanded(self.seq, reading_frame=2, table=1)
+        seq_record.degenerate()
+        seq_record.translate()
+        self.assertEqual(self.seq, str(seq_record.seq))
+        self.assertEqual('TGATGAGAAAGCTCA', seq_record.first_and_second_codon_positions())
+
+    def test_in_frame_sequence_is_kept(self):
+        seq_record = SeqRecordExpanded(self.seq, reading_frame=3)
+        self.assertEqual(self.seq[1:], seq_record.in_frame_sequence())
+        self.assertIs(seq_record.in_frame_sequence(), seq_record.in_frame_sequence())
+
+    def test_codon_positions_are_kept(self):
+        seq_record = SeqRecordExpanded(self.seq, reading_frame=3)
+        self.assertIs(seq_record.codon_positions('13'), seq_record.codon_positions('13'))
+        seq_record.reading_frame = 1
+        self.assertEqual(self.seq[0::3], seq_record.first_codon_position())
+        seq_record.reading_frame = 4
+        self.assertRaises(ValueError, seq_record.codon_positions, '1')
+
+    def test_changing_reading_frame(self):
+        seq_record = SeqRecordExpanded(self.seq, reading_frame=1, table=1)
+        self.assertEqual('SEWKTKRP', seq_record.translate())
+        seq_record.reading_frame = 2
+        self.assertEqual(self.seq[2:], seq_record.in_frame_sequence())
+        self.assertEqual('LNGRQSV', seq_record.translate())
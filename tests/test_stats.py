@@ -0,0 +1,54 @@
+import math
+import unittest
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+
+
+class TestSequenceStats(unittest.TestCase):
+    def setUp(self):
+        self.seq_record = SeqRecordExpanded('AGCATN-CRaGC', reading_frame=2)
+
+    def test_whole_sequence(self):
+        stats = self.seq_record.stats()
+        self.assertEqual(12, stats.length())
+        composition = stats.composition()
+        self.assertEqual(3, composition['A'])
+        self.assertEqual(3, composition['C'])
+        self.assertEqual(1, composition['?'])
+        self.assertEqual(1, composition['R'])
+        self.assertAlmostEqual(1 / 12., stats.missing_fraction())
+        self.assertAlmostEqual(1 / 12., stats.n_fraction())
+        self.assertAlmostEqual(1 / 12., stats.ambiguous_fraction())
+        self.assertAlmostEqual(5 / 9., stats.gc_content())
+
+    def test_codon_positions(self):
+        # in frame: CATN?CRAGC -> first positions C N R C
+        stats = self.seq_record.stats()
+        self.assertEqual(4, stats.length('1'))
+        self.assertAlmostEqual(1.0, stats.gc_content('1'))
+        self.assertAlmostEqual(0.25, stats.n_fraction('1'))
+        self.assertAlmostEqual(1 / 3., stats.missing_fraction('2'))
+        self.assertEqual(7, stats.length('12'))
+        self.assertIn('3', stats.as_dict())
+
+    def test_cached(self):
+        stats = self.seq_record.stats()
+        self.assertIs(stats, self.seq_record.stats())
+        self.seq_record.seq = 'GGG'
+        self.assertEqual(3, self.seq_record.stats().length())
+
+    def test_missing_reading_frame(self):
+        stats = SeqRecordExpanded('ACGT').stats()
+        self.assertEqual(4, stats.length())
+        self.assertTrue(math.isnan(stats.gc_content('1')))
+
+    def test_batch(self):
+        records = [self.seq_record, SeqRecordExpanded('GGGCCC', reading_frame=1),
+                   SeqRecordExpanded('ACGT')]
+        stats = SeqRecordBatch(records).stats()
+        self.assertEqual([12, 6, 4], list(stats.length()))
+        self.assertEqual([4, 2, 0], list(stats.length('1')))
+        for index, record in enumerate(records[:2]):
+            self.assertAlmostEqual(record.stats().gc_content('3'), stats.gc_content('3')[index])
+            self.assertAlmostEqual(record.stats().missing_fraction(), stats.missing_fraction()[index])
@@ -0,0 +1,74 @@
+import unittest
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded import degeneration
+from seqrecord_expanded.store import RecordStore
+
+
+class TestRecordStore(unittest.TestCase):
+    def setUp(self):
+        self.seq = 'TCTGAATGGAAGACAAAGCGTCCA'
+        self.records = [
+            SeqRecordExpanded(self.seq, voucher_code='CP100-10', reading_frame=1, table=1),
+            CompactSeqRecordExpanded(self.seq.encode('ascii'), voucher_code='CP100-11',
+                                     reading_frame=1, table=1),
+            SeqRecordExpanded(self.seq, voucher_code='CP100-12', reading_frame=1, table=5),
+            SeqRecordExpanded(self.seq, voucher_code='CP100-13', reading_frame=2, table=1),
+            SeqRecordExpanded(self.seq, voucher_code='CP100-14', reading_frame=1, table=1),
+        ]
+
+    def test_entries_are_shared(self):
+        store = RecordStore(self.records)
+        self.assertEqual(5, len(store))
+        self.assertEqual(3, len(store.entries))
+        self.assertIs(self.records[0]._data, self.records[1]._data)
+        self.assertIs(self.records[0]._data, self.records[4]._data)
+        self.assertIs(store.entries[0], store.add(SeqRecordExpanded(self.seq, reading_frame=1,
+                                                                    table=1)))
+
+    def test_results_are_computed_once(self):
+        store = RecordStore(self.records)
+        calls = []
+        original = degeneration.degenerate
+
+        def counting(*args):
+            calls.append(args)
+            return original(*args)
+
+        degeneration.degenerate = counting
+        try:
+            expected = [SeqRecordExpanded(self.seq, reading_frame=record.reading_frame,
+                                          table=record.table).degenerate()
+                        for record in self.records]
+            del calls[:]
+            self.assertEqual(expected, store.degenerate())
+            self.assertEqual(3, len(calls))
+            self.assertEqual(expected[1], self.records[1].degenerate())
+            self.assertEqual(3, len(calls))
+        finally:
+            degeneration.degenerate = original
+
+        self.assertEqual(['SEWKTKRP'] * 3, store.translate()[:3])
+        self.assertEqual([record.third_codon_position() for record in self.records],
+                         store.codon_positions('3'))
+        stats = store.stats()
+        self.assertIs(stats[0], stats[1])
+
+    def test_changed_records_stop_sharing(self):
+        store = RecordStore(self.records)
+        self.records[1].seq = 'ATGATG'
+        self.assertEqual('SEWKTKRP', self.records[0].translate())
+        self.assertEqual(['SEWKTKRP', 'MM'], store.translate()[:2])
+        self.assertEqual('SEWKTKRP', store.entries[0].translate())
+
+    def test_changed_table_stops_sharing(self):
+        first = SeqRecordExpanded('ATGAGA', reading_frame=1, table=1)
+        second = SeqRecordExpanded('ATGAGA', reading_frame=1, table=1)
+        store = RecordStore([first, second])
+        second.table = 2
+        self.assertEqual('M*', second.translate())
+        self.assertEqual(['MR', 'M*'], store.translate())
+
+
+if __name__ == '__main__':
+    unittest.main()
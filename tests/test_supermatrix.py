@@ -0,0 +1,77 @@
+import io
+import unittest
+import warnings
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.supermatrix import SupermatrixBuilder
+
+
+class TestSupermatrixBuilder(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            SeqRecordExpanded('123123123', voucher_code='CP100-09', gene_code='COI', reading_frame=1),
+            SeqRecordExpanded('3123123', voucher_code='CP100-10', gene_code='COI', reading_frame=3),
+            SeqRecordExpanded('123123', voucher_code='CP100-10', gene_code='EF1a', reading_frame=1),
+        ]
+
+    def test_whole_genes(self):
+        builder = SupermatrixBuilder()
+        builder.extend(self.records)
+        self.assertEqual([('COI', 1, 9), ('EF1a', 10, 15)], builder.partitions())
+        self.assertEqual('123123123??????', builder.row('CP100-09'))
+        self.assertEqual('3123123??123123', builder.row('CP100-10'))
+
+    def test_codon_positions(self):
+        builder = SupermatrixBuilder(codon_positions=('12', '3'))
+        builder.extend(self.records)
+        self.assertEqual([('COI_pos12', 1, 6), ('COI_pos3', 7, 9),
+                          ('EF1a_pos12', 10, 13), ('EF1a_pos3', 14, 15)], builder.partitions())
+        self.assertEqual('121212333??????', builder.row('CP100-09'))
+        self.assertEqual('1212??33?121233', builder.row('CP100-10'))
+
+    def test_append_gene(self):
+        builder = SupermatrixBuilder(codon_positions=('1', '2', '3'))
+        builder.extend(self.records[:2])
+        self.assertEqual(9, builder.nchar)
+        builder.add(SeqRecordExpanded('ACGACG', voucher_code='CP100-11', gene_code='wingless',
+                                      reading_frame=1))
+        self.assertEqual(['CP100-09', 'CP100-10', 'CP100-11'], builder.voucher_codes)
+        self.assertEqual(('wingless_pos3', 14, 15), builder.partitions()[-1])
+        self.assertEqual('?????????AACCGG', builder.row('CP100-11'))
+
+    def test_replace_warns(self):
+        builder = SupermatrixBuilder()
+        builder.add(self.records[0])
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            builder.add(self.records[0])
+        self.assertEqual(1, len(caught))
+
+    def test_write_nexus(self):
+        builder = SupermatrixBuilder()
+        builder.extend(self.records)
+        handle = io.StringIO()
+        builder.write(handle, format='nexus')
+        output = handle.getvalue()
+        self.assertIn('DIMENSIONS NTAX=2 NCHAR=15;', output)
+        self.assertIn('CP100-09  123123123??????\n', output)
+        self.assertIn('CHARSET EF1a = 10-15;', output)
+
+    def test_write_phylip_and_partitions(self):
+        builder = SupermatrixBuilder()
+        builder.extend(self.records)
+        handle = io.StringIO()
+        builder.write(handle, format='phylip')
+        self.assertEqual('2 15\nCP100-09  123123123??????\nCP100-10  3123123??123123\n',
+                         handle.getvalue())
+
+        handle = io.StringIO()
+        builder.write_partitions(handle)
+        self.assertEqual('DNA, COI = 1-9\nDNA, EF1a = 10-15\n', handle.getvalue())
+
+    def test_write_fasta(self):
+        builder = SupermatrixBuilder()
+        builder.extend(self.records)
+        handle = io.StringIO()
+        builder.write(handle, format='fasta')
+        self.assertTrue(handle.getvalue().startswith('>CP100-09\n123123123??????\n'))
@@ -0,0 +1,36 @@
+import random
+import unittest
+import warnings
+
+from Bio.Data.CodonTable import TranslationError
+from Bio.Seq import translate as biopython_translate
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.exceptions import TranslationErrorMixedGappedSeq
+from seqrecord_expanded.translation import get_codon_table, translate
+
+
+class TestCompiledCodonTable(unittest.TestCase):
+    def test_same_as_biopython(self):
+        rng = random.Random(420)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for table in [1, 2, 5, 11]:
+                for _ in range(50):
+                    seq = ''.join(rng.choice('ACGTRYSWKMBDHVNacgtn') for _ in range(90))
+                    self.assertEqual(biopython_translate(seq, table=table, gap='-'),
+                                     translate(seq, table), seq)
+
+    def test_missing_and_gaps(self):
+        self.assertEqual('SXX-', translate('TCTTA????---', 1))
+
+    def test_table_is_reused(self):
+        self.assertIs(get_codon_table(2), get_codon_table(2))
+
+    def test_mixed_gapped_codon(self):
+        self.assertRaises(TranslationError, translate, 'TCTN--', 1)
+
+    def test_invalid_codon_in_record(self):
+        seq_record = SeqRecordExpanded('TCTXXX', reading_frame=1, table=1,
+                                       voucher_code='CP100-10', gene_code='wingless')
+        self.assertRaises(TranslationErrorMixedGappedSeq, seq_record.translate)
@@ -0,0 +1,62 @@
+import random
+import unittest
+import warnings
+
+from Bio.Data.CodonTable import TranslationError
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.translation import translate
+
+
+class TestValidate(unittest.TestCase):
+    def test_report(self):
+        batch = SeqRecordBatch([
+            SeqRecordExpanded('ATGTAAA?GTGA', voucher_code='CP100-09', reading_frame=1, table=1),
+            SeqRecordExpanded('CATGTAAA?GTGA', voucher_code='CP100-10', reading_frame=2, table=1),
+            SeqRecordExpanded('ATGXGTTGA', voucher_code='CP100-11', reading_frame=1, table=1),
+            SeqRecordExpanded('ATG', voucher_code='CP100-12', table=1),
+            SeqRecordExpanded('ATGC', voucher_code='CP100-13', reading_frame=1),
+        ])
+        reports = batch.validate()
+
+        self.assertEqual([4], reports[0].internal_stops)
+        self.assertEqual([7], reports[0].mixed_gap_codons)
+        self.assertEqual(0, reports[0].remainder)
+        self.assertEqual([5], reports[1].internal_stops)
+        self.assertEqual([4], reports[2].invalid_codons)
+        self.assertEqual([], reports[2].internal_stops)
+        self.assertEqual(['reading_frame attribute should be either 1, 2 or 3.'], reports[3].errors)
+        self.assertIsNone(reports[3].remainder)
+        self.assertEqual(1, reports[4].remainder)
+        self.assertEqual(1, len(reports[4].errors))
+        self.assertEqual([False] * 5, [report.ok for report in reports])
+        self.assertEqual('CP100-09', reports[0].as_dict()['voucher_code'])
+
+        self.assertEqual([4], batch.validate(table=2)[0].internal_stops)
+        self.assertTrue(SeqRecordBatch([SeqRecordExpanded('ATGTGG', reading_frame=1, table=1)])
+                        .validate()[0].ok)
+
+    def test_same_as_translate(self):
+        rng = random.Random(420)
+        records = []
+        for index in range(200):
+            seq = ''.join(rng.choice('ACGTACGTACGTN?-RX') for _ in range(rng.randint(0, 40)))
+            records.append(SeqRecordExpanded(seq, reading_frame=rng.choice([1, 2, 3]),
+                                             table=rng.choice([1, 2, 5])))
+        reports = SeqRecordBatch(records).validate()
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            for record, report in zip(records, reports):
+                seq = record._translation_sequence()
+                try:
+                    protein = translate(seq, record.table)
+                except TranslationError:
+                    self.assertNotEqual([], report.invalid_codons, seq)
+                    continue
+                self.assertEqual([], report.invalid_codons, seq)
+                stops = [3 * i + 1 + (record.reading_frame - 1)
+                         for i, amino_acid in enumerate(protein[:-1]) if amino_acid == '*']
+                self.assertEqual(stops, report.internal_stops, seq)
+                self.assertEqual(len(seq) % 3, report.remainder)
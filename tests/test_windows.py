@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+
+from seqrecord_expanded import CompactSeqRecordExpanded, SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.exceptions import MissingParameterError
+from seqrecord_expanded.windows import codon_position_view, sliding_windows, window_counts
+
+
+def _strings(windows):
+    return [row.tobytes().decode('ascii') for row in windows]
+
+
+class TestWindows(unittest.TestCase):
+    def setUp(self):
+        self.seq = 'ACGTGCATGCCGGTA'
+
+    def test_codon_position_view(self):
+        seq = np.frombuffer(self.seq.encode('ascii'), dtype=np.uint8)
+        for positions in ['1', '2', '3', '12', '13', '23', '123']:
+            seq_record = SeqRecordExpanded(self.seq, reading_frame=1)
+            view = codon_position_view(seq, positions)
+            self.assertEqual(seq_record.codon_positions(positions), view.tobytes().decode('ascii'))
+        self.assertTrue(np.shares_memory(seq, codon_position_view(seq, '3')))
+        self.assertRaises(ValueError, codon_position_view, seq, '4')
+
+    def test_sliding_windows(self):
+        array = codon_position_view(self.seq)
+        self.assertEqual(['ACGT', 'GCAT', 'GCCG'], _strings(sliding_windows(array, 4)))
+        self.assertEqual(['ACGTG', 'GTGCA', 'GCATG', 'ATGCC', 'GCCGG', 'CGGTA'],
+                         _strings(sliding_windows(array, 5, 2)))
+        self.assertEqual((0, 20), sliding_windows(array, 20).shape)
+        self.assertRaises(ValueError, sliding_windows, array, 0)
+        self.assertRaises(ValueError, sliding_windows, array, 3, 0)
+
+    def test_window_counts(self):
+        array = codon_position_view(self.seq.lower())
+        for size, step in [(4, None), (5, 2), (1, 1), (20, None)]:
+            expected = [sum(base in 'gc' for base in window)
+                        for window in _strings(sliding_windows(array, size, step))]
+            self.assertEqual(expected, window_counts(array, 'GC', size, step).tolist())
+
+    def test_record(self):
+        seq_record = CompactSeqRecordExpanded(self.seq.encode('ascii'), reading_frame=2)
+        windows = seq_record.windows(2, positions='3')
+        self.assertEqual(['GT', 'CT'], _strings(windows))
+        self.assertFalse(windows.flags.writeable)
+        self.assertEqual(['GTC', 'TCA'], _strings(seq_record.windows(3, 1, '12')[:2]))
+
+        seq_record.reading_frame = None
+        self.assertRaises(MissingParameterError, seq_record.windows, 2)
+
+    def test_batch(self):
+        records = [SeqRecordExpanded(self.seq, reading_frame=frame) for frame in [1, 2, 3]]
+        batch = SeqRecordBatch(records)
+        for positions in ['1', '23', '123']:
+            expected = [_strings(record.windows(2, 1, positions)) for record in records]
+            windows = list(batch.windows(2, 1, positions))
+            self.assertEqual(expected, [_strings(i) for i in windows])
+        self.assertTrue(np.shares_memory(batch.buffer, next(batch.windows(3, positions='2'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
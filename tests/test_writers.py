@@ -0,0 +1,119 @@
+import io
+import os
+import tempfile
+import unittest
+
+from seqrecord_expanded import SeqRecordExpanded
+from seqrecord_expanded.batch import SeqRecordBatch
+from seqrecord_expanded.readers import read_records
+from seqrecord_expanded.writers import FastaWriter, get_writer, NexusWriter, PhylipWriter, \
+    TntWriter
+
+
+class _Unseekable(object):
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, text):
+        self.chunks.append(text)
+
+
+class TestWriters(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            SeqRecordExpanded('ACGTACGT', voucher_code='CP100-09', reading_frame=1, table=1),
+            SeqRecordExpanded('ACG-AC', voucher_code='CP100-10', reading_frame=1, table=1),
+        ]
+
+    def test_phylip_with_dimensions(self):
+        handle = io.StringIO()
+        with PhylipWriter(handle, ntax=2, nchar=8) as writer:
+            writer.write_records(self.records)
+        self.assertEqual('2 8\nCP100-09 ACGTACGT\nCP100-10 ACG?AC??\n', handle.getvalue())
+
+    def test_dimensions_are_filled_in_at_the_end(self):
+        handle = io.StringIO()
+        with NexusWriter(handle) as writer:
+            writer.write('CP100-09', 'ACGTAC')
+            writer.write('CP100 10', 'ACG')
+        output = handle.getvalue()
+        self.assertIn('DIMENSIONS NTAX=2            NCHAR=6           ;\n', output)
+        self.assertIn("'CP100 10' ACG???\n", output)
+        self.assertTrue(output.endswith(';\nEND;\n'))
+
+    def test_dimensions_in_real_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'matrix.tnt')
+        with io.open(path, 'w') as handle:
+            with TntWriter(handle) as writer:
+                writer.write_records(self.records, lambda record: record.translate())
+        with io.open(path) as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(['nstates dna;', 'xread', '2            2', 'CP100-09 TY',
+                          'CP100-10 TX', ';', 'proc/;'], [line.rstrip() for line in lines])
+
+    def test_unseekable_handle_needs_dimensions(self):
+        writer = PhylipWriter(_Unseekable())
+        self.assertRaises(ValueError, writer.write, 'CP100-09', 'ACGT')
+
+        handle = _Unseekable()
+        with FastaWriter(handle, line_width=3) as writer:
+            writer.write('CP100-09', 'ACGTACGT')
+        self.assertEqual('>CP100-09\nACG\nTAC\nGT\n', ''.join(handle.chunks))
+
+    def test_gaps_are_written_as_missing(self):
+        batch = SeqRecordBatch.from_buffer(b'ACG-AC', [0], [6], voucher_codes=['CP100-10'])
+        for write in (lambda writer: writer.write('CP100-10', 'ACG-AC'),
+                      lambda writer: writer.write_batch(batch),
+                      lambda writer: writer.write_interleaved(['CP100-10'], ['ACG-AC'])):
+            handle = io.StringIO()
+            with PhylipWriter(handle) as writer:
+                write(writer)
+            self.assertIn('CP100-10 ACG?AC\n', handle.getvalue())
+
+    def test_longer_rows_raise(self):
+        writer = PhylipWriter(io.StringIO(), ntax=1, nchar=2)
+        self.assertRaises(ValueError, writer.write, 'CP100-09', 'ACGT')
+
+    def test_interleaved_batch(self):
+        batch = SeqRecordBatch(self.records)
+        handle = io.StringIO()
+        with get_writer(handle, 'phylip') as writer:
+            writer.write_batch(batch, interleave=True, width=5)
+        self.assertEqual('2 8\nCP100-09 ACGTA\nCP100-10 ACG?A\n\n'
+                         '         CGT\n         C??\n', handle.getvalue())
+
+        handle = io.StringIO()
+        with get_writer(handle, 'nexus', datatype='PROTEIN') as writer:
+            writer.write_interleaved(['CP100-09', 'CP100-10'], ['TY', 'T'], width=1)
+        output = handle.getvalue()
+        self.assertIn('FORMAT INTERLEAVE=YES DATATYPE=PROTEIN', output)
+        self.assertIn('CP100-10 T\n\nCP100-09 Y\nCP100-10 ?\n;', output)
+
+        handle = io.StringIO()
+        with get_writer(handle, 'tnt') as writer:
+            writer.write_batch(batch, interleave=True, width=4)
+        self.assertIn('8 2\n&[dna]\nCP100-09 ACGT\nCP100-10 ACG?\n&[dna]\n', handle.getvalue())
+
+    def test_fasta_cannot_be_interleaved(self):
+        writer = FastaWriter(io.StringIO())
+        self.assertRaises(ValueError, writer.write_interleaved, ['CP100-09'], ['ACGT'])
+        self.assertRaises(ValueError, get_writer, io.StringIO(), 'genbank')
+
+    def test_spaces_in_names(self):
+        handle = io.StringIO()
+        with PhylipWriter(handle) as writer:
+            writer.write('a b', 'ATGAAA')
+        records = list(read_records(io.StringIO(handle.getvalue()), format='phylip'))
+        self.assertEqual(['a_b'], [record.voucher_code for record in records])
+        self.assertEqual(['ATGAAA'], [str(record.seq) for record in records])
+
+        handle = io.StringIO()
+        with TntWriter(handle, ntax=1, nchar=6) as writer:
+            writer.write('a\tb', 'ATGAAA')
+        self.assertIn('\na_b ATGAAA\n', handle.getvalue())
+
+    def test_small_buffer(self):
+        handle = io.StringIO()
+        with FastaWriter(handle, buffer_size=1) as writer:
+            writer.write_records(self.records, lambda record: record.first_codon_position())
+        self.assertEqual('>CP100-09\nATG\n>CP100-10\nA?\n', handle.getvalue())